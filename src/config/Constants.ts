@@ -94,6 +94,15 @@ export const DEFAULT_MUSIC_VOLUME = 0.6;
 /** SFX volume (0-1) */
 export const DEFAULT_SFX_VOLUME = 0.8;
 
+/**
+ * Load sound effects as a single audio sprite (one fetch, one decode).
+ * Enable after packing assets/audio/sfx with tools/pack-audio-sprite.py.
+ */
+export const USE_SFX_SPRITE = false;
+
+/** Cache key of the SFX audio sprite; its markers use the regular sfx_* keys */
+export const SFX_SPRITE_KEY = 'sfx-sprite';
+
 // =============================================================================
 // DEPTH / Z-INDEX
 // =============================================================================
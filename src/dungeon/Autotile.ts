@@ -0,0 +1,117 @@
+/**
+ * @file Autotile.ts
+ * @description 47-tile blob autotiling for walls and floor shadows.
+ * The tileset frames and the neighbour-mask lookup table are generated by
+ * tools/generate-tileset.py / generate-zone-tilesets.py (tools/autotile.py)
+ * into the tileset PNGs and assets/data/autotile.json.
+ */
+
+/**
+ * autotile.json contents.
+ */
+interface AutotileData {
+  /** Direction -> bit in a neighbour mask */
+  neighbourBits: Record<string, number>;
+  /** First frame of the wall blob set */
+  wallStart: number;
+  /** First frame of the floor shadow blob set */
+  shadowStart: number;
+  /** Blob index of a fully surrounded tile */
+  solid: number;
+  /** Reduced mask per blob index */
+  masks: number[];
+  /** Raw 8-bit mask -> blob index */
+  lut: number[];
+}
+
+/** Neighbour offsets in bit order (N, NE, E, SE, S, SW, W, NW) */
+const NEIGHBOUR_OFFSETS: ReadonlyArray<readonly [number, number]> = [
+  [0, -1], [1, -1], [1, 0], [1, 1], [0, 1], [-1, 1], [-1, 0], [-1, -1],
+];
+
+/** Tile types drawn as walls (wall, wall-mounted torch) */
+const WALL_TILES = new Set([1, 8]);
+
+/**
+ * Blob autotile lookups.
+ *
+ * A tile's frame is one table lookup on the mask of which of its eight
+ * neighbours share its terrain; tiles outside the room count as walls.
+ *
+ * @example
+ * ```ts
+ * const frame = Autotile.wallFrame(Autotile.neighbourMask(room.tiles, x, y, true));
+ * ```
+ */
+export class Autotile {
+  private static data: AutotileData | null = null;
+
+  /**
+   * Load the lookup table from JSON data.
+   */
+  public static loadFromJSON(data: AutotileData): void {
+    if (data.lut?.length !== 256) {
+      console.error('Invalid autotile table');
+      return;
+    }
+    this.data = data;
+    console.info(`Loaded autotile table (${data.masks.length} blob tiles)`);
+  }
+
+  public static isLoaded(): boolean {
+    return this.data !== null;
+  }
+
+  /**
+   * Whether a tile type renders as wall.
+   */
+  public static isWallTile(tileId: number): boolean {
+    return WALL_TILES.has(tileId);
+  }
+
+  /**
+   * 8-bit mask of neighbours with the same terrain (wall vs. not wall).
+   * @param wall - Terrain of the tile at (x, y)
+   */
+  public static neighbourMask(tiles: number[][], x: number, y: number, wall: boolean): number {
+    let mask = 0;
+    for (let i = 0; i < NEIGHBOUR_OFFSETS.length; i++) {
+      const [dx, dy] = NEIGHBOUR_OFFSETS[i];
+      const row = tiles[y + dy];
+      const tile = row?.[x + dx];
+      const isWall = tile === undefined || WALL_TILES.has(tile);
+      if (isWall === wall) {
+        mask |= 1 << i;
+      }
+    }
+    return mask;
+  }
+
+  /**
+   * Whether a mask is a fully surrounded tile (no edges to draw).
+   */
+  public static isSolid(mask: number): boolean {
+    return this.data!.lut[mask] === this.data!.solid;
+  }
+
+  /**
+   * Wall frame for a wall tile's neighbour mask.
+   */
+  public static wallFrame(mask: number): number {
+    return this.data!.wallStart + this.data!.lut[mask];
+  }
+
+  /**
+   * Shadow overlay frame for a floor tile's neighbour mask.
+   */
+  public static shadowFrame(mask: number): number {
+    return this.data!.shadowStart + this.data!.lut[mask];
+  }
+
+  /**
+   * Clear the loaded table.
+   */
+  public static clear(): void {
+    this.data = null;
+  }
+}
@@ -0,0 +1,157 @@
+/**
+ * @file FlowFieldRegistry.ts
+ * @description Precomputed navigation flow fields for room templates.
+ * Fields are baked offline by tools/bake-flow-fields.py into
+ * assets/data/flowfields.json, on the standard 11x9 room GameScene draws
+ * for each template (tile 0,0 is the room container's top-left).
+ */
+
+/** Neighbour offsets indexed by flow value (same order as the baking tool) */
+export const FLOW_DIRECTIONS: ReadonlyArray<readonly [number, number]> = [
+  [0, -1], [1, -1], [1, 0], [1, 1], [0, 1], [-1, 1], [-1, 0], [-1, -1],
+];
+
+/** Flow value for the goal tile itself */
+export const FLOW_AT_GOAL = 8;
+
+/** Flow value for blocked or unreachable tiles */
+export const FLOW_NONE = 255;
+
+/**
+ * Room entry in flowfields.json.
+ */
+interface FlowFieldRoomData {
+  width: number;
+  height: number;
+  /** Door direction -> goal index */
+  doors: Record<string, number>;
+  /** Coarse cell [cy][cx] -> goal index (-1 if the cell has no walkable tile) */
+  cellGoals: number[][];
+  /** Base64 uint8 grids, goal-major then row-major */
+  flow: string;
+  distance: string;
+}
+
+/**
+ * Decoded flow fields for one room.
+ */
+interface RoomFlowFields {
+  width: number;
+  height: number;
+  doors: Record<string, number>;
+  cellGoals: number[][];
+  flow: Uint8Array;
+  distance: Uint8Array;
+}
+
+/**
+ * Registry of baked flow fields, keyed by room template ID.
+ *
+ * Lookups are O(1): pick a goal (a door, or the coarse cell containing the
+ * target) and read the next step for the current tile.
+ *
+ * @example
+ * ```ts
+ * const goal = FlowFieldRegistry.getCellGoal('normal_medium_pillars', playerTileX, playerTileY);
+ * const step = FlowFieldRegistry.getStep('normal_medium_pillars', goal, enemyTileX, enemyTileY);
+ * if (step) body.setVelocity(step[0] * speed, step[1] * speed);
+ * ```
+ */
+export class FlowFieldRegistry {
+  private static rooms: Map<string, RoomFlowFields> = new Map();
+  private static coarseCell: number = 3;
+
+  /**
+   * Load flow fields from the baked JSON.
+   */
+  public static loadFromJSON(data: { coarseCell: number; rooms: Record<string, FlowFieldRoomData> }): void {
+    this.clear();
+    this.coarseCell = data.coarseCell;
+
+    for (const [roomId, room] of Object.entries(data.rooms)) {
+      this.rooms.set(roomId, {
+        width: room.width,
+        height: room.height,
+        doors: room.doors,
+        cellGoals: room.cellGoals,
+        flow: this.decode(room.flow),
+        distance: this.decode(room.distance),
+      });
+    }
+
+    console.info(`Loaded flow fields for ${this.rooms.size} rooms`);
+  }
+
+  /**
+   * Check whether a room has baked flow fields.
+   */
+  public static has(roomId: string): boolean {
+    return this.rooms.has(roomId);
+  }
+
+  /**
+   * Goal index for the coarse cell containing a tile, or -1.
+   */
+  public static getCellGoal(roomId: string, tileX: number, tileY: number): number {
+    const room = this.rooms.get(roomId);
+    if (!room || !this.inBounds(room, tileX, tileY)) return -1;
+
+    const row = room.cellGoals[Math.floor(tileY / this.coarseCell)];
+    return row?.[Math.floor(tileX / this.coarseCell)] ?? -1;
+  }
+
+  /**
+   * Goal index for a door direction ('north', 'east', ...), or -1.
+   */
+  public static getDoorGoal(roomId: string, direction: string): number {
+    return this.rooms.get(roomId)?.doors[direction] ?? -1;
+  }
+
+  /**
+   * Raw flow value at a tile (index into FLOW_DIRECTIONS, FLOW_AT_GOAL or FLOW_NONE).
+   */
+  public static getFlow(roomId: string, goal: number, tileX: number, tileY: number): number {
+    const room = this.rooms.get(roomId);
+    if (!room || goal < 0 || !this.inBounds(room, tileX, tileY)) return FLOW_NONE;
+
+    return room.flow[(goal * room.height + tileY) * room.width + tileX];
+  }
+
+  /**
+   * Next step (dx, dy in tiles) toward a goal, or null at the goal / when unreachable.
+   */
+  public static getStep(roomId: string, goal: number, tileX: number, tileY: number): readonly [number, number] | null {
+    const flow = this.getFlow(roomId, goal, tileX, tileY);
+    return flow < FLOW_AT_GOAL ? FLOW_DIRECTIONS[flow] : null;
+  }
+
+  /**
+   * Path cost from a tile to a goal (orthogonal step = 2, diagonal = 3); 255 if unreachable.
+   */
+  public static getDistance(roomId: string, goal: number, tileX: number, tileY: number): number {
+    const room = this.rooms.get(roomId);
+    if (!room || goal < 0 || !this.inBounds(room, tileX, tileY)) return 255;
+
+    return room.distance[(goal * room.height + tileY) * room.width + tileX];
+  }
+
+  /**
+   * Clear all loaded fields.
+   */
+  public static clear(): void {
+    this.rooms.clear();
+  }
+
+  private static inBounds(room: RoomFlowFields, tileX: number, tileY: number): boolean {
+    return tileX >= 0 && tileY >= 0 && tileX < room.width && tileY < room.height;
+  }
+
+  private static decode(base64: string): Uint8Array {
+    const binary = atob(base64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+  }
+}
@@ -0,0 +1,166 @@
+/**
+ * @file LayoutBank.ts
+ * @description Pre-validated dungeon floor layouts.
+ * Layouts are generated offline by tools/generate-layout-bank.py into
+ * assets/data/layout-bank.bin (records) and layout-bank.json (index).
+ */
+
+import { Room, RoomType, DoorDirection } from './Room';
+import { RoomComponentRegistry } from './RoomComponentRegistry';
+import type { DungeonFloor } from './DungeonGenerator';
+
+/**
+ * Index written next to the binary bank.
+ */
+interface LayoutBankIndex {
+  version: number;
+  recordSize: number;
+  headerSize: number;
+  maxRooms: number;
+  /** Template ID per template index */
+  templates: string[];
+  /** Room type per type index */
+  roomTypes: string[];
+  /** Door direction -> bit in a room's door mask */
+  doorBits: Record<string, number>;
+  /** Floor number -> record range */
+  floors: Record<string, { offset: number; count: number }>;
+}
+
+/** Size of one room entry in a record (gridX, gridY, template, type/doors) */
+const ROOM_ENTRY_SIZE = 4;
+
+/** Size of the record header (seed, room count, boss index, boss distance, dead ends) */
+const RECORD_HEADER_SIZE = 8;
+
+/**
+ * Bank of dungeon floors that already passed connectivity checks
+ * (every room reachable, boss far enough from the start, few dead ends).
+ *
+ * Picking a floor is a record lookup; no generation or template search
+ * happens at load time.
+ *
+ * @example
+ * ```ts
+ * if (LayoutBank.count(floorNumber) > 0) {
+ *   const floor = LayoutBank.getFloor(floorNumber, seed % LayoutBank.count(floorNumber));
+ * }
+ * ```
+ */
+export class LayoutBank {
+  private static index: LayoutBankIndex | null = null;
+  private static view: DataView | null = null;
+
+  /**
+   * Load the bank from its JSON index and binary records.
+   */
+  public static load(index: LayoutBankIndex, data: ArrayBuffer): void {
+    this.clear();
+
+    const view = new DataView(data);
+    const magic = String.fromCharCode(...new Uint8Array(data, 0, 4));
+    if (magic !== 'DLB1') {
+      console.error('Invalid layout bank header:', magic);
+      return;
+    }
+
+    this.index = index;
+    this.view = view;
+
+    console.info(`Loaded ${view.getUint32(4, true)} dungeon layouts`);
+  }
+
+  /**
+   * Number of layouts for a floor.
+   */
+  public static count(floorNumber: number): number {
+    return this.index?.floors[floorNumber]?.count ?? 0;
+  }
+
+  /**
+   * Seed the layout was generated from (matches SeededRandom / DungeonGenerator).
+   */
+  public static getSeed(floorNumber: number, layoutIndex: number): number {
+    return this.view!.getUint32(this.recordOffset(floorNumber, layoutIndex), true);
+  }
+
+  /**
+   * Build the rooms of a layout, with template IDs and connected doors.
+   */
+  public static getFloor(floorNumber: number, layoutIndex: number): DungeonFloor {
+    const index = this.index!;
+    const view = this.view!;
+    const offset = this.recordOffset(floorNumber, layoutIndex);
+
+    const seed = view.getUint32(offset, true);
+    const roomCount = view.getUint8(offset + 4);
+    const bossIndex = view.getUint8(offset + 5);
+
+    // Decode room entries
+    const entries: Array<{ x: number; y: number; templateId: string; type: RoomType; doors: number }> = [];
+    for (let i = 0; i < roomCount; i++) {
+      const entry = offset + RECORD_HEADER_SIZE + i * ROOM_ENTRY_SIZE;
+      const flags = view.getUint8(entry + 3);
+      entries.push({
+        x: view.getInt8(entry),
+        y: view.getInt8(entry + 1),
+        templateId: index.templates[view.getUint8(entry + 2)],
+        type: index.roomTypes[flags >> 4] as RoomType,
+        doors: flags & 0x0f,
+      });
+    }
+
+    // Create rooms
+    const rooms = entries.map((entry, i) => {
+      const template = RoomComponentRegistry.get(entry.templateId);
+      const room = new Room({
+        id: `room_${i}`,
+        type: entry.type,
+        width: template?.width ?? 11,
+        height: template?.height ?? 9,
+        templateId: entry.templateId,
+      });
+      room.setGridPosition(entry.x, entry.y);
+      return room;
+    });
+
+    // Connect doors
+    const offsets: Record<string, [number, number]> = {
+      [DoorDirection.NORTH]: [0, -1],
+      [DoorDirection.SOUTH]: [0, 1],
+      [DoorDirection.EAST]: [1, 0],
+      [DoorDirection.WEST]: [-1, 0],
+    };
+    rooms.forEach((room, i) => {
+      for (const [direction, bit] of Object.entries(index.doorBits)) {
+        if (!(entries[i].doors & bit)) continue;
+
+        const [dx, dy] = offsets[direction];
+        const target = rooms.find((r) => r.gridX === room.gridX + dx && r.gridY === room.gridY + dy);
+        room.addDoor(direction as DoorDirection, target?.id ?? null);
+      }
+    });
+
+    return {
+      rooms,
+      startRoom: rooms[0],
+      bossRoom: rooms[bossIndex],
+      seed,
+      floorNumber,
+    };
+  }
+
+  /**
+   * Clear the loaded bank.
+   */
+  public static clear(): void {
+    this.index = null;
+    this.view = null;
+  }
+
+  private static recordOffset(floorNumber: number, layoutIndex: number): number {
+    const index = this.index!;
+    const floor = index.floors[floorNumber];
+    return index.headerSize + (floor.offset + layoutIndex) * index.recordSize;
+  }
+}
@@ -35,6 +35,17 @@ export interface SpawnPoint {
   weight?: number;
 }
 
+/**
+ * Tile grid packed by tools/pack-room-tiles.py (row-major, base64).
+ * - nibble: two tiles per byte, high nibble first
+ * - rle: one byte per run, high nibble = tile, low nibble = run length - 1
+ * - raw: one byte per tile
+ */
+export interface PackedTiles {
+  codec: 'nibble' | 'rle' | 'raw';
+  data: string;
+}
+
 /**
  * Room component data structure.
  * This is the format for room JSON files in assets/data/rooms/
@@ -62,6 +73,9 @@ export interface RoomComponentData {
   /** Tile data (2D array of TileType values) */
   tiles: number[][];
   
+  /** Packed tile data (index.packed.json); unpacked into `tiles` on load */
+  tilesPacked?: PackedTiles;
+  
   /** Spawn points */
   spawns: SpawnPoint[];
   
@@ -125,6 +139,36 @@ export function getOppositeDirection(dir: DoorDirection): DoorDirection {
   }
 }
 
+/**
+ * Decode a packed tile grid into rows of TileType values.
+ */
+export function unpackTiles(packed: PackedTiles, width: number, height: number): number[][] {
+  const binary = atob(packed.data);
+  const count = width * height;
+  const cells = new Uint8Array(count);
+  
+  let cell = 0;
+  for (let i = 0; i < binary.length && cell < count; i++) {
+    const byte = binary.charCodeAt(i);
+    if (packed.codec === 'raw') {
+      cells[cell++] = byte;
+    } else if (packed.codec === 'nibble') {
+      cells[cell++] = byte >> 4;
+      if (cell < count) cells[cell++] = byte & 0x0f;
+    } else {
+      const end = Math.min(cell + (byte & 0x0f) + 1, count);
+      cells.fill(byte >> 4, cell, end);
+      cell = end;
+    }
+  }
+  
+  const tiles: number[][] = [];
+  for (let y = 0; y < height; y++) {
+    tiles.push(Array.from(cells.subarray(y * width, (y + 1) * width)));
+  }
+  return tiles;
+}
+
 /**
  * Check if a room component satisfies constraints.
  */
@@ -8,7 +8,8 @@ import {
   RoomComponentData, 
   RoomConstraints, 
   roomMatchesConstraints,
-  getOppositeDirection 
+  getOppositeDirection,
+  unpackTiles
 } from './RoomComponent';
 import { RoomType, DoorDirection } from './Room';
 import { SeededRandom } from '@utils/Random';
@@ -24,7 +25,7 @@ import { SeededRandom } from '@utils/Random';
  * @example
  * ```ts
  * // In PreloadScene
- * this.load.json('rooms', 'assets/data/rooms/index.json');
+ * this.load.json('rooms', 'assets/data/rooms/index.packed.json');
  * 
  * // After loading
  * const roomData = this.cache.json.get('rooms');
@@ -80,11 +81,17 @@ export class RoomComponentRegistry {
   
   /**
    * Load room components from JSON data.
+   * Packed grids are unpacked in place, so other readers of the same
+   * JSON cache entry see plain `tiles` arrays.
    */
   public static loadFromJSON(data: { rooms: RoomComponentData[] }): void {
     this.clear();
     
     for (const room of data.rooms) {
+      if (!room.tiles && room.tilesPacked) {
+        room.tiles = unpackTiles(room.tilesPacked, room.width, room.height);
+        delete room.tilesPacked;
+      }
       this.register(room);
     }
     
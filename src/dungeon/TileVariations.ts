@@ -0,0 +1,101 @@
+/**
+ * @file TileVariations.ts
+ * @description Precomputed floor/wall variation frames.
+ * Baked by tools/bake-tile-variations.py (an exact port of GameScene's
+ * position hashes) into assets/data/tile-variations.json.
+ */
+
+/**
+ * tile-variations.json contents.
+ */
+interface TileVariationData {
+  width: number;
+  height: number;
+  /** Base64 uint8 floor frames, row-major */
+  floor: string;
+  /** Base64 uint8 wall frames, row-major */
+  wall: string;
+  /** Template ID -> base64 uint8 frame per tile */
+  rooms: Record<string, string>;
+}
+
+/**
+ * Position -> tile frame lookups.
+ *
+ * Frames depend only on the tile position, so the table serves every room
+ * that fits inside it; callers fall back to hashing outside it.
+ *
+ * @example
+ * ```ts
+ * const frame = TileVariations.floor(x, y) ?? this.hashFloorFrame(x, y);
+ * ```
+ */
+export class TileVariations {
+  private static width = 0;
+  private static height = 0;
+  private static floorFrames: Uint8Array | null = null;
+  private static wallFrames: Uint8Array | null = null;
+  private static roomFrames: Map<string, Uint8Array> = new Map();
+
+  /**
+   * Load the baked tables from JSON data.
+   */
+  public static loadFromJSON(data: TileVariationData): void {
+    this.clear();
+
+    this.width = data.width;
+    this.height = data.height;
+    this.floorFrames = this.decode(data.floor);
+    this.wallFrames = this.decode(data.wall);
+    for (const [roomId, frames] of Object.entries(data.rooms)) {
+      this.roomFrames.set(roomId, this.decode(frames));
+    }
+
+    console.info(`Loaded ${this.width}x${this.height} tile variation table`);
+  }
+
+  /**
+   * Floor frame (0-15) at a position, or undefined outside the table.
+   */
+  public static floor(gridX: number, gridY: number): number | undefined {
+    return this.inBounds(gridX, gridY) ? this.floorFrames![gridY * this.width + gridX] : undefined;
+  }
+
+  /**
+   * Wall frame (16-23) at a position, or undefined outside the table.
+   */
+  public static wall(gridX: number, gridY: number): number | undefined {
+    return this.inBounds(gridX, gridY) ? this.wallFrames![gridY * this.width + gridX] : undefined;
+  }
+
+  /**
+   * Frame of every tile of a room template (row-major), if baked.
+   */
+  public static getRoomFrames(roomId: string): Uint8Array | undefined {
+    return this.roomFrames.get(roomId);
+  }
+
+  /**
+   * Clear all loaded tables.
+   */
+  public static clear(): void {
+    this.width = 0;
+    this.height = 0;
+    this.floorFrames = null;
+    this.wallFrames = null;
+    this.roomFrames.clear();
+  }
+
+  private static inBounds(gridX: number, gridY: number): boolean {
+    return this.floorFrames !== null && gridX >= 0 && gridY >= 0 && gridX < this.width && gridY < this.height;
+  }
+
+  private static decode(base64: string): Uint8Array {
+    const binary = atob(base64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+  }
+}
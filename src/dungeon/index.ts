@@ -16,13 +16,19 @@ export type { RoomTemplate } from './RoomTemplates';
 export { 
   getOppositeDirection,
   roomMatchesConstraints,
+  unpackTiles,
 } from './RoomComponent';
 export type { 
   RoomComponentData, 
   RoomConstraints, 
   DoorSlot, 
-  SpawnPoint 
+  SpawnPoint,
+  PackedTiles
 } from './RoomComponent';
 
 export { RoomComponentRegistry } from './RoomComponentRegistry';
+export { FlowFieldRegistry, FLOW_DIRECTIONS, FLOW_AT_GOAL, FLOW_NONE } from './FlowFieldRegistry';
+export { LayoutBank } from './LayoutBank';
+export { Autotile } from './Autotile';
+export { TileVariations } from './TileVariations';
 export { LiveDungeonManager } from './LiveDungeonManager';
@@ -6,8 +6,10 @@
 import Phaser from 'phaser';
 import { Entity, EntityConfig } from './Entity';
 import { EventManager } from '@managers/EventManager';
-import { EVENTS } from '@config/Constants';
+import { EVENTS, TILE_SIZE } from '@config/Constants';
 import { SPRITES } from '@utils/PlaceholderSprites';
+import { SpriteVariants } from '@utils/SpriteVariants';
+import { FlowFieldRegistry } from '@dungeon/FlowFieldRegistry';
 
 /**
  * Enemy behavior types for AI.
@@ -93,6 +95,11 @@ export abstract class Enemy extends Entity {
   /** Reference to target (usually player) */
   protected target: Entity | null = null;
   
+  /** Room template the enemy navigates in (baked flow fields), and its world origin */
+  protected navRoomId: string | null = null;
+  protected navOriginX: number = 0;
+  protected navOriginY: number = 0;
+  
   constructor(scene: Phaser.Scene, config: EnemyConfig) {
     // Resolve texture from enemy type or use provided texture
     const texture = config.texture ?? 
@@ -191,6 +198,8 @@ export abstract class Enemy extends Entity {
   
   /**
    * Move toward the target.
+   * Follows the room's baked flow field when one is set, so enemies path
+   * around interior walls; otherwise steers straight at the target.
    */
   protected moveTowardTarget(): void {
     if (!this.target || !this.sprite?.body) return;
@@ -198,10 +207,10 @@ export abstract class Enemy extends Entity {
     const targetPos = this.target.getPosition();
     const myPos = this.getPosition();
     
-    const direction = new Phaser.Math.Vector2(
-      targetPos.x - myPos.x,
-      targetPos.y - myPos.y
-    ).normalize();
+    const step = this.getFlowStep(targetPos.x, targetPos.y, myPos.x, myPos.y);
+    const direction = step
+      ? new Phaser.Math.Vector2(step[0], step[1]).normalize()
+      : new Phaser.Math.Vector2(targetPos.x - myPos.x, targetPos.y - myPos.y).normalize();
     
     this.sprite.setVelocity(
       direction.x * this.speed,
@@ -209,6 +218,37 @@ export abstract class Enemy extends Entity {
     );
   }
   
+  /**
+   * Next flow-field step toward a world position, or null to steer directly
+   * (no field for this room, or already in the target's coarse cell).
+   */
+  protected getFlowStep(targetX: number, targetY: number, x: number, y: number): readonly [number, number] | null {
+    if (!this.navRoomId) return null;
+    
+    const tileX = Math.floor((x - this.navOriginX) / TILE_SIZE);
+    const tileY = Math.floor((y - this.navOriginY) / TILE_SIZE);
+    const goal = FlowFieldRegistry.getCellGoal(
+      this.navRoomId,
+      Math.floor((targetX - this.navOriginX) / TILE_SIZE),
+      Math.floor((targetY - this.navOriginY) / TILE_SIZE)
+    );
+    if (goal < 0 || goal === FlowFieldRegistry.getCellGoal(this.navRoomId, tileX, tileY)) return null;
+    
+    return FlowFieldRegistry.getStep(this.navRoomId, goal, tileX, tileY);
+  }
+  
+  /**
+   * Use a room template's baked flow fields for navigation.
+   * Called by GameScene.addEnemy with the standard room's container position.
+   * @param originX - World x of the room's top-left tile
+   * @param originY - World y of the room's top-left tile
+   */
+  public setNavigationRoom(roomId: string, originX: number, originY: number): void {
+    this.navRoomId = FlowFieldRegistry.has(roomId) ? roomId : null;
+    this.navOriginX = originX;
+    this.navOriginY = originY;
+  }
+  
   /**
    * Attempt to attack if off cooldown.
    */
@@ -273,6 +313,16 @@ export abstract class Enemy extends Entity {
    * Flash white on hit.
    */
   protected flashWhite(): void {
+    // Swap to the baked flash frame when the sprite has one
+    if (SpriteVariants.setVariant(this.sprite, 'flash')) {
+      this.scene.time.delayedCall(100, () => {
+        if (this.sprite.active) {
+          SpriteVariants.setVariant(this.sprite, 'base');
+        }
+      });
+      return;
+    }
+    
     this.sprite.setTint(0xffffff);
     this.scene.time.delayedCall(100, () => {
       this.sprite.clearTint();
@@ -6,6 +6,7 @@
 
 import Phaser from 'phaser';
 import { Component } from '@components/Component';
+import { SpriteVariants } from '@utils/SpriteVariants';
 
 /**
  * Unique ID generator for entities.
@@ -73,10 +74,12 @@ export abstract class Entity {
    */
   protected createSprite(config: EntityConfig): void {
     if (config.texture) {
+      // Baked variant sheets keep the original frames first, so they are a
+      // drop-in for the plain texture
       this.sprite = this.scene.physics.add.sprite(
         config.x,
         config.y,
-        config.texture,
+        SpriteVariants.textureKey(config.texture),
         config.frame
       );
     }
@@ -0,0 +1,131 @@
+/**
+ * @file LootTableRegistry.ts
+ * @description O(1) loot rolls from precompiled alias tables.
+ * Tables are compiled offline by tools/compile-loot-tables.py into
+ * assets/data/loot-tables.json.
+ */
+
+import { SeededRandom, Random } from '@utils/Random';
+
+/**
+ * One compiled alias table (per source, zone and floor tier).
+ */
+interface LootTableData {
+  /** Column -> index into the shared outcome list */
+  outcomes: number[];
+  /** Column keeps its own outcome when a roll in [0, probScale) is below this */
+  threshold: number[];
+  /** Column -> column taken otherwise */
+  alias: number[];
+  gold: { min: number; max: number };
+  guaranteed: string[];
+}
+
+/**
+ * Result of a loot roll.
+ */
+export interface LootRoll {
+  /** Dropped item or spell, or null for no drop */
+  drop: { type: 'item' | 'spell'; id: string } | null;
+  gold: number;
+  /** Drops that always happen (boss rewards) */
+  guaranteed: string[];
+}
+
+/**
+ * Registry of compiled loot tables.
+ *
+ * Each roll costs two random numbers whatever the size of the item pool:
+ * one picks a column, one decides between the column's outcome and its alias.
+ *
+ * @example
+ * ```ts
+ * const loot = LootTableRegistry.roll('skeleton', zone.id, floorNumber, rng);
+ * if (loot?.drop) spawnPickup(loot.drop.type, loot.drop.id);
+ * ```
+ */
+export class LootTableRegistry {
+  private static tables: Map<string, LootTableData> = new Map();
+  private static outcomes: Array<string | null> = [];
+  private static floorTiers: Array<[number, number]> = [];
+  private static probScale: number = 0xffff;
+
+  /**
+   * Load compiled tables from JSON.
+   */
+  public static loadFromJSON(data: {
+    probScale: number;
+    floorTiers: Array<[number, number]>;
+    outcomes: Array<string | null>;
+    tables: Record<string, LootTableData>;
+  }): void {
+    this.clear();
+    this.probScale = data.probScale;
+    this.floorTiers = data.floorTiers;
+    this.outcomes = data.outcomes;
+
+    for (const [key, table] of Object.entries(data.tables)) {
+      this.tables.set(key, table);
+    }
+
+    console.info(`Loaded ${this.tables.size} loot tables`);
+  }
+
+  /**
+   * Floor tier index for a floor (deeper floors use the last tier).
+   */
+  public static getTier(floorNumber: number): number {
+    const tier = this.floorTiers.findIndex(([min, max]) => floorNumber >= min && floorNumber <= max);
+    return tier >= 0 ? tier : this.floorTiers.length - 1;
+  }
+
+  /**
+   * Check whether a source ('slime', 'chest', ...) has tables.
+   */
+  public static has(sourceId: string, zoneId: string, floorNumber: number): boolean {
+    return this.tables.has(this.key(sourceId, zoneId, floorNumber));
+  }
+
+  /**
+   * Roll loot for a source, or null if it has no table for this zone/floor.
+   */
+  public static roll(
+    sourceId: string,
+    zoneId: string,
+    floorNumber: number,
+    rng?: SeededRandom
+  ): LootRoll | null {
+    const table = this.tables.get(this.key(sourceId, zoneId, floorNumber));
+    if (!table) return null;
+
+    const next = (): number => (rng ? rng.next() : Random.next());
+
+    const column = Math.floor(next() * table.threshold.length);
+    const keep = Math.floor(next() * this.probScale) < table.threshold[column];
+    const outcome = this.outcomes[table.outcomes[keep ? column : table.alias[column]]];
+
+    let drop: LootRoll['drop'] = null;
+    if (outcome) {
+      const [type, id] = outcome.split(':');
+      drop = { type: type as 'item' | 'spell', id };
+    }
+
+    const { min, max } = table.gold;
+    const gold = Math.floor(next() * (max - min + 1)) + min;
+
+    return { drop, gold, guaranteed: table.guaranteed };
+  }
+
+  /**
+   * Clear all tables.
+   */
+  public static clear(): void {
+    this.tables.clear();
+    this.outcomes = [];
+    this.floorTiers = [];
+  }
+
+  private static key(sourceId: string, zoneId: string, floorNumber: number): string {
+    return `${sourceId}|${zoneId}|${this.getTier(floorNumber)}`;
+  }
+}
@@ -0,0 +1,7 @@
+/**
+ * @file index.ts
+ * @description Item and loot system exports.
+ */
+
+export { LootTableRegistry } from './LootTableRegistry';
+export type { LootRoll } from './LootTableRegistry';
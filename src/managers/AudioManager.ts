@@ -5,6 +5,7 @@
 
 import Phaser from 'phaser';
 import { Settings } from '@config/Settings';
+import { SFX_SPRITE_KEY } from '@config/Constants';
 
 /**
  * Audio Manager - handles all game audio.
@@ -12,6 +13,7 @@ import { Settings } from '@config/Settings';
  * Features:
  * - Music playback with crossfade
  * - Sound effect pooling
+ * - SFX audio sprite support (markers share the regular sfx_* keys)
  * - Volume control tied to settings
  * - Spatial audio support
  */
@@ -130,14 +132,34 @@ export class AudioManager {
     const pooled = this.getFromPool(key);
     if (pooled) {
       (pooled as Phaser.Sound.WebAudioSound).setVolume(finalVolume);
-      pooled.play();
+      // Sprite-backed pool entries play the marker with the same name; the
+      // marker's config would otherwise reset the volume set above
+      if (this.hasSpriteMarker(key)) {
+        pooled.play(key, { volume: finalVolume });
+      } else {
+        pooled.play();
+      }
       return;
     }
     
     // Create new sound
+    if (this.hasSpriteMarker(key)) {
+      this.scene.sound.playAudioSprite(SFX_SPRITE_KEY, key, { volume: finalVolume });
+      return;
+    }
     this.scene.sound.play(key, { volume: finalVolume });
   }
   
+  /**
+   * Check whether a sound key is a marker in the loaded SFX audio sprite.
+   */
+  public hasSpriteMarker(key: string): boolean {
+    if (!this.scene || !this.scene.cache.audio.exists(SFX_SPRITE_KEY)) return false;
+    
+    const spriteData = this.scene.cache.json.get(SFX_SPRITE_KEY);
+    return !!spriteData?.spritemap?.[key];
+  }
+  
   /**
    * Play a spatial sound effect.
    */
@@ -169,6 +191,10 @@ export class AudioManager {
     
     // Note: Phaser's panning support varies by sound type
     // This is a simplified implementation
+    if (this.hasSpriteMarker(key)) {
+      this.scene.sound.playAudioSprite(SFX_SPRITE_KEY, key, { volume: finalVolume });
+      return;
+    }
     this.scene.sound.play(key, { volume: finalVolume });
   }
   
@@ -178,9 +204,10 @@ export class AudioManager {
   public poolSound(key: string, size: number = this.poolSize): void {
     if (!this.scene || this.sfxPools.has(key)) return;
     
+    const fromSprite = this.hasSpriteMarker(key);
     const pool: Phaser.Sound.BaseSound[] = [];
     for (let i = 0; i < size; i++) {
-      pool.push(this.scene.sound.add(key));
+      pool.push(fromSprite ? this.scene.sound.addAudioSprite(SFX_SPRITE_KEY) : this.scene.sound.add(key));
     }
     this.sfxPools.set(key, pool);
   }
@@ -6,9 +6,14 @@
 import { BaseScene } from './BaseScene';
 import { SCENES, EVENTS, TILE_SIZE, DEPTH, GAME_WIDTH, GAME_HEIGHT } from '@config/Constants';
 import { Player } from '@entities/Player';
+import { Enemy } from '@entities/Enemy';
 import { ZoneManager } from '../managers/ZoneManager';
 import { DungeonGenerator, DungeonFloor } from '../dungeon/DungeonGenerator';
 import { Room, DoorDirection } from '../dungeon/Room';
+import { LayoutBank } from '../dungeon/LayoutBank';
+import { Autotile } from '../dungeon/Autotile';
+import { TileVariations } from '../dungeon/TileVariations';
+import { AssetManifest } from '@utils/AssetManifest';
 
 /**
  * Game start data passed from MenuScene.
@@ -49,6 +54,7 @@ export class GameScene extends BaseScene {
   
   // Entity references
   private player!: Player;
+  private enemies: Enemy[] = [];
   
   // Room rendering
   private roomContainer!: Phaser.GameObjects.Container;
@@ -78,6 +84,9 @@ export class GameScene extends BaseScene {
   private usedTemplateIds: Set<string> = new Set();
   private roomTemplateAssignments: Map<string, string> = new Map(); // dungeonRoomId -> templateId
   
+  // Standard room template and world origin per dungeon room (flow field lookups)
+  private roomNavigation: Map<string, {templateId: string, x: number, y: number}> = new Map();
+  
   constructor() {
     super(SCENES.GAME);
   }
@@ -86,16 +95,24 @@ export class GameScene extends BaseScene {
     this.startData = data || { continueRun: false, character: 'wizard', dungeon: 'depths' };
   }
   
-  create(): void {
-    super.create();
-    
+  preload(): void {
     // Initialize zone manager
     this.zoneManager = new ZoneManager();
     this.currentFloor = 1; // Start at floor 1
-    this.isTransitioning = false;
     
-    // Set initial zone
+    // Set initial zone, then load its tileset, lightmaps and props
+    // (grouped per zone by tools/build-asset-manifest.py)
     this.zoneManager.setCurrentZone(this.currentFloor);
+    const zone = this.zoneManager.getCurrentZone();
+    if (zone) {
+      AssetManifest.queueZone(this.load, zone.id);
+    }
+  }
+  
+  create(): void {
+    super.create();
+    
+    this.isTransitioning = false;
     
     // Disable physics debug rendering
     this.physics.world.drawDebug = false;
@@ -133,6 +150,12 @@ export class GameScene extends BaseScene {
     
     // Camera follows player
     this.cameras.main.startFollow(this.player.sprite, true, 0.1, 0.1);
+    
+    // Stream the zones of the next floors in the background
+    const zone = this.zoneManager.getCurrentZone();
+    if (zone) {
+      AssetManifest.prefetchNext(this, zone.id);
+    }
   }
   
   update(time: number, delta: number): void {
@@ -184,7 +207,9 @@ export class GameScene extends BaseScene {
     // Clear template tracking for new dungeon
     this.usedTemplateIds.clear();
     this.roomTemplateAssignments.clear();
+    this.roomNavigation.clear();
     this.wallBodies = [];
+    this.enemies = [];
     
     // Generate truly random seed using crypto API for better randomness
     const randomArray = new Uint32Array(1);
@@ -192,12 +217,24 @@ export class GameScene extends BaseScene {
     const seed = randomArray[0];
     console.log('Dungeon seed:', seed);
     
-    this.dungeonFloor = this.dungeonGenerator.generate({
-      floorNumber: this.currentFloor,
-      seed,
-      minRooms: 6,
-      maxRooms: 10
-    });
+    // Prefer a pre-validated layout from the bank; generate live otherwise
+    const bankSize = LayoutBank.count(this.currentFloor);
+    if (bankSize > 0) {
+      this.dungeonFloor = LayoutBank.getFloor(this.currentFloor, seed % bankSize);
+      for (const room of this.dungeonFloor.rooms) {
+        if (room.templateId) {
+          this.usedTemplateIds.add(room.templateId);
+          this.roomTemplateAssignments.set(room.id, room.templateId);
+        }
+      }
+    } else {
+      this.dungeonFloor = this.dungeonGenerator.generate({
+        floorNumber: this.currentFloor,
+        seed,
+        minRooms: 6,
+        maxRooms: 10
+      });
+    }
     
     console.log('=== DUNGEON GENERATION ===');
     console.log('Rooms:', this.dungeonFloor.rooms.length);
@@ -293,6 +330,9 @@ export class GameScene extends BaseScene {
       // Render tiles with collision (pass container position for world coordinates)
       this.renderRoomIntoContainer(template, roomContainer, roomX, roomY);
       
+      // Flow fields are baked on this same standard grid
+      this.roomNavigation.set(dungeonRoom.id, { templateId: template.id, x: roomX, y: roomY });
+      
       // Draw door outlines for connected doors (positioned at standard grid edges)
       const doors = dungeonRoom.getDoors();
       for (const door of doors) {
@@ -333,6 +373,10 @@ export class GameScene extends BaseScene {
     const zone = this.zoneManager.getCurrentZone();
     const tilesetKey = zone?.tilesetKey || 'catacombs-tileset';
     
+    // Pre-lit overlay from tools/bake-lightmaps.py replaces per-torch glows
+    const lightmapKey = `lightmap-${zone?.id ?? 'catacombs'}-${room.id}`;
+    const hasBakedLight = this.hasMatchingLightmap(lightmapKey, room);
+    
     for (let y = 0; y < room.height; y++) {
       for (let x = 0; x < room.width; x++) {
         const tileId = room.tiles[y][x];
@@ -345,7 +389,7 @@ export class GameScene extends BaseScene {
         // Render based on tile type
         if (tileId === 1) {
           // Wall with collision
-          const tileFrame = this.getWallTileVariation(x, y);
+          const tileFrame = this.getWallFrame(room, x, y);
           const wall = this.add.image(pixelX + TILE_SIZE / 2, pixelY + TILE_SIZE / 2, tilesetKey, tileFrame)
             .setScale(2)
             .setDepth(DEPTH.WALLS);
@@ -363,9 +407,10 @@ export class GameScene extends BaseScene {
             .setScale(2)
             .setDepth(DEPTH.FLOOR);
           container.add(floor);
+          this.addFloorShadow(room, x, y, tilesetKey, container);
         } else if (tileId === 8) {
           // Torch on wall with collision
-          const tileFrame = this.getWallTileVariation(x, y);
+          const tileFrame = this.getWallFrame(room, x, y);
           const wall = this.add.image(pixelX + TILE_SIZE / 2, pixelY + TILE_SIZE / 2, tilesetKey, tileFrame)
             .setScale(2)
             .setDepth(DEPTH.WALLS);
@@ -386,10 +431,12 @@ export class GameScene extends BaseScene {
             container.add(torch);
           }
           
-          // Add glow
-          const glow = this.add.circle(pixelX + TILE_SIZE / 2, pixelY + TILE_SIZE / 2, 40, 0xff8844, 0.15)
-            .setDepth(DEPTH.EFFECTS);
-          container.add(glow);
+          // Add glow (only when no baked lightmap covers this room)
+          if (!hasBakedLight) {
+            const glow = this.add.circle(pixelX + TILE_SIZE / 2, pixelY + TILE_SIZE / 2, 40, 0xff8844, 0.15)
+              .setDepth(DEPTH.EFFECTS);
+            container.add(glow);
+          }
         } else {
           // Floor
           const tileFrame = this.getFloorTileVariation(x, y);
@@ -397,9 +444,50 @@ export class GameScene extends BaseScene {
             .setScale(2)
             .setDepth(DEPTH.FLOOR);
           container.add(floor);
+          this.addFloorShadow(room, x, y, tilesetKey, container);
+        }
+      }
+    }
+    
+    // Added after the tiles: containers draw children in insertion order
+    // and ignore setDepth, so the additive overlay must come last
+    if (hasBakedLight) {
+      this.textures.get(lightmapKey).setFilter(Phaser.Textures.FilterMode.LINEAR);
+      const lightmap = this.add.image(0, 0, lightmapKey)
+        .setOrigin(0, 0)
+        .setDisplaySize(room.width * TILE_SIZE, room.height * TILE_SIZE)
+        .setBlendMode(Phaser.BlendModes.ADD);
+      container.add(lightmap);
+    }
+  }
+
+  /**
+   * Whether a baked lightmap exists for this room and was baked with the
+   * same size and torch tiles as the room being rendered.
+   * tools/bake-lightmaps.py bakes the standard 11x9 room; anything else
+   * (e.g. a raw template in the single-room view) keeps its live glows.
+   */
+  private hasMatchingLightmap(lightmapKey: string, room: RoomTemplate): boolean {
+    if (!this.textures.exists(lightmapKey)) {
+      return false;
+    }
+    const lightmaps: Array<{ key: string; width: number; height: number; torches: number[][] }> =
+      this.cache.json.get('lightmaps')?.lightmaps ?? [];
+    const baked = lightmaps.find(entry => entry.key === lightmapKey);
+    if (!baked || baked.width !== room.width || baked.height !== room.height) {
+      return false;
+    }
+
+    const torches = new Set<string>();
+    for (let y = 0; y < room.height; y++) {
+      for (let x = 0; x < room.width; x++) {
+        if (room.tiles[y][x] === 8) {
+          torches.add(`${x},${y}`);
         }
       }
     }
+    return baked.torches.length === torches.size &&
+      baked.torches.every(([x, y]) => torches.has(`${x},${y}`));
   }
 
   /**
@@ -633,8 +721,8 @@ export class GameScene extends BaseScene {
     const zone = this.zoneManager.getCurrentZone();
     const tilesetKey = zone?.tilesetKey || 'depths-tileset';
     
-    // Use wall tile from tileset with variation (scaled 2x)
-    const tileFrame = this.getWallTileVariation(gridX, gridY);
+    // Use wall tile from tileset, autotiled at edges (scaled 2x)
+    const tileFrame = this.getWallFrame(this.currentRoom, gridX, gridY);
     const wall = this.add.image(x + TILE_SIZE / 2, y + TILE_SIZE / 2, tilesetKey, tileFrame)
       .setScale(2)
       .setDepth(DEPTH.WALLS);
@@ -646,6 +734,10 @@ export class GameScene extends BaseScene {
    * Uses better hash to avoid diagonal patterns.
    */
   private getFloorTileVariation(gridX: number, gridY: number): number {
+    // Baked by tools/bake-tile-variations.py (same hash)
+    const baked = TileVariations.floor(gridX, gridY);
+    if (baked !== undefined) return baked;
+    
     // Better pseudo-random hash to avoid linear patterns
     let hash = (gridX * 73) ^ (gridY * 37);
     hash = ((hash >> 16) ^ hash) * 0x85ebca6b;
@@ -658,6 +750,10 @@ export class GameScene extends BaseScene {
    * Get deterministic wall tile variation based on grid position.
    */
   private getWallTileVariation(gridX: number, gridY: number): number {
+    // Baked by tools/bake-tile-variations.py (same hash)
+    const baked = TileVariations.wall(gridX, gridY);
+    if (baked !== undefined) return baked;
+    
     // Better pseudo-random hash for walls
     let hash = (gridX * 59) ^ (gridY * 97);
     hash = ((hash >> 16) ^ hash) * 0x85ebca6b;
@@ -666,16 +762,38 @@ export class GameScene extends BaseScene {
     return 16 + (hash % 8); // Frames 16-23
   }
   
+  /**
+   * Wall frame: blob autotile at edges, hashed variation inside solid wall.
+   */
+  private getWallFrame(room: RoomTemplate, gridX: number, gridY: number): number {
+    if (!Autotile.isLoaded()) {
+      return this.getWallTileVariation(gridX, gridY);
+    }
+    const mask = Autotile.neighbourMask(room.tiles, gridX, gridY, true);
+    return Autotile.isSolid(mask) ? this.getWallTileVariation(gridX, gridY) : Autotile.wallFrame(mask);
+  }
+  
+  /**
+   * Overlay the baked wall shadow on a floor tile next to walls.
+   * @returns Whether the autotile table was available
+   */
+  private addFloorShadow(room: RoomTemplate, gridX: number, gridY: number, tilesetKey: string, container: Phaser.GameObjects.Container): boolean {
+    if (!Autotile.isLoaded()) return false;
+    
+    const mask = Autotile.neighbourMask(room.tiles, gridX, gridY, false);
+    if (!Autotile.isSolid(mask)) {
+      const shadow = this.add.image(gridX * TILE_SIZE + TILE_SIZE / 2, gridY * TILE_SIZE + TILE_SIZE / 2, tilesetKey, Autotile.shadowFrame(mask))
+        .setScale(2)
+        .setDepth(DEPTH.FLOOR_DECORATIONS);
+      container.add(shadow);
+    }
+    return true;
+  }
+  
   /**
    * Render floor with edge detection for walls.
    */
   private renderTransitionTile(x: number, y: number, gridX: number, gridY: number): void {
-    // Check neighbors
-    const hasNorth = this.isWall(gridX, gridY - 1);
-    const hasSouth = this.isWall(gridX, gridY + 1);
-    const hasEast = this.isWall(gridX + 1, gridY);
-    const hasWest = this.isWall(gridX - 1, gridY);
-    
     // Get current zone tileset
     const zone = this.zoneManager.getCurrentZone();
     const tilesetKey = zone?.tilesetKey || 'depths-tileset';
@@ -687,6 +805,17 @@ export class GameScene extends BaseScene {
       .setDepth(DEPTH.FLOOR);
     this.roomContainer.add(floor);
     
+    // Baked blob shadow (one lookup) when the autotile table is loaded
+    if (this.addFloorShadow(this.currentRoom, gridX, gridY, tilesetKey, this.roomContainer)) {
+      return;
+    }
+    
+    // Check neighbors
+    const hasNorth = this.isWall(gridX, gridY - 1);
+    const hasSouth = this.isWall(gridX, gridY + 1);
+    const hasEast = this.isWall(gridX + 1, gridY);
+    const hasWest = this.isWall(gridX - 1, gridY);
+    
     // Add edge shadows near walls
     const shadowColor = 0x2a231e;
     const shadowSize = 4;
@@ -1307,11 +1436,27 @@ export class GameScene extends BaseScene {
     this.player.handleMovement(direction);
   }
   
+  /**
+   * Add an enemy to a dungeon room (the current one by default).
+   * Points it at the room's baked flow fields so it paths around walls.
+   */
+  public addEnemy(enemy: Enemy, dungeonRoomId: string = this.currentDungeonRoom.id): void {
+    const navigation = this.roomNavigation.get(dungeonRoomId);
+    if (navigation) {
+      enemy.setNavigationRoom(navigation.templateId, navigation.x, navigation.y);
+    }
+    this.enemies.push(enemy);
+  }
+  
   /**
    * Update all entities.
    */
-  private updateEntities(_delta: number): void {
+  private updateEntities(delta: number): void {
     // Player update handled by physics
+    this.enemies = this.enemies.filter(enemy => enemy.isActive());
+    for (const enemy of this.enemies) {
+      enemy.update(delta);
+    }
   }
   
   /**
@@ -5,8 +5,9 @@
 
 import Phaser from 'phaser';
 import { BaseScene } from './BaseScene';
-import { SCENES, GAME_WIDTH, GAME_HEIGHT } from '@config/Constants';
+import { SCENES, GAME_WIDTH, GAME_HEIGHT, SFX_SPRITE_KEY } from '@config/Constants';
 import { SaveManager } from '@managers/SaveManager';
+import { SpriteVariants } from '@utils/SpriteVariants';
 
 /** Menu states */
 type MenuState = 'main' | 'play' | 'dungeons' | 'characters' | 'achievements' | 'settings';
@@ -97,8 +98,29 @@ export class MenuScene extends BaseScene {
   }
   
   preload(): void {
-    // Load wizard character sprite
-    this.load.image('wizard-south', 'assets/sprites/player/rotations/south.png');
+    // Load wizard character sprite, unless its baked variant sheet came with the boot set
+    if (!this.textures.exists(SpriteVariants.textureKey('wizard-south'))) {
+      this.load.image('wizard-south', 'assets/sprites/player/rotations/south.png');
+    }
+  }
+  
+  /**
+   * Whether any wizard art (baked sheet or plain image) is loaded.
+   */
+  private hasWizardArt(): boolean {
+    return this.textures.exists(SpriteVariants.textureKey('wizard-south')) || this.textures.exists('wizard-south');
+  }
+  
+  /**
+   * Add the wizard portrait, from its baked variant sheet when loaded so
+   * hover and selection swap frames (SpriteVariants.setVariant).
+   */
+  private addWizardImage(x: number, y: number): Phaser.GameObjects.Image {
+    const sheetKey = SpriteVariants.textureKey('wizard-south');
+    if (sheetKey !== 'wizard-south' && this.textures.exists(sheetKey)) {
+      return this.add.image(x, y, sheetKey, SpriteVariants.frame('wizard-south', 'base'));
+    }
+    return this.add.image(x, y, 'wizard-south');
   }
   
   create(): void {
@@ -188,12 +210,16 @@ export class MenuScene extends BaseScene {
     }
     
     const soundKey = `sfx_ui_${key}`;
-    if (this.cache.audio.exists(soundKey)) {
-      // Calculate effective volume (Master * SFX)
-      const effectiveVolume = this.sfxVolume * this.masterVolume;
-      if (effectiveVolume > 0) {
-        this.sound.play(soundKey, { volume: effectiveVolume });
-      }
+    // Calculate effective volume (Master * SFX)
+    const effectiveVolume = this.sfxVolume * this.masterVolume;
+    if (effectiveVolume <= 0) return;
+    
+    // Prefer the packed SFX sprite when it is loaded and has this marker
+    const spriteData = this.cache.audio.exists(SFX_SPRITE_KEY) ? this.cache.json.get(SFX_SPRITE_KEY) : null;
+    if (spriteData?.spritemap?.[soundKey]) {
+      this.sound.playAudioSprite(SFX_SPRITE_KEY, soundKey, { volume: effectiveVolume });
+    } else if (this.cache.audio.exists(soundKey)) {
+      this.sound.play(soundKey, { volume: effectiveVolume });
     }
   }
   
@@ -1589,7 +1615,7 @@ export class MenuScene extends BaseScene {
     }).setOrigin(0.5).setName('charArtIcon');
 
     // Character sprite (for wizard, hidden by default)
-    const artSprite = this.add.image(leftColX + artSize / 2, -20, 'wizard-south')
+    const artSprite = this.addWizardImage(leftColX + artSize / 2, -20)
       .setOrigin(0.5)
       .setScale(4.5) // Scale up for detail panel (32px * 4.5 = 144px)
       .setVisible(false)
@@ -1685,8 +1711,8 @@ export class MenuScene extends BaseScene {
     
     // Character icon - use sprite for wizard, fallback to letter for others
     let icon: Phaser.GameObjects.Image | Phaser.GameObjects.Text;
-    if (char.id === 'wizard' && char.unlocked && this.textures.exists('wizard-south')) {
-      icon = this.add.image(0, 0, 'wizard-south')
+    if (char.id === 'wizard' && char.unlocked && this.hasWizardArt()) {
+      icon = this.addWizardImage(0, 0)
         .setOrigin(0.5)
         .setScale(2.5); // Scale up the 32x32 sprite to fit the portrait (80px)
     } else {
@@ -1713,10 +1739,16 @@ export class MenuScene extends BaseScene {
       
       hitArea.on('pointerover', () => {
         container.setScale(1.06);
+        if (icon instanceof Phaser.GameObjects.Image) {
+          SpriteVariants.setVariant(icon, 'outline');
+        }
       });
       
       hitArea.on('pointerout', () => {
         container.setScale(1);
+        if (icon instanceof Phaser.GameObjects.Image) {
+          SpriteVariants.setVariant(icon, 'base');
+        }
       });
       
       hitArea.on('pointerdown', () => {
@@ -1780,7 +1812,7 @@ export class MenuScene extends BaseScene {
 
     const applyContent = () => {
       // Show sprite for wizard, text placeholder for others
-      const hasSprite = character.id === 'wizard' && this.textures.exists('wizard-south');
+      const hasSprite = character.id === 'wizard' && this.hasWizardArt();
       if (artIcon) {
         artIcon.setText(character.name[0]);
         artIcon.setColor('#ffffff');
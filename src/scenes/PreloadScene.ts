@@ -1,14 +1,22 @@
 /**
  * @file PreloadScene.ts
- * @description Loads all game assets with progress display.
+ * @description Loads the boot assets with progress display.
  */
 
 import Phaser from 'phaser';
-import { SCENES, GAME_WIDTH, GAME_HEIGHT } from '@config/Constants';
+import { SCENES, GAME_WIDTH, GAME_HEIGHT, USE_SFX_SPRITE } from '@config/Constants';
 import { RoomComponentRegistry } from '@dungeon/RoomComponentRegistry';
+import { FlowFieldRegistry } from '@dungeon/FlowFieldRegistry';
+import { LayoutBank } from '@dungeon/LayoutBank';
+import { Autotile } from '@dungeon/Autotile';
+import { TileVariations } from '@dungeon/TileVariations';
+import { LootTableRegistry } from '@items/LootTableRegistry';
+import { SpriteVariants } from '@utils/SpriteVariants';
+import { AssetManifest } from '@utils/AssetManifest';
+import type { AssetManifestData } from '@utils/AssetManifest';
 
 /**
- * Preload scene - handles loading all game assets.
+ * Preload scene - loads the boot asset set and initializes data registries.
  * Displays a loading bar while assets load.
  */
 export class PreloadScene extends Phaser.Scene {
@@ -47,6 +55,43 @@ export class PreloadScene extends Phaser.Scene {
       RoomComponentRegistry.loadFromJSON(roomData);
     }
     
+    // Load baked navigation flow fields (tools/bake-flow-fields.py)
+    const flowFieldData = this.cache.json.get('flowfields');
+    if (flowFieldData) {
+      FlowFieldRegistry.loadFromJSON(flowFieldData);
+    }
+    
+    // Load pre-validated floor layouts (tools/generate-layout-bank.py)
+    const layoutIndex = this.cache.json.get('layout-bank');
+    const layoutData = this.cache.binary.get('layout-bank-data');
+    if (layoutIndex && layoutData) {
+      LayoutBank.load(layoutIndex, layoutData);
+    }
+    
+    // Load blob autotile lookup table (tools/autotile.py)
+    const autotileData = this.cache.json.get('autotile');
+    if (autotileData) {
+      Autotile.loadFromJSON(autotileData);
+    }
+    
+    // Load baked tile variation frames (tools/bake-tile-variations.py)
+    const variationData = this.cache.json.get('tile-variations');
+    if (variationData) {
+      TileVariations.loadFromJSON(variationData);
+    }
+    
+    // Load baked sprite variant frames (tools/bake-sprite-variants.py)
+    const spriteVariantData = this.cache.json.get('sprite-variants');
+    if (spriteVariantData) {
+      SpriteVariants.loadFromJSON(spriteVariantData);
+    }
+    
+    // Load compiled loot tables (tools/compile-loot-tables.py)
+    const lootData = this.cache.json.get('loot-tables');
+    if (lootData) {
+      LootTableRegistry.loadFromJSON(lootData);
+    }
+    
     // TODO: Load spell registry
     // const spellData = this.cache.json.get('spells');
     // if (spellData) SpellRegistry.loadFromJSON(spellData);
@@ -97,74 +142,25 @@ export class PreloadScene extends Phaser.Scene {
   }
   
   /**
-   * Load all game assets.
+   * Load the boot asset set.
+   * Zone tilesets, lightmaps and props are loaded per zone by GameScene.
    */
   private loadAssets(): void {
-    // =========================================================================
-    // JSON DATA (load first - other systems may depend on this)
-    // =========================================================================
-    
-    this.load.json('rooms', 'assets/data/rooms/index.json');
-    this.load.json('spells', 'assets/data/spells.json');
-    this.load.json('enemies', 'assets/data/enemies.json');
-    this.load.json('items', 'assets/data/items.json');
-    this.load.json('depths-tilemap', 'assets/data/depths-tilemap.json');
-    
-    // =========================================================================
-    // DEPTHS TILESET AND OBJECTS
-    // =========================================================================
-    
-    // Load all zone tilesets as spritesheets (4x4 grid of 16x16 tiles)
-    this.load.spritesheet('depths-tileset', 'assets/sprites/depths/tileset.png', {
-      frameWidth: 16,
-      frameHeight: 16,
-    });
-    this.load.spritesheet('catacombs-tileset', 'assets/sprites/depths/catacombs-tileset.png', {
-      frameWidth: 16,
-      frameHeight: 16,
-    });
-    this.load.spritesheet('library-tileset', 'assets/sprites/depths/library-tileset.png', {
-      frameWidth: 16,
-      frameHeight: 16,
-    });
-    this.load.spritesheet('crystal_caves-tileset', 'assets/sprites/depths/crystal_caves-tileset.png', {
-      frameWidth: 16,
-      frameHeight: 16,
+    // Content-hashed asset groups (tools/build-asset-manifest.py); the boot
+    // group is queued once the manifest arrives, like the lightmaps were
+    this.load.once('filecomplete-json-asset-manifest', (_key: string, _type: string, data: AssetManifestData) => {
+      AssetManifest.loadFromJSON(data);
+      AssetManifest.queueBoot(this.load, USE_SFX_SPRITE);
     });
-    this.load.spritesheet('forge_depths-tileset', 'assets/sprites/depths/forge_depths-tileset.png', {
-      frameWidth: 16,
-      frameHeight: 16,
-    });
-    
-    this.load.image('depths-torch', 'assets/sprites/depths/torch.png');
-    this.load.image('depths-barrel', 'assets/sprites/depths/barrel.png');
-    this.load.image('depths-chest', 'assets/sprites/depths/chest.png');
-    
-    // =========================================================================
-    // AUDIO - MUSIC
-    // Generated offline, stored in assets/audio/music/
-    // =========================================================================
+    // The manifest itself has a fixed name: the build stamps its hash on the
+    // URL (the dev server may rebuild it at any time, so never cache it there)
+    const manifestVersion = import.meta.env.DEV ? Date.now().toString(36) : __ASSET_MANIFEST_HASH__;
+    this.load.json('asset-manifest', `assets/data/asset-manifest.json?v=${manifestVersion}`);
     
-    this.load.audio('music_menu', 'assets/audio/music/menu.mp3');
     // this.load.audio('music_dungeon1', ['assets/audio/music/dungeon_floor1.ogg', 'assets/audio/music/dungeon_floor1.mp3']);
-    
-    // =========================================================================
-    // AUDIO - UI SOUND EFFECTS
-    // =========================================================================
-    
-    this.load.audio('sfx_ui_click', 'assets/audio/sfx/ui_click.mp3');
-    this.load.audio('sfx_ui_hover', 'assets/audio/sfx/ui_hover.mp3');
-    this.load.audio('sfx_ui_back', 'assets/audio/sfx/ui_back.mp3');
-    this.load.audio('sfx_ui_start', 'assets/audio/sfx/ui_start.mp3');
     // this.load.audio('music_dungeon2', ['assets/audio/music/dungeon_floor2.ogg', 'assets/audio/music/dungeon_floor2.mp3']);
     // this.load.audio('music_boss', ['assets/audio/music/boss.ogg', 'assets/audio/music/boss.mp3']);
     // this.load.audio('music_victory', ['assets/audio/music/victory.ogg', 'assets/audio/music/victory.mp3']);
     // this.load.audio('music_gameover', ['assets/audio/music/game_over.ogg', 'assets/audio/music/game_over.mp3']);
-    
-    // -----------------------------------------------------
-    // DATA
-    // -----------------------------------------------------
-    // TODO: this.load.json('spells', 'assets/data/spells.json');
-    // TODO: this.load.json('enemies', 'assets/data/enemies.json');
   }
 }
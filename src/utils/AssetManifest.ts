@@ -0,0 +1,192 @@
+/**
+ * @file AssetManifest.ts
+ * @description Zone-scoped, content-hashed asset groups.
+ * The manifest is generated by tools/build-asset-manifest.py into
+ * assets/data/asset-manifest.json.
+ */
+
+import Phaser from 'phaser';
+
+/**
+ * One loadable file. `url` already carries the content hash, either as a
+ * `?v=` suffix or in the filename, so it can be cached indefinitely.
+ */
+interface AssetEntry {
+  key: string;
+  type: 'json' | 'binary' | 'image' | 'spritesheet' | 'audio' | 'audioSprite';
+  url: string;
+  hash: string;
+  bytes: number;
+  frameWidth?: number;
+  frameHeight?: number;
+  /** Audio files of an audioSprite entry (url is its JSON) */
+  audio?: string[];
+}
+
+/**
+ * Assets of one zone.
+ */
+interface ZoneGroup {
+  /** [minFloor, maxFloor] */
+  floors: [number, number];
+  rooms: string[];
+  assets: AssetEntry[];
+  /** Zones that can come up on the next floors */
+  prefetch: string[];
+}
+
+/**
+ * asset-manifest.json contents.
+ */
+export interface AssetManifestData {
+  version: number;
+  hashLength: number;
+  /** Registry data and menu music (PreloadScene) */
+  boot: AssetEntry[];
+  /** UI sounds: individual files, or the packed sprite when built */
+  sfx: { files: AssetEntry[]; sprite: AssetEntry | null };
+  /** Game assets every zone uses */
+  shared: AssetEntry[];
+  zones: Record<string, ZoneGroup>;
+}
+
+/**
+ * Queues asset groups on a loader so startup only fetches the boot set and
+ * each zone is loaded when a run enters it.
+ *
+ * @example
+ * ```ts
+ * // PreloadScene
+ * AssetManifest.queueBoot(this.load, USE_SFX_SPRITE);
+ * // GameScene.preload
+ * AssetManifest.queueZone(this.load, zone.id);
+ * // GameScene.create
+ * AssetManifest.prefetchNext(this, zone.id);
+ * ```
+ */
+export class AssetManifest {
+  private static data: AssetManifestData | null = null;
+
+  /**
+   * Load the manifest from JSON data.
+   */
+  public static loadFromJSON(data: AssetManifestData): void {
+    this.clear();
+    this.data = data;
+
+    const zones = Object.keys(data.zones).length;
+    console.info(`Loaded asset manifest (${data.boot.length} boot files, ${zones} zones)`);
+  }
+
+  /**
+   * Whether an entry is already in the texture or cache it loads into.
+   */
+  public static isLoaded(loader: Phaser.Loader.LoaderPlugin, entry: AssetEntry): boolean {
+    const cache = loader.cacheManager;
+    switch (entry.type) {
+      case 'json':
+        return cache.json.exists(entry.key);
+      case 'binary':
+        return cache.binary.exists(entry.key);
+      case 'image':
+      case 'spritesheet':
+        return loader.textureManager.exists(entry.key);
+      case 'audio':
+        return cache.audio.exists(entry.key);
+      case 'audioSprite':
+        return cache.audio.exists(entry.key) && cache.json.exists(entry.key);
+    }
+  }
+
+  /**
+   * Queue entries on a loader, skipping ones already loaded.
+   * Entries still pending (e.g. from a prefetch) are queued again; the
+   * loader drops duplicates of files it already holds, and a prefetch cut
+   * short by a scene shutdown is simply reloaded.
+   */
+  public static queue(loader: Phaser.Loader.LoaderPlugin, entries: AssetEntry[]): number {
+    let count = 0;
+    for (const entry of entries) {
+      if (this.isLoaded(loader, entry)) {
+        continue;
+      }
+      count++;
+
+      switch (entry.type) {
+        case 'json':
+          loader.json(entry.key, entry.url);
+          break;
+        case 'binary':
+          loader.binary(entry.key, entry.url);
+          break;
+        case 'image':
+          loader.image(entry.key, entry.url);
+          break;
+        case 'spritesheet':
+          loader.spritesheet(entry.key, entry.url, {
+            frameWidth: entry.frameWidth ?? 16,
+            frameHeight: entry.frameHeight ?? 16,
+          });
+          break;
+        case 'audio':
+          loader.audio(entry.key, entry.url);
+          break;
+        case 'audioSprite':
+          loader.audioSprite(entry.key, entry.url, entry.audio ?? []);
+          break;
+      }
+    }
+    return count;
+  }
+
+  /**
+   * Queue the boot set: registry data, menu music and UI sounds.
+   * Falls back to the individual SFX files if no sprite was packed.
+   */
+  public static queueBoot(loader: Phaser.Loader.LoaderPlugin, useSfxSprite: boolean): void {
+    if (!this.data) {
+      return;
+    }
+    this.queue(loader, this.data.boot);
+
+    const { files, sprite } = this.data.sfx;
+    this.queue(loader, useSfxSprite && sprite ? [sprite] : files);
+  }
+
+  /**
+   * Queue the shared game assets and one zone's assets.
+   * Call from a scene's preload, so create only runs once they are loaded.
+   */
+  public static queueZone(loader: Phaser.Loader.LoaderPlugin, zoneId: string): void {
+    if (!this.data) {
+      return;
+    }
+    this.queue(loader, this.data.shared);
+    this.queue(loader, this.data.zones[zoneId]?.assets ?? []);
+  }
+
+  /**
+   * Stream the zones that can follow this one in the background.
+   * Starts the scene's loader if it is idle (call after create). This only
+   * warms the caches: entering a zone still goes through queueZone.
+   */
+  public static prefetchNext(scene: Phaser.Scene, zoneId: string): void {
+    if (!this.data) {
+      return;
+    }
+    let count = 0;
+    for (const next of this.data.zones[zoneId]?.prefetch ?? []) {
+      count += this.queue(scene.load, this.data.zones[next]?.assets ?? []);
+    }
+    if (count > 0 && !scene.load.isLoading()) {
+      scene.load.start();
+    }
+  }
+
+  /**
+   * Clear the loaded manifest.
+   */
+  public static clear(): void {
+    this.data = null;
+  }
+}
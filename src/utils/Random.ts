@@ -28,14 +28,16 @@ export class SeededRandom {
    * Set the seed and reset state.
    */
   public setSeed(seed: number): void {
-    // SplitMix64 to initialize state
-    let s = seed;
+    // SplitMix32 to initialize state. The multiplies must stay in 32-bit
+    // integer math (Math.imul): float products of 64-bit constants have no
+    // low bits left, which zeroed the whole state for every seed.
+    let s = seed | 0;
     for (let i = 0; i < 4; i++) {
-      s = (s + 0x9e3779b97f4a7c15) | 0;
+      s = (s + 0x9e3779b9) | 0;
       let z = s;
-      z = (z ^ (z >>> 30)) * 0xbf58476d1ce4e5b9;
-      z = (z ^ (z >>> 27)) * 0x94d049bb133111eb;
-      z = z ^ (z >>> 31);
+      z = Math.imul(z ^ (z >>> 16), 0x85ebca6b);
+      z = Math.imul(z ^ (z >>> 13), 0xc2b2ae35);
+      z = z ^ (z >>> 16);
       this.state[i] = z >>> 0;
     }
   }
@@ -0,0 +1,111 @@
+/**
+ * @file SpriteVariants.ts
+ * @description Baked outline / hit-flash / elemental tint frames.
+ * Sheets and manifest are generated by tools/bake-sprite-variants.py into
+ * assets/sprites/variants/ and assets/data/sprite-variants.json.
+ */
+
+import Phaser from 'phaser';
+
+/**
+ * One baked sheet: the source frames followed by one block per variant.
+ */
+interface VariantSheet {
+  /** Texture key of the baked sheet */
+  key: string;
+  /** Texture key of the sprite it replaces */
+  source: string;
+  path: string;
+  frameWidth: number;
+  frameHeight: number;
+  /** Frames per variant block */
+  frames: number;
+}
+
+/**
+ * sprite-variants.json contents.
+ */
+export interface SpriteVariantManifest {
+  /** Variant names in block order ('base', 'outline', 'flash', elements...) */
+  variants: string[];
+  sheets: VariantSheet[];
+}
+
+/**
+ * Frame lookups for baked sprite variants.
+ *
+ * Frame `f` of variant `v` is `v * frames + f`, so switching effect is a
+ * setFrame instead of a tint or post-FX pass.
+ *
+ * @example
+ * ```ts
+ * const sprite = scene.add.sprite(x, y, SpriteVariants.textureKey('enemy_slime'));
+ * SpriteVariants.setVariant(sprite, 'flash');
+ * ```
+ */
+export class SpriteVariants {
+  private static variants: Map<string, number> = new Map();
+  private static bySource: Map<string, VariantSheet> = new Map();
+  private static byKey: Map<string, VariantSheet> = new Map();
+
+  /**
+   * Load the manifest from JSON data.
+   */
+  public static loadFromJSON(data: SpriteVariantManifest): void {
+    this.clear();
+
+    data.variants.forEach((name, index) => this.variants.set(name, index));
+    for (const sheet of data.sheets) {
+      this.bySource.set(sheet.source, sheet);
+      this.byKey.set(sheet.key, sheet);
+    }
+
+    console.info(`Loaded ${data.sheets.length} sprite variant sheets (${data.variants.length} variants)`);
+  }
+
+  /**
+   * Texture to create a sprite with: the baked sheet if one exists for
+   * the key, otherwise the key itself.
+   */
+  public static textureKey(source: string): string {
+    return this.bySource.get(source)?.key ?? source;
+  }
+
+  /**
+   * Frame index of a variant of a source sprite, or undefined if not baked.
+   */
+  public static frame(source: string, variant: string, baseFrame: number = 0): number | undefined {
+    const sheet = this.bySource.get(source) ?? this.byKey.get(source);
+    const index = this.variants.get(variant);
+    if (!sheet || index === undefined) {
+      return undefined;
+    }
+    return index * sheet.frames + baseFrame;
+  }
+
+  /**
+   * Show a variant of the sprite's current frame.
+   * Returns false (and leaves the sprite alone) if its texture has no baked
+   * variants, so callers can fall back to tinting.
+   */
+  public static setVariant(sprite: Phaser.GameObjects.Sprite | Phaser.GameObjects.Image, variant: string): boolean {
+    const sheet = this.byKey.get(sprite.texture.key);
+    const index = this.variants.get(variant);
+    if (!sheet || index === undefined) {
+      return false;
+    }
+    const current = Number(sprite.frame.name);
+    const baseFrame = Number.isInteger(current) ? current % sheet.frames : 0;
+    sprite.setFrame(index * sheet.frames + baseFrame);
+    return true;
+  }
+
+  /**
+   * Clear the loaded manifest.
+   */
+  public static clear(): void {
+    this.variants.clear();
+    this.bySource.clear();
+    this.byKey.clear();
+  }
+}
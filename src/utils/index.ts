@@ -9,3 +9,7 @@ export type { Poolable } from './ObjectPool';
 export * from './Math';
 export { Debug } from './Debug';
 export { generatePlaceholders, getPlaceholderKeys, isPlaceholder, SPRITES } from './PlaceholderSprites';
+export { SpriteVariants } from './SpriteVariants';
+export type { SpriteVariantManifest } from './SpriteVariants';
+export { AssetManifest } from './AssetManifest';
+export type { AssetManifestData } from './AssetManifest';
@@ -9,3 +9,6 @@ interface ImportMetaEnv {
 interface ImportMeta {
   readonly env: ImportMetaEnv;
 }
+
+/** Content hash of assets/data/asset-manifest.json, injected by vite.config.ts */
+declare const __ASSET_MANIFEST_HASH__: string;
@@ -0,0 +1,97 @@
+"""
+EnCodec Token Streams
+=====================
+
+Helpers for keeping the discrete audio codes MusicGen produces instead of
+(or next to) the rendered WAV. A clip is stored as int16 codebook indices,
+shape (num_codebooks, frames), in a compressed .npz - a few KB per second
+of audio versus ~128 KB/s for a 32 kHz float32 WAV.
+
+Use `decode-codes.py` to render stored codes back to audio later without
+re-running the autoregressive decoder.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+CODES_SUFFIX = ".codes.npz"
+
+
+def undelay_codes(sequences, num_codebooks: int) -> np.ndarray:
+    """
+    Strip MusicGen's codebook delay pattern from raw generated sequences.
+
+    `sequences` is the (num_codebooks, length) tensor returned in
+    `model.generate(..., return_dict_in_generate=True).sequences`. Codebook k
+    is delayed by k steps after the start token, so its valid frames are
+    columns k + 1 .. length - num_codebooks + k.
+    """
+    seq = sequences.detach().cpu().numpy().reshape(-1, num_codebooks, sequences.shape[-1])[0]
+    frames = seq.shape[-1] - num_codebooks
+    codes = np.stack([seq[k, k + 1:k + 1 + frames] for k in range(num_codebooks)])
+    return codes.astype(np.int16)
+
+
+def generated_audio(outputs) -> np.ndarray:
+    """
+    First channel of the first clip from a `return_dict_in_generate=True`
+    MusicGen output.
+
+    Recent transformers releases return the decoded audio in `audio_values`
+    and the tokens in `sequences`; older ones put the audio in `sequences`
+    and have no `audio_values`.
+    """
+    audio = getattr(outputs, "audio_values", None)
+    if audio is None:
+        audio = outputs.sequences
+    return audio[0, 0].detach().cpu().numpy()
+
+
+def generated_codes(outputs, num_codebooks: int) -> np.ndarray:
+    """
+    Undelayed token stream from a `return_dict_in_generate=True` MusicGen
+    output. Raises RuntimeError on transformers releases that only return the
+    decoded audio (no `audio_values` field), where the tokens are not exposed.
+    """
+    if getattr(outputs, "audio_values", None) is None:
+        raise RuntimeError(
+            "This transformers version returns decoded audio instead of tokens from "
+            "MusicGen.generate; upgrade transformers to keep token streams "
+            "(pip install -U transformers)"
+        )
+    return undelay_codes(outputs.sequences, num_codebooks)
+
+
+def codes_path_for(wav_path: Path) -> Path:
+    """Codes file stored next to a generated WAV."""
+    wav_path = Path(wav_path)
+    return wav_path.with_name(wav_path.stem + CODES_SUFFIX)
+
+
+def save_codes(path: Path, codes: np.ndarray, sample_rate: int, frame_rate: int,
+               model_name: str, prompt: str = "", duration: float = None):
+    """Write a code stream plus the metadata needed to decode it."""
+    np.savez_compressed(
+        path,
+        codes=codes.astype(np.int16),
+        sample_rate=np.int32(sample_rate),
+        frame_rate=np.int32(frame_rate),
+        model=np.str_(model_name),
+        prompt=np.str_(prompt),
+        duration=np.float32(duration if duration is not None else codes.shape[-1] / frame_rate),
+    )
+    print(f"  Saved codes: {path} ({Path(path).stat().st_size / 1024:.1f} KB)")
+
+
+def load_codes(path: Path) -> dict:
+    """Read a code stream written by `save_codes`."""
+    with np.load(path) as data:
+        return {
+            "codes": data["codes"].astype(np.int64),
+            "sample_rate": int(data["sample_rate"]),
+            "frame_rate": int(data["frame_rate"]),
+            "model": str(data["model"]),
+            "prompt": str(data["prompt"]),
+            "duration": float(data["duration"]),
+        }
@@ -0,0 +1,359 @@
+"""
+Perceptual Audio Fingerprints
+=============================
+
+Compact fingerprints for the WAV candidates the generation scripts write to
+tools/output, and a locality-sensitive hash index over them, so near-identical
+candidates (`menu_click_retro_3.wav` sounding like `menu_click_retro_1.wav`)
+are caught when they are written instead of by ear.
+
+A fingerprint is one 52-value float vector per clip, from a vectorized STFT
+(all frames in one rfft) of the clip resampled to 16 kHz mono:
+- chroma:   mean energy per pitch class (55 Hz - 5 kHz), 12 values
+- bands:    mean and spread of log energy in 16 log-spaced bands, 32 values
+- envelope: loudness of 8 equal segments relative to the peak, 8 values
+Each block is centred and normalized, so the cosine of two fingerprints
+measures how alike the clips sound regardless of gain.
+
+The index hashes fingerprints with random hyperplanes (SimHash): TABLES
+tables of BITS-bit keys, where clips at a small angle usually share a bucket
+in at least one table. Queries rerank the bucket candidates by exact cosine
+and fall back to a linear scan when too few buckets collide. Vectors, keys and
+file stamps are kept in tools/cache/audio_fingerprints.npz; unchanged files
+are not re-fingerprinted.
+
+Usage:
+    from audio_fingerprint import FingerprintIndex, candidate_files, check_new_clip
+
+    index = FingerprintIndex()
+    index.sync(candidate_files(output_dir))   # index the existing candidates
+    check_new_clip(index, output_path)        # prints the nearest older clip
+    index.query(path, k=3)                    # [(path, similarity), ...]
+"""
+
+import shutil
+from math import gcd
+from pathlib import Path
+
+import numpy as np
+import scipy.io.wavfile as wavfile
+from scipy.signal import resample_poly
+
+from audio_codes import codes_path_for
+
+# Index file
+INDEX_PATH = Path(__file__).parent / "cache" / "audio_fingerprints.npz"
+INDEX_VERSION = 1
+
+# Analysis settings
+FINGERPRINT_RATE = 16000
+FRAME = 1024
+HOP = 512
+CHROMA_RANGE = (55.0, 5000.0)
+BANDS = 16
+BAND_RANGE = (40.0, 8000.0)
+SEGMENTS = 8
+FLOOR_DB = -60.0
+
+# Block weights in the final vector (chroma, band means, band spread, envelope)
+WEIGHTS = (1.0, 1.0, 0.5, 0.5)
+
+# LSH layout and the default cosine similarity that counts as a duplicate
+TABLES = 8
+BITS = 12
+SEED = 1729
+DUPLICATE_SIMILARITY = 0.97
+
+# Pruned clips are moved into this folder next to the candidates
+DUPLICATES_DIR_NAME = "duplicates"
+
+
+def load_mono(path: Path) -> np.ndarray:
+    """WAV as mono float32 at FINGERPRINT_RATE."""
+    rate, samples = wavfile.read(str(path))
+    if samples.dtype.kind in "iu":
+        info = np.iinfo(samples.dtype)
+        samples = (samples.astype(np.float32) - (info.max + info.min + 1) / 2) / (info.max + 1)
+    samples = np.asarray(samples, dtype=np.float32)
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    if rate != FINGERPRINT_RATE:
+        g = gcd(int(rate), FINGERPRINT_RATE)
+        samples = resample_poly(samples, FINGERPRINT_RATE // g, int(rate) // g).astype(np.float32)
+    return samples
+
+
+def stft_power(samples: np.ndarray) -> np.ndarray:
+    """Power spectrogram, shape (frames, FRAME // 2 + 1)."""
+    if len(samples) < FRAME:
+        samples = np.pad(samples, (0, FRAME - len(samples)))
+    frames = np.lib.stride_tricks.sliding_window_view(samples, FRAME)[::HOP]
+    return np.abs(np.fft.rfft(frames * np.hanning(FRAME), axis=1)) ** 2
+
+
+def _filterbanks():
+    """(bins, 12) chroma and (bins, BANDS) band matrices for the STFT bins."""
+    freqs = np.fft.rfftfreq(FRAME, 1.0 / FINGERPRINT_RATE)
+
+    chroma = np.zeros((len(freqs), 12), dtype=np.float32)
+    audible = (freqs >= CHROMA_RANGE[0]) & (freqs <= CHROMA_RANGE[1])
+    pitch_class = (np.round(12 * np.log2(freqs[audible] / 440.0)).astype(int) + 9) % 12
+    chroma[np.flatnonzero(audible), pitch_class] = 1.0
+
+    edges = np.geomspace(BAND_RANGE[0], BAND_RANGE[1], BANDS + 1)
+    band = np.clip(np.searchsorted(edges, freqs, side="right") - 1, -1, BANDS)
+    bands = np.zeros((len(freqs), BANDS), dtype=np.float32)
+    inside = (band >= 0) & (band < BANDS)
+    bands[np.flatnonzero(inside), band[inside]] = 1.0
+    return chroma, bands
+
+
+CHROMA_MATRIX, BAND_MATRIX = _filterbanks()
+
+
+def _unit(block: np.ndarray) -> np.ndarray:
+    """Centre a feature block and scale it to unit length (zeros stay zeros)."""
+    block = block - block.mean()
+    norm = np.linalg.norm(block)
+    return block / norm if norm > 1e-9 else np.zeros_like(block)
+
+
+def fingerprint(samples: np.ndarray) -> np.ndarray:
+    """Unit-length fingerprint vector of mono FINGERPRINT_RATE samples."""
+    power = stft_power(samples)
+
+    chroma = (power @ CHROMA_MATRIX).mean(axis=0)
+    chroma = chroma / max(chroma.sum(), 1e-12)
+
+    # Levels are floored relative to the clip's peak so near-silent tails
+    # (exact zeros vs. a faint noise floor) do not dominate the comparison
+    band_db = 10 * np.log10(power @ BAND_MATRIX + 1e-20)
+    band_db = np.maximum(band_db, band_db.max() + FLOOR_DB)
+    band_mean, band_spread = band_db.mean(axis=0), band_db.std(axis=0)
+
+    frame_db = 10 * np.log10(power.sum(axis=1) + 1e-20)
+    frame_db = np.maximum(frame_db, frame_db.max() + FLOOR_DB)
+    if len(frame_db) < SEGMENTS:
+        frame_db = np.repeat(frame_db, -(-SEGMENTS // len(frame_db)))
+    envelope = np.array([s.mean() for s in np.array_split(frame_db, SEGMENTS)]) - frame_db.max()
+
+    blocks = (chroma, band_mean, band_spread, envelope)
+    vector = np.concatenate([w * _unit(b) for w, b in zip(WEIGHTS, blocks)]).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 1e-9 else vector
+
+
+def file_fingerprint(path: Path) -> np.ndarray:
+    return fingerprint(load_mono(path))
+
+
+def _stamp(path: Path):
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+class FingerprintIndex:
+    """Persistent SimHash index of clip fingerprints."""
+
+    def __init__(self, path: Path = INDEX_PATH, threshold: float = DUPLICATE_SIMILARITY,
+                 tables: int = TABLES, bits: int = BITS, seed: int = SEED):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.tables = tables
+        self.bits = bits
+        dim = len(fingerprint(np.zeros(FRAME, dtype=np.float32)))
+        self.planes = np.random.default_rng(seed).standard_normal((tables, bits, dim)).astype(np.float32)
+        self.seed = seed
+
+        self.paths = []
+        self.stamps = []
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.keys = np.zeros((0, tables), dtype=np.uint32)
+        self.buckets = [{} for _ in range(tables)]
+        self._load()
+
+    # -- persistence ---------------------------------------------------------
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        data = np.load(self.path, allow_pickle=False)
+        layout = (INDEX_VERSION, self.tables, self.bits, self.seed, self.vectors.shape[1])
+        if tuple(int(v) for v in data["layout"]) != layout:
+            return  # settings changed: start over
+        self.paths = [Path(p) for p in data["paths"]]
+        self.stamps = [tuple(int(v) for v in s) for s in data["stamps"]]
+        self.vectors = data["vectors"]
+        self.keys = data["keys"]
+        self._rebuild_buckets()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            self.path,
+            layout=np.array([INDEX_VERSION, self.tables, self.bits, self.seed, self.vectors.shape[1]]),
+            paths=np.array([str(p) for p in self.paths], dtype=str),
+            stamps=np.array(self.stamps, dtype=np.int64).reshape(-1, 2),
+            vectors=self.vectors,
+            keys=self.keys,
+        )
+
+    # -- hashing -------------------------------------------------------------
+
+    def hash_keys(self, vectors: np.ndarray) -> np.ndarray:
+        """Bucket key per table for each vector, shape (n, tables)."""
+        bits = np.einsum("tbd,nd->ntb", self.planes, np.atleast_2d(vectors)) > 0
+        return (bits.astype(np.uint32) << np.arange(self.bits, dtype=np.uint32)).sum(axis=2, dtype=np.uint32)
+
+    def _rebuild_buckets(self):
+        self.buckets = [{} for _ in range(self.tables)]
+        for i, row in enumerate(self.keys):
+            for table, key in enumerate(row):
+                self.buckets[table].setdefault(int(key), []).append(i)
+
+    # -- queries -------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.paths)
+
+    def query(self, clip, k: int = 1, exclude: Path = None):
+        """
+        Nearest indexed clips to `clip` (a path or fingerprint vector).
+
+        Returns up to k (path, cosine similarity) pairs, best first.
+        """
+        vector = file_fingerprint(Path(clip)) if isinstance(clip, (str, Path)) else np.asarray(clip, dtype=np.float32)
+        if not self.paths:
+            return []
+        candidates = self._bucket_candidates(self.hash_keys(vector)[0])
+        if exclude is not None:
+            excluded = Path(exclude).resolve()
+            candidates = {i for i in candidates if self.paths[i] != excluded}
+        if len(candidates) < k:
+            # Too few collisions: fall back to a linear scan so the nearest clips are always found
+            candidates = {i for i, p in enumerate(self.paths) if exclude is None or p != Path(exclude).resolve()}
+        if not candidates:
+            return []
+
+        order = np.fromiter(candidates, dtype=np.int64)
+        similarity = self.vectors[order] @ vector
+        best = np.argsort(-similarity)[:k]
+        return [(self.paths[order[i]], float(similarity[i])) for i in best]
+
+    def _bucket_candidates(self, keys) -> set:
+        """Indices sharing a bucket with `keys` (one key per table) in any table."""
+        return {i for table, key in enumerate(keys) for i in self.buckets[table].get(int(key), ())}
+
+    def duplicates(self):
+        """
+        (kept, duplicate, similarity) for every pair at or above the threshold; the older file is kept.
+
+        Only clips sharing an LSH bucket are compared, so the sweep stays far
+        below n^2 comparisons. At the default threshold a true pair collides
+        in at least one table about 98% of the time.
+        """
+        pairs = []
+        for i, path in enumerate(self.paths):
+            others = sorted(j for j in self._bucket_candidates(self.keys[i]) if j > i)
+            if not others:
+                continue
+            similarity = self.vectors[others] @ self.vectors[i]
+            for j, value in zip(others, similarity):
+                if value < self.threshold:
+                    continue
+                other = self.paths[j]
+                if (self.stamps[j][1], str(other)) < (self.stamps[i][1], str(path)):
+                    pairs.append((other, path, float(value)))
+                else:
+                    pairs.append((path, other, float(value)))
+        return pairs
+
+    # -- updates -------------------------------------------------------------
+
+    def add(self, path: Path):
+        """
+        Fingerprint and index a file (re-using the stored vector if unchanged).
+
+        Returns the nearest other indexed clip as (path, similarity), or None.
+        """
+        path = Path(path).resolve()
+        stamp = _stamp(path)
+        if path in self.paths:
+            i = self.paths.index(path)
+            if self.stamps[i] == stamp:
+                match = self.query(self.vectors[i], exclude=path)
+                return match[0] if match else None
+            self.remove(path)
+
+        vector = file_fingerprint(path)
+        match = self.query(vector, exclude=path)
+
+        self.paths.append(path)
+        self.stamps.append(stamp)
+        self.vectors = np.vstack([self.vectors, vector[None]])
+        keys = self.hash_keys(vector)
+        self.keys = np.vstack([self.keys, keys])
+        for table, key in enumerate(keys[0]):
+            self.buckets[table].setdefault(int(key), []).append(len(self.paths) - 1)
+        return match[0] if match else None
+
+    def remove(self, path: Path):
+        path = Path(path).resolve()
+        if path not in self.paths:
+            return
+        i = self.paths.index(path)
+        del self.paths[i], self.stamps[i]
+        self.vectors = np.delete(self.vectors, i, axis=0)
+        self.keys = np.delete(self.keys, i, axis=0)
+        self._rebuild_buckets()
+
+    def sync(self, paths):
+        """Index `paths`, dropping entries whose files are gone. Returns the number fingerprinted."""
+        wanted = {Path(p).resolve() for p in paths}
+        for stale in [p for p in self.paths if p not in wanted or not p.exists()]:
+            self.remove(stale)
+        fresh = 0
+        for path in sorted(wanted):
+            if path not in self.paths or self.stamps[self.paths.index(path)] != _stamp(path):
+                self.add(path)
+                fresh += 1
+        return fresh
+
+
+def candidate_files(root: Path) -> list:
+    """WAVs under root, skipping clips already pruned into a duplicates folder."""
+    return sorted(p.resolve() for p in Path(root).rglob("*.wav") if DUPLICATES_DIR_NAME not in p.relative_to(root).parts)
+
+
+def move_clip(path: Path, directory: Path) -> Path:
+    """Move a clip (and its stored codes, if any) into `directory`."""
+    path = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / path.name
+    shutil.move(str(path), target)
+    codes = codes_path_for(path)
+    if codes.exists():
+        shutil.move(str(codes), directory / codes.name)
+    return target
+
+
+def check_new_clip(index: FingerprintIndex, path: Path, prune_dir: Path = None) -> bool:
+    """
+    Index a freshly written clip and report its nearest earlier clip.
+
+    A near-duplicate is moved to `prune_dir` (and left out of the index)
+    when one is given. Returns True for a near-duplicate.
+    """
+    match = index.add(path)
+    if match is None:
+        index.save()
+        return False
+
+    nearest, similarity = match
+    duplicate = similarity >= index.threshold
+    print(f"  {'Near-duplicate of' if duplicate else 'Nearest clip'}: {nearest.name} (similarity {similarity:.3f})")
+    if duplicate and prune_dir is not None:
+        index.remove(path)
+        print(f"  Pruned to: {move_clip(path, prune_dir)}")
+    index.save()
+    return duplicate
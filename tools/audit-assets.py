@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Asset Budget Auditor
+====================
+
+Walks assets/ and reports what each file costs the game:
+- download: compressed bytes on disk
+- GPU: estimated texture memory for images (width x height x 4, RGBA8)
+- PCM: estimated decoded audio memory (Web Audio keeps float32 samples per
+  channel at the AudioContext rate)
+
+It also finds duplicates:
+- byte-identical files (SHA-256)
+- near-identical images (64-bit difference hash, Hamming distance)
+- near-identical audio (log band-energy envelope correlation; needs
+  `soundfile` or ffmpeg to decode compressed formats, WAV always works)
+
+Every file and category total is checked against BUDGETS, and the exit code
+is 1 if anything is over budget (or --strict and duplicates were found), so
+the audit can gate a build.
+
+Audio lengths come from container headers (MP3 frame scan, Ogg granule
+positions, WAV headers), so PCM estimates need no decoder.
+
+Files are inspected in parallel worker processes.
+
+Usage:
+    python audit-assets.py                     # audit ../assets
+    python audit-assets.py --json report.json --strict
+    python audit-assets.py --budgets budgets.json
+
+Requirements:
+    pip install numpy scipy pillow
+    optional: soundfile or ffmpeg on PATH (audio fingerprints for MP3/OGG)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import scipy.io.wavfile as wavfile
+from PIL import Image
+
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+ROOT_DIR = Path(__file__).parent.parent
+ASSETS_DIR = ROOT_DIR / "assets"
+
+KB = 1024
+MB = 1024 * 1024
+
+# Per-category limits: file_* apply to each file, total_* to the category sum
+BUDGETS = {
+    "texture": {"file_bytes": 1 * MB, "file_gpu_bytes": 16 * MB, "total_bytes": 8 * MB, "total_gpu_bytes": 64 * MB},
+    "music": {"file_bytes": 4 * MB, "file_pcm_bytes": 64 * MB, "total_bytes": 16 * MB, "total_pcm_bytes": 192 * MB},
+    "sfx": {"file_bytes": 128 * KB, "file_pcm_bytes": 4 * MB, "total_bytes": 4 * MB, "total_pcm_bytes": 64 * MB},
+    "data": {"file_bytes": 512 * KB, "total_bytes": 2 * MB},
+    "font": {"file_bytes": 512 * KB, "total_bytes": 2 * MB},
+    "other": {"file_bytes": 1 * MB},
+}
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".ogg", ".opus", ".flac", ".m4a"}
+DATA_EXTENSIONS = {".json", ".bin", ".xml", ".csv", ".txt"}
+FONT_EXTENSIONS = {".ttf", ".otf", ".woff", ".woff2", ".fnt"}
+SKIPPED_NAMES = {".gitkeep", "README.md"}
+
+# Image near-duplicates: max differing bits of the 64-bit dHash, and max mean
+# per-channel difference of 8x8 colour thumbnails (dHash alone ignores hue,
+# so zone recolours of one tileset would match)
+IMAGE_HASH_DISTANCE = 2
+IMAGE_COLOR_DISTANCE = 8
+
+# Audio near-duplicates: fingerprint sample rate, frame size, bands, and the
+# minimum correlation / maximum duration difference to call two clips the same
+FINGERPRINT_RATE = 8000
+FINGERPRINT_FRAME = 256
+FINGERPRINT_BANDS = 16
+AUDIO_MATCH_CORRELATION = 0.98
+AUDIO_MATCH_DURATION = 0.05
+
+# MPEG audio tables: bitrates (kbps) by [version][layer][index], sample rates by [version][index]
+MPEG_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+MPEG_SAMPLE_RATES = {1: [44100, 48000, 32000], 2: [22050, 24000, 16000], 2.5: [11025, 12000, 8000]}
+
+
+def category(path: Path) -> str:
+    """Budget category from extension and folder."""
+    ext = path.suffix.lower()
+    if ext in IMAGE_EXTENSIONS:
+        return "texture"
+    if ext in AUDIO_EXTENSIONS:
+        return "music" if "music" in path.parts else "sfx"
+    if ext in DATA_EXTENSIONS:
+        return "data"
+    if ext in FONT_EXTENSIONS:
+        return "font"
+    return "other"
+
+
+# =============================================================================
+# AUDIO HEADERS
+# =============================================================================
+
+def mp3_info(data: bytes):
+    """(sample_rate, channels, frames) from an MPEG audio frame scan."""
+    pos = 0
+    if data[:3] == b"ID3":
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        pos = 10 + size + (10 if data[5] & 0x10 else 0)
+
+    sample_rate = channels = None
+    samples = 0
+    first = True
+    while pos + 4 <= len(data):
+        header = struct.unpack(">I", data[pos:pos + 4])[0]
+        if header >> 21 != 0x7FF:
+            if data[pos:pos + 3] == b"TAG":
+                break
+            pos += 1
+            continue
+
+        version = {3: 1, 2: 2, 0: 2.5}.get((header >> 19) & 3)
+        layer = 4 - ((header >> 17) & 3)
+        bitrate_index = (header >> 12) & 0xF
+        rate_index = (header >> 10) & 3
+        if version is None or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+            pos += 1
+            continue
+
+        bitrate = MPEG_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+        rate = MPEG_SAMPLE_RATES[version][rate_index]
+        padding = (header >> 9) & 1
+        if layer == 1:
+            length = (12 * bitrate // rate + padding) * 4
+            frame_samples = 384
+        else:
+            per_frame = 144 if (layer == 2 or version == 1) else 72
+            length = per_frame * bitrate // rate + padding
+            frame_samples = 1152 if (layer == 2 or version == 1) else 576
+
+        # A leading Xing/Info frame carries metadata, not audio
+        if first and (b"Xing" in data[pos:pos + 64] or b"Info" in data[pos:pos + 64]):
+            first = False
+            pos += length
+            continue
+
+        first = False
+        sample_rate = rate
+        channels = 1 if (header >> 6) & 3 == 3 else 2
+        samples += frame_samples
+        pos += max(length, 1)
+
+    return sample_rate, channels, samples
+
+
+def ogg_info(data: bytes):
+    """(sample_rate, channels, frames) from Vorbis/Opus headers and the last granule position."""
+    last = data.rfind(b"OggS")
+    granule = struct.unpack("<q", data[last + 6:last + 14])[0] if last >= 0 else 0
+
+    vorbis = data.find(b"\x01vorbis")
+    if vorbis >= 0:
+        channels = data[vorbis + 11]
+        rate = struct.unpack("<I", data[vorbis + 12:vorbis + 16])[0]
+        return rate, channels, max(granule, 0)
+
+    opus = data.find(b"OpusHead")
+    if opus >= 0:
+        channels = data[opus + 9]
+        pre_skip = struct.unpack("<H", data[opus + 10:opus + 12])[0]
+        return 48000, channels, max(granule - pre_skip, 0)
+
+    return None, None, 0
+
+
+def audio_info(path: Path):
+    """(sample_rate, channels, frames) without decoding, or Nones if unknown."""
+    ext = path.suffix.lower()
+    if ext == ".wav":
+        rate, data = wavfile.read(str(path), mmap=True)
+        return rate, 1 if data.ndim == 1 else data.shape[1], data.shape[0]
+
+    data = path.read_bytes()
+    if ext == ".mp3":
+        return mp3_info(data)
+    if ext in (".ogg", ".opus"):
+        return ogg_info(data)
+    if soundfile is not None:
+        try:
+            info = soundfile.info(str(path))
+            return info.samplerate, info.channels, info.frames
+        except RuntimeError:
+            pass
+    return None, None, 0
+
+
+def decode_mono(path: Path):
+    """Mono float32 at FINGERPRINT_RATE, or None if no decoder is available."""
+    samples = None
+    rate = FINGERPRINT_RATE
+    if path.suffix.lower() == ".wav":
+        rate, samples = wavfile.read(str(path))
+    elif soundfile is not None:
+        try:
+            samples, rate = soundfile.read(str(path), dtype="float32")
+        except RuntimeError:
+            samples = None
+    if samples is None and shutil.which("ffmpeg"):
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", str(path), "-f", "f32le", "-ac", "1", "-ar", str(FINGERPRINT_RATE), "-"],
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            samples = np.frombuffer(result.stdout, dtype="<f4")
+    if samples is None:
+        return None
+
+    if samples.dtype.kind == "i":
+        samples = samples.astype(np.float32) / np.iinfo(samples.dtype).max
+    samples = np.asarray(samples, dtype=np.float32)
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    if rate != FINGERPRINT_RATE:
+        from scipy.signal import resample_poly
+        from math import gcd
+        g = gcd(int(rate), FINGERPRINT_RATE)
+        samples = resample_poly(samples, FINGERPRINT_RATE // g, int(rate) // g).astype(np.float32)
+    return samples
+
+
+def audio_fingerprint(samples: np.ndarray) -> np.ndarray:
+    """Log band energies per frame, shape (frames, FINGERPRINT_BANDS)."""
+    frames = len(samples) // FINGERPRINT_FRAME
+    if frames == 0:
+        return np.zeros((0, FINGERPRINT_BANDS), dtype=np.float32)
+    blocks = samples[:frames * FINGERPRINT_FRAME].reshape(frames, FINGERPRINT_FRAME)
+    spectrum = np.abs(np.fft.rfft(blocks * np.hanning(FINGERPRINT_FRAME), axis=1)) ** 2
+    bands = np.array_split(spectrum[:, 1:], FINGERPRINT_BANDS, axis=1)
+    energy = np.stack([b.sum(axis=1) for b in bands], axis=1)
+    return np.log10(energy + 1e-9).astype(np.float32)
+
+
+# =============================================================================
+# IMAGES
+# =============================================================================
+
+def image_dhash(image: Image.Image) -> int:
+    """64-bit difference hash: brightness gradients of a 9x8 thumbnail."""
+    small = np.asarray(image.convert("L").resize((9, 8), Image.LANCZOS), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int("".join("1" if b else "0" for b in bits), 2)
+
+
+def image_thumbnail(image: Image.Image) -> list:
+    """8x8 RGB thumbnail for the colour check."""
+    return np.asarray(image.convert("RGB").resize((8, 8), Image.BOX), dtype=np.uint8).flatten().tolist()
+
+
+# =============================================================================
+# AUDIT
+# =============================================================================
+
+def inspect(path_str: str) -> dict:
+    """Worker: everything the report needs about one file."""
+    path = Path(path_str)
+    data = path.read_bytes()
+    entry = {
+        "path": path.relative_to(ROOT_DIR).as_posix(),
+        "category": category(path),
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+    if entry["category"] == "texture":
+        with Image.open(path) as image:
+            width, height = image.size
+            entry["width"], entry["height"] = width, height
+            entry["gpu_bytes"] = width * height * 4
+            entry["dhash"] = image_dhash(image)
+            entry["thumbnail"] = image_thumbnail(image)
+
+    elif entry["category"] in ("music", "sfx"):
+        rate, channels, frames = audio_info(path)
+        entry["sample_rate"], entry["channels"], entry["frames"] = rate, channels, frames
+        entry["duration"] = frames / rate if rate else None
+        samples = decode_mono(path)
+        entry["fingerprint"] = audio_fingerprint(samples).tolist() if samples is not None else None
+
+    return entry
+
+
+def find_files(root: Path):
+    return sorted(p for p in root.rglob("*") if p.is_file() and p.name not in SKIPPED_NAMES)
+
+
+def exact_duplicates(entries):
+    groups = {}
+    for e in entries:
+        groups.setdefault(e["sha256"], []).append(e["path"])
+    return [paths for paths in groups.values() if len(paths) > 1]
+
+
+def image_duplicates(entries):
+    images = [e for e in entries if "dhash" in e]
+    pairs = []
+    for i, a in enumerate(images):
+        for b in images[i + 1:]:
+            if a["sha256"] == b["sha256"]:
+                continue
+            if abs(a["width"] / a["height"] - b["width"] / b["height"]) > 0.05:
+                continue
+            distance = bin(a["dhash"] ^ b["dhash"]).count("1")
+            color = np.abs(np.array(a["thumbnail"], dtype=np.int16) - np.array(b["thumbnail"], dtype=np.int16)).mean()
+            if distance <= IMAGE_HASH_DISTANCE and color <= IMAGE_COLOR_DISTANCE:
+                pairs.append({"a": a["path"], "b": b["path"], "distance": distance})
+    return pairs
+
+
+def audio_duplicates(entries):
+    clips = [e for e in entries if e.get("fingerprint")]
+    pairs = []
+    for i, a in enumerate(clips):
+        for b in clips[i + 1:]:
+            if a["sha256"] == b["sha256"]:
+                continue
+            fa, fb = np.array(a["fingerprint"]), np.array(b["fingerprint"])
+            longest = max(len(fa), len(fb))
+            if longest == 0 or abs(len(fa) - len(fb)) / longest > AUDIO_MATCH_DURATION:
+                continue
+            n = min(len(fa), len(fb))
+            x, y = fa[:n].ravel(), fb[:n].ravel()
+            if x.std() == 0 or y.std() == 0:
+                continue
+            correlation = float(np.corrcoef(x, y)[0, 1])
+            if correlation >= AUDIO_MATCH_CORRELATION:
+                pairs.append({"a": a["path"], "b": b["path"], "correlation": round(correlation, 4)})
+    return pairs
+
+
+def pcm_bytes(entry, context_rate):
+    """Decoded size as a float32 AudioBuffer at the context rate."""
+    if not entry.get("sample_rate"):
+        return None
+    frames = entry["frames"] * context_rate / entry["sample_rate"]
+    return int(frames * entry["channels"] * 4)
+
+
+def check_budgets(entries, budgets):
+    """Budget violations as (scope, metric, value, limit)."""
+    violations = []
+    totals = {}
+    for e in entries:
+        limits = budgets.get(e["category"], {})
+        total = totals.setdefault(e["category"], {"bytes": 0, "gpu_bytes": 0, "pcm_bytes": 0})
+        for metric in ("bytes", "gpu_bytes", "pcm_bytes"):
+            value = e.get(metric)
+            if value is None:
+                continue
+            total[metric] += value
+            limit = limits.get(f"file_{metric}")
+            if limit is not None and value > limit:
+                violations.append((e["path"], metric, value, limit))
+
+    for name, total in totals.items():
+        for metric, value in total.items():
+            limit = budgets.get(name, {}).get(f"total_{metric}")
+            if limit is not None and value > limit:
+                violations.append((f"[{name}]", metric, value, limit))
+    return violations, totals
+
+
+def human(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit asset sizes, decode cost and duplicates")
+    parser.add_argument("root", nargs="?", type=Path, default=ASSETS_DIR, help="asset directory")
+    parser.add_argument("--budgets", type=Path, help="JSON file overriding BUDGETS per category")
+    parser.add_argument("--context-rate", type=int, default=44100, help="AudioContext sample rate for PCM estimates")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--json", type=Path, help="write the full report to this file")
+    parser.add_argument("--strict", action="store_true", help="also fail when duplicates are found")
+    args = parser.parse_args()
+
+    budgets = {k: dict(v) for k, v in BUDGETS.items()}
+    if args.budgets:
+        with open(args.budgets) as f:
+            for name, limits in json.load(f).items():
+                budgets.setdefault(name, {}).update(limits)
+
+    files = find_files(args.root)
+    print(f"Auditing {len(files)} files in {args.root}...")
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        entries = list(pool.map(inspect, [str(p) for p in files]))
+
+    for e in entries:
+        if e["category"] in ("music", "sfx"):
+            e["pcm_bytes"] = pcm_bytes(e, args.context_rate)
+
+    print(f"\n{'file':<58} {'category':<8} {'download':>10} {'gpu':>10} {'pcm':>10}")
+    for e in sorted(entries, key=lambda e: (e["category"], -e["bytes"])):
+        print(f"{e['path']:<58} {e['category']:<8} {human(e['bytes']):>10} "
+              f"{human(e.get('gpu_bytes')):>10} {human(e.get('pcm_bytes')):>10}")
+
+    violations, totals = check_budgets(entries, budgets)
+    print(f"\n{'category':<10} {'download':>10} {'gpu':>10} {'pcm':>10}")
+    for name, total in sorted(totals.items()):
+        print(f"{name:<10} {human(total['bytes']):>10} {human(total['gpu_bytes'] or None):>10} "
+              f"{human(total['pcm_bytes'] or None):>10}")
+
+    exact = exact_duplicates(entries)
+    similar_images = image_duplicates(entries)
+    similar_audio = audio_duplicates(entries)
+    undecoded = [e["path"] for e in entries if e["category"] in ("music", "sfx") and e.get("fingerprint") is None]
+
+    print("\nDuplicates:")
+    for paths in exact:
+        print(f"  identical: {', '.join(paths)}")
+    for pair in similar_images:
+        print(f"  similar images: {pair['a']} ~ {pair['b']} ({pair['distance']} bits)")
+    for pair in similar_audio:
+        print(f"  similar audio: {pair['a']} ~ {pair['b']} (r={pair['correlation']})")
+    if not (exact or similar_images or similar_audio):
+        print("  none")
+    if undecoded:
+        print(f"  ({len(undecoded)} audio files not fingerprinted: install soundfile or ffmpeg)")
+
+    print("\nBudgets:")
+    for scope, metric, value, limit in violations:
+        print(f"  OVER {scope}: {metric} {human(value)} > {human(limit)}")
+    if not violations:
+        print("  all within budget")
+
+    if args.json:
+        for e in entries:
+            e.pop("fingerprint", None)
+            e.pop("thumbnail", None)
+            if "dhash" in e:
+                e["dhash"] = f"{e['dhash']:016x}"
+        report = {
+            "files": entries,
+            "totals": totals,
+            "duplicates": {"identical": exact, "similarImages": similar_images, "similarAudio": similar_audio},
+            "violations": [{"scope": s, "metric": m, "value": v, "limit": l} for s, m, v, l in violations],
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved report to: {args.json}")
+
+    if violations or (args.strict and (exact or similar_images or similar_audio)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+47-tile blob autotiling shared by the tileset generators.
+
+A tile's neighbourhood is an 8-bit mask of which neighbours are the same
+terrain, clockwise from north:
+
+    NW=128  N=1  NE=2
+    W=64    .    E=4
+    SW=32   S=16 SE=8
+
+A corner bit only matters when both edges next to it are set (otherwise
+the corner is already covered by an edge), which reduces the 256 masks to
+47 distinct tiles. BLOB_MASKS lists them in frame order and LUT maps every
+raw mask to its frame offset, so the game needs one table lookup per tile.
+
+Two sets are built per tileset, both by vectorized compositing of per-pixel
+masks for all 47 tiles at once:
+- walls:   the base wall tile with rims facing open floor (highlight on the
+           north rim, dark rim elsewhere), a darker notch at inner corners,
+           and floor showing through cut outer corners
+- shadows: transparent overlays for floor tiles, using the floor_shadow_n
+           gradient along walls to the north, a softer band along the other
+           sides and a quarter-disc at inner corners
+
+Output of write_lut: assets/data/autotile.json, loaded by PreloadScene into
+Autotile.
+"""
+
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+# Neighbour bits, clockwise from north: (bit, dx, dy)
+NEIGHBOURS = [
+    (1, 0, -1), (2, 1, -1), (4, 1, 0), (8, 1, 1),
+    (16, 0, 1), (32, -1, 1), (64, -1, 0), (128, -1, -1),
+]
+N, NE, E, SE, S, SW, W, NW = (bit for bit, _, _ in NEIGHBOURS)
+
+# Corner bit -> the two edge bits it needs
+CORNERS = {NE: (N, E), SE: (S, E), SW: (S, W), NW: (N, W)}
+
+# Rim / shadow sizes in pixels (16x16 tiles)
+RIM = 2
+CORNER_CUT = 2
+NORTH_SHADOW = 5
+SIDE_SHADOW = 4
+CORNER_SHADOW = 4
+
+
+def reduce_mask(mask: int) -> int:
+    """Drop corner bits whose adjacent edges are not both set."""
+    for corner, (a, b) in CORNERS.items():
+        if not (mask & a and mask & b):
+            mask &= ~corner
+    return mask
+
+
+BLOB_MASKS = sorted({reduce_mask(m) for m in range(256)})
+LUT = [BLOB_MASKS.index(reduce_mask(m)) for m in range(256)]
+assert len(BLOB_MASKS) == 47
+
+# Frame offset of the tile for a fully surrounded cell
+SOLID = BLOB_MASKS.index(255)
+
+
+def _open_flags(tile_size):
+    """Per-tile booleans (47, 1, 1) for each direction: neighbour is NOT the same terrain."""
+    masks = np.array(BLOB_MASKS).reshape(-1, 1, 1)
+    return {bit: (masks & bit) == 0 for bit, _, _ in NEIGHBOURS}
+
+
+def _distances(tile_size):
+    """Pixel distances to the north, south, west and east edges, shape (1, T, T)."""
+    y, x = np.mgrid[0:tile_size, 0:tile_size]
+    return y[None], (tile_size - 1 - y)[None], x[None], (tile_size - 1 - x)[None]
+
+
+def build_wall_tiles(wall: Image.Image, floor: Image.Image, palette: dict) -> np.ndarray:
+    """
+    Composite the 47 wall tiles, shape (47, T, T, 4).
+
+    `wall` and `floor` are the base tiles; `palette` needs wall_top,
+    wall_dark and wall_mortar.
+    """
+    tile_size = wall.width
+    wall_px = np.asarray(wall.convert('RGBA'), dtype=np.uint8)
+    floor_px = np.asarray(floor.convert('RGBA'), dtype=np.uint8)
+    is_open = _open_flags(tile_size)
+    dn, ds, dw, de = _distances(tile_size)
+
+    # Outer corners: both edges open -> floor shows through a diagonal cut
+    cut = np.zeros((len(BLOB_MASKS), tile_size, tile_size), dtype=bool)
+    inner = np.zeros_like(cut)
+    for corner, (a, b) in CORNERS.items():
+        da = dn if a == N else ds
+        db = de if b == E else dw
+        cut |= is_open[a] & is_open[b] & (da + db < CORNER_CUT)
+        # Inner corners: both edges closed but the diagonal open
+        inner |= ~is_open[a] & ~is_open[b] & is_open[corner] & (da < RIM) & (db < RIM)
+
+    north_rim = is_open[N] & (dn < RIM)
+    dark_rim = (is_open[S] & (ds < RIM)) | (is_open[W] & (dw < RIM)) | (is_open[E] & (de < RIM))
+
+    tiles = np.broadcast_to(wall_px, cut.shape + (4,)).copy()
+    tiles[dark_rim] = (*palette['wall_dark'][:3], 255)
+    tiles[north_rim] = (*palette['wall_top'][:3], 255)
+    tiles[inner] = (*palette['wall_mortar'][:3], 255)
+    tiles[cut] = np.broadcast_to(floor_px, tiles.shape)[cut]
+    return tiles
+
+
+def build_shadow_tiles(shadow_color, tile_size: int = 16) -> np.ndarray:
+    """
+    Composite the 47 floor shadow overlays, shape (47, T, T, 4).
+
+    Alpha is the strongest of the north gradient (the floor_shadow_n
+    primitive: 150 - 30 per row), the side bands and inner-corner discs.
+    """
+    is_open = _open_flags(tile_size)
+    dn, ds, dw, de = _distances(tile_size)
+
+    alpha = np.zeros((len(BLOB_MASKS), tile_size, tile_size))
+    alpha = np.maximum(alpha, np.where(is_open[N] & (dn < NORTH_SHADOW), 150 - 30 * dn, 0))
+    for bit, distance in ((S, ds), (W, dw), (E, de)):
+        alpha = np.maximum(alpha, np.where(is_open[bit] & (distance < SIDE_SHADOW), 100 - 25 * distance, 0))
+    for corner, (a, b) in CORNERS.items():
+        da = dn if a == N else ds
+        db = de if b == E else dw
+        radius = np.hypot(da + 0.5, db + 0.5)
+        disc = ~is_open[a] & ~is_open[b] & is_open[corner] & (radius < CORNER_SHADOW)
+        alpha = np.maximum(alpha, np.where(disc, 100 - 25 * radius, 0))
+
+    tiles = np.zeros(alpha.shape + (4,), dtype=np.uint8)
+    tiles[..., :3] = shadow_color[:3]
+    tiles[..., 3] = np.clip(alpha, 0, 255).astype(np.uint8)
+    return tiles
+
+
+def paste_tiles(tileset: Image.Image, tiles: np.ndarray, first_frame: int, columns: int):
+    """Paste (n, T, T, 4) tiles into consecutive frames starting at first_frame."""
+    tile_size = tiles.shape[1]
+    for i, tile in enumerate(tiles):
+        frame = first_frame + i
+        position = ((frame % columns) * tile_size, (frame // columns) * tile_size)
+        tileset.paste(Image.fromarray(tile, 'RGBA'), position)
+
+
+def write_lut(path: str, wall_start: int, shadow_start: int):
+    """Write the mask -> frame table the game loads."""
+    data = {
+        "neighbourBits": {"n": N, "ne": NE, "e": E, "se": SE, "s": S, "sw": SW, "w": W, "nw": NW},
+        "wallStart": wall_start,
+        "shadowStart": shadow_start,
+        "solid": SOLID,
+        "masks": BLOB_MASKS,
+        "lut": LUT,
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+    print(f"Saved autotile table to: {path}")
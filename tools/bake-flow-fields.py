@@ -0,0 +1,208 @@
+"""
+Precompute navigation flow fields for every room template.
+Enemies steering straight at the player get stuck on interior walls, and
+live pathfinding per enemy per frame is too expensive, so this tool solves
+every room offline and stores the answers as uint8 grids.
+
+Rooms are solved on the standard 11x9 grid GameScene draws (see
+standard_room.py), so tile (x, y) of a field is tile (x, y) of the rendered
+room. For each room in assets/data/rooms/index.json, fields are built toward:
+- each of the four door gaps createStandardRoom can open (the wall centers);
+  which ones are open depends on the dungeon graph, so each door field is
+  solved with only its own gap walkable and never routes through another
+- every cell of a coarse grid (COARSE_CELL x COARSE_CELL tiles), using the
+  walkable tile closest to the cell center as the goal, solved with all
+  gaps closed
+
+Each field stores, per tile:
+- distance: path cost to the goal (orthogonal step = 2, diagonal = 3), 255 = unreachable
+- flow: index into DIRECTIONS of the next step toward the goal, 8 = goal, 255 = none
+
+All goals of a room are solved at once by relaxing a (goals, H, W) distance
+array with NumPy shifts until it converges (a vectorized Bellman-Ford, which
+matches Dijkstra on these small grids).
+
+Output: assets/data/flowfields.json (fields base64-encoded, goal-major, row-major)
+"""
+
+import base64
+import json
+import os
+
+import numpy as np
+
+from standard_room import DOOR_DIRECTIONS, door_tile, standardize
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+ROOMS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'rooms', 'index.json')
+OUTPUT_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'flowfields.json')
+
+# Tiles enemies cannot walk through (wall, pit, torch; see RoomComponent.ts)
+BLOCKING_TILES = (1, 3, 8)
+
+# Coarse goal grid size in tiles
+COARSE_CELL = 3
+
+# Neighbour offsets (dx, dy); order shared with FlowFieldRegistry.ts
+DIRECTIONS = [(0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)]
+STEP_COST = [2, 3, 2, 3, 2, 3, 2, 3]
+
+UNREACHABLE = 255
+AT_GOAL = 8
+NO_FLOW = 255
+
+
+def load_rooms():
+    """Load room templates from the room index."""
+    with open(ROOMS_PATH) as f:
+        return json.load(f)['rooms']
+
+
+def shift(grid, dx, dy, fill):
+    """Value of each tile's neighbour at (x + dx, y + dy); `fill` outside the grid."""
+    out = np.full_like(grid, fill)
+    h, w = grid.shape[-2:]
+    src_y = slice(max(dy, 0), h + min(dy, 0))
+    dst_y = slice(max(-dy, 0), h + min(-dy, 0))
+    src_x = slice(max(dx, 0), w + min(dx, 0))
+    dst_x = slice(max(-dx, 0), w + min(-dx, 0))
+    out[..., dst_y, dst_x] = grid[..., src_y, src_x]
+    return out
+
+
+def step_allowed(walkable):
+    """
+    Per direction, whether a step from each tile is legal.
+
+    Diagonal steps may not cut wall corners: both orthogonal tiles they pass
+    between must be walkable too.
+    """
+    allowed = []
+    for dx, dy in DIRECTIONS:
+        ok = walkable & shift(walkable, dx, dy, False)
+        if dx != 0 and dy != 0:
+            ok &= shift(walkable, dx, 0, False) & shift(walkable, 0, dy, False)
+        allowed.append(ok)
+    return allowed
+
+
+def solve(walkable, goals):
+    """
+    Distance and flow fields toward each goal tile.
+
+    `goals` is a list of (x, y). Returns (distance, flow), both uint8 arrays
+    of shape (len(goals), H, W).
+    """
+    h, w = walkable.shape
+    big = np.iinfo(np.int32).max // 2
+    dist = np.full((len(goals), h, w), big, dtype=np.int32)
+    for i, (gx, gy) in enumerate(goals):
+        dist[i, gy, gx] = 0
+
+    allowed = step_allowed(walkable)
+    while True:
+        best = dist
+        for (dx, dy), cost, ok in zip(DIRECTIONS, STEP_COST, allowed):
+            candidate = np.where(ok, shift(dist, dx, dy, big) + cost, big)
+            best = np.minimum(best, candidate)
+        if np.array_equal(best, dist):
+            break
+        dist = best
+
+    # Flow: the legal neighbour with the lowest distance (ties keep DIRECTIONS order)
+    neighbour = np.stack([
+        np.where(ok, shift(dist, dx, dy, big) + cost, big)
+        for (dx, dy), cost, ok in zip(DIRECTIONS, STEP_COST, allowed)
+    ])
+    flow = np.argmin(neighbour, axis=0).astype(np.uint8)
+    reachable = (dist < big) & walkable
+    flow[~reachable | (neighbour.min(axis=0) >= big)] = NO_FLOW
+    flow[dist == 0] = AT_GOAL
+
+    distance = np.where(reachable, np.minimum(dist, UNREACHABLE - 1), UNREACHABLE).astype(np.uint8)
+    return distance, flow
+
+
+def room_goals(tiles, walkable):
+    """Build the goal list: door goals first, then coarse grid cells."""
+    height, width = tiles.shape
+    goals = []
+
+    # Every door gap the standard room can open, open or not in this template
+    for direction in DOOR_DIRECTIONS:
+        x, y = door_tile(direction, width, height)
+        goals.append({"type": "door", "direction": direction, "x": x, "y": y})
+
+    # Coarse cells; cells without any walkable tile get no goal
+    cells_x = -(-width // COARSE_CELL)
+    cells_y = -(-height // COARSE_CELL)
+    ys, xs = np.mgrid[0:height, 0:width]
+    cell_goals = np.full((cells_y, cells_x), -1, dtype=np.int32)
+    for cy in range(cells_y):
+        for cx in range(cells_x):
+            block = (xs // COARSE_CELL == cx) & (ys // COARSE_CELL == cy) & walkable
+            if not block.any():
+                continue
+            center_x = min(cx * COARSE_CELL + COARSE_CELL / 2, width) - 0.5
+            center_y = min(cy * COARSE_CELL + COARSE_CELL / 2, height) - 0.5
+            d = np.where(block, (xs - center_x) ** 2 + (ys - center_y) ** 2, np.inf)
+            gy, gx = np.unravel_index(np.argmin(d), d.shape)
+            cell_goals[cy, cx] = len(goals)
+            goals.append({"type": "cell", "cx": cx, "cy": cy, "x": int(gx), "y": int(gy)})
+
+    return goals, cell_goals
+
+
+def encode(array):
+    return base64.b64encode(np.ascontiguousarray(array, dtype=np.uint8).tobytes()).decode('ascii')
+
+
+def main():
+    """Bake flow fields for every room template."""
+    print("Baking navigation flow fields...")
+
+    output = {
+        "coarseCell": COARSE_CELL,
+        "directions": DIRECTIONS,
+        "rooms": {},
+    }
+
+    total_bytes = 0
+    for room in load_rooms():
+        tiles = standardize(room)
+        walkable = ~np.isin(tiles, BLOCKING_TILES)
+        goals, cell_goals = room_goals(tiles, walkable)
+
+        fields = []
+        for goal in goals:
+            if goal["type"] != "door":
+                continue
+            # Only this door's gap is walkable
+            door_walkable = walkable.copy()
+            door_walkable[goal["y"], goal["x"]] = True
+            fields.append(solve(door_walkable, [(goal["x"], goal["y"])]))
+        cells = [(g["x"], g["y"]) for g in goals if g["type"] == "cell"]
+        fields.append(solve(walkable, cells))
+        distance = np.concatenate([d for d, _ in fields])
+        flow = np.concatenate([f for _, f in fields])
+
+        output["rooms"][room['id']] = {
+            "width": tiles.shape[1],
+            "height": tiles.shape[0],
+            "doors": {g["direction"]: i for i, g in enumerate(goals) if g["type"] == "door"},
+            "cellGoals": cell_goals.tolist(),
+            "flow": encode(flow),
+            "distance": encode(distance),
+        }
+        total_bytes += flow.nbytes + distance.nbytes
+        print(f"  {room['id']}: {len(goals)} goals, {flow.nbytes + distance.nbytes} bytes")
+
+    with open(OUTPUT_PATH, 'w') as f:
+        json.dump(output, f, separators=(',', ':'))
+
+    print(f"Saved flow fields to: {OUTPUT_PATH} ({total_bytes} bytes of fields)")
+
+
+if __name__ == '__main__':
+    main()
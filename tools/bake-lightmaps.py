@@ -0,0 +1,185 @@
+"""
+Bake per-room torch lightmaps.
+Reads every room template from assets/data/rooms/index.json and pre-computes
+torch lighting as one small additive texture per room and zone, replacing the
+per-torch glow circles GameScene otherwise blends at runtime.
+
+Rooms are baked on the standard 11x9 grid GameScene actually draws (see
+standard_room.py), not at the template's own size, so the texels line up
+with the rendered tiles and torches cropped away by the standard room do not
+light it. Door gaps are baked closed: they only change the contact shadow
+under the gap.
+
+Lighting model (all vectorized with NumPy, per texel):
+- Radial falloff from each torch tile (8): intensity * (1 - d / radius)^2
+- Wall occlusion: light is blocked when the straight line from the torch
+  to the texel passes through a wall tile
+- Contact shadow: floor texels just below a wall get less light, matching
+  the wall_bottom / floor_shadow_n transition tiles
+
+Output:
+- assets/sprites/lightmaps/<zone>-<room_id>.png  (RGB light, drawn with ADD)
+- assets/data/lightmaps.json                      (per lightmap the torches it was baked
+                                                   with; GameScene only skips its live
+                                                   glows when they match the rendered room)
+"""
+
+from PIL import Image
+import numpy as np
+import json
+import os
+
+from standard_room import STANDARD_HEIGHT, STANDARD_WIDTH, standardize
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+ROOMS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'rooms', 'index.json')
+OUTPUT_DIR = os.path.join(ROOT_DIR, 'assets', 'sprites', 'lightmaps')
+MANIFEST_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'lightmaps.json')
+
+# Lightmap resolution (texels per tile); upscaled with linear filtering in-game
+TEXELS_PER_TILE = 8
+
+# Tile ids (see RoomComponent.ts)
+WALL = 1
+TORCH = 8
+SOLID_TILES = (WALL, TORCH)
+
+# Torch light shape, in tiles
+TORCH_RADIUS = 4.0
+TORCH_INTENSITY = 0.45
+
+# Samples along each torch -> texel ray for the occlusion test
+OCCLUSION_SAMPLES = 48
+
+# Contact shadow below walls (fraction of light removed at the wall edge, and depth in tiles)
+CONTACT_SHADOW = 0.5
+CONTACT_DEPTH = 0.35
+
+# Torch light color per zone (matches ZoneManager zone ids)
+ZONE_LIGHTS = {
+    'catacombs': (255, 136, 68),        # Warm orange (the runtime glow color 0xff8844)
+    'library': (255, 170, 90),          # Candle yellow
+    'crystal_caves': (120, 190, 255),   # Cold crystal blue
+    'forge_depths': (255, 96, 40),      # Forge red
+}
+
+
+def load_rooms():
+    """Load room templates from the room index."""
+    with open(ROOMS_PATH) as f:
+        return json.load(f)['rooms']
+
+
+def texel_centers(width, height):
+    """Texel centers in tile units, shape (height * T, width * T, 2) as (x, y)."""
+    xs = (np.arange(width * TEXELS_PER_TILE) + 0.5) / TEXELS_PER_TILE
+    ys = (np.arange(height * TEXELS_PER_TILE) + 0.5) / TEXELS_PER_TILE
+    gx, gy = np.meshgrid(xs, ys)
+    return gx, gy
+
+
+def torch_visibility(solid, torch_x, torch_y, gx, gy):
+    """
+    Fraction of each texel visible from a torch (0 or 1).
+
+    Samples points along every torch -> texel segment at once and checks the
+    tile grid; the torch's own tile and the texel's own tile never block, so
+    wall faces catch light but the walls behind them do not.
+    """
+    height, width = solid.shape
+    t = np.linspace(0.0, 1.0, OCCLUSION_SAMPLES)[:, None, None]
+    sx = torch_x + (gx[None] - torch_x) * t
+    sy = torch_y + (gy[None] - torch_y) * t
+    tx = np.clip(sx.astype(np.int64), 0, width - 1)
+    ty = np.clip(sy.astype(np.int64), 0, height - 1)
+
+    own_torch = (tx == int(torch_x)) & (ty == int(torch_y))
+    own_texel = (tx == gx.astype(np.int64)[None]) & (ty == gy.astype(np.int64)[None])
+    blocked = solid[ty, tx] & ~own_torch & ~own_texel
+    return ~blocked.any(axis=0)
+
+
+def contact_shadow(solid, gx, gy):
+    """Light multiplier darkening floor texels right below a wall."""
+    height, width = solid.shape
+    tx = gx.astype(np.int64)
+    ty = gy.astype(np.int64)
+    above = np.zeros_like(solid)
+    above[1:] = solid[:-1]
+    wall_above = above[ty, tx] & ~solid[ty, tx]
+    depth = gy - ty
+    fade = np.clip(1.0 - depth / CONTACT_DEPTH, 0.0, 1.0)
+    return 1.0 - CONTACT_SHADOW * fade * wall_above
+
+
+def bake_room(tiles):
+    """Bake the light intensity (H*T, W*T) for a tile grid, or None if unlit."""
+    torches = np.argwhere(tiles == TORCH)
+    if len(torches) == 0:
+        return None
+
+    solid = np.isin(tiles, SOLID_TILES)
+    height, width = tiles.shape
+    gx, gy = texel_centers(width, height)
+
+    light = np.zeros(gx.shape)
+    for ty, tx in torches:
+        cx, cy = tx + 0.5, ty + 0.5
+        dist = np.hypot(gx - cx, gy - cy)
+        falloff = np.clip(1.0 - dist / TORCH_RADIUS, 0.0, 1.0) ** 2
+        light += TORCH_INTENSITY * falloff * torch_visibility(solid, cx, cy, gx, gy)
+
+    return np.clip(light, 0.0, 1.0) * contact_shadow(solid, gx, gy)
+
+
+def room_zones(room):
+    """Zones a room can be rendered in (rooms without a zone appear everywhere)."""
+    zone = room.get('zone')
+    return [zone] if zone in ZONE_LIGHTS else list(ZONE_LIGHTS)
+
+
+def main():
+    """Bake lightmaps for every lit room and zone."""
+    print("Baking room lightmaps...")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    manifest = {
+        "texelsPerTile": TEXELS_PER_TILE,
+        "blendMode": "ADD",
+        "lightmaps": [],
+    }
+
+    for room in load_rooms():
+        tiles = standardize(room)
+        light = bake_room(tiles)
+        if light is None:
+            continue
+        torches = [[int(x), int(y)] for y, x in np.argwhere(tiles == TORCH)]
+
+        for zone in room_zones(room):
+            color = np.array(ZONE_LIGHTS[zone], dtype=np.float64)
+            rgb = (light[..., None] * color).round().astype(np.uint8)
+            filename = f"{zone}-{room['id']}.png"
+            Image.fromarray(rgb, 'RGB').save(os.path.join(OUTPUT_DIR, filename))
+
+            manifest["lightmaps"].append({
+                "key": f"lightmap-{zone}-{room['id']}",
+                "room": room['id'],
+                "zone": zone,
+                "path": f"assets/sprites/lightmaps/{filename}",
+                "width": STANDARD_WIDTH,
+                "height": STANDARD_HEIGHT,
+                "torches": torches,
+            })
+            print(f"  {filename} ({rgb.shape[1]}x{rgb.shape[0]})")
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Saved manifest to: {MANIFEST_PATH}")
+    print(f"Baked {len(manifest['lightmaps'])} lightmaps")
+
+
+if __name__ == '__main__':
+    main()
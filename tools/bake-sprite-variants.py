@@ -0,0 +1,181 @@
+"""
+Bake outline, hit-flash and elemental tint variants of character sprites.
+Reads the sprites under assets/sprites/{enemies, items, projectiles,
+player/rotations} and writes each one as a spritesheet with the effect
+variants appended as extra frames, so the game swaps frames instead of
+re-tinting or running a post-FX pass per sprite.
+
+Every variant is computed for all frames of a sheet at once with NumPy:
+- outline: 4-neighbour dilation of the alpha mask inside each frame; the
+  ring of new pixels is filled with OUTLINE_COLOR (pickup highlight)
+- flash:   every visible pixel white, alpha kept (hit flash, what
+  setTintFill(0xffffff) would draw)
+- <element>: the element color from Element.ts at each pixel's luminance, mixed
+  with the original at TINT_STRENGTH (burning, frozen, ... status looks)
+
+Sheet layout: the original sheet first, then one block per variant stacked
+below it in VARIANTS order. A block has the same columns as the source, so
+frame `f` of variant `v` is `v * frames + f`, and frames 0..frames-1 are the
+untouched originals (the baked sheet is a drop-in for the source sheet).
+
+Output:
+- assets/sprites/variants/<folder>-<name>.png
+- assets/data/sprite-variants.json   (manifest loaded by PreloadScene)
+"""
+
+import json
+import os
+import re
+
+import numpy as np
+from PIL import Image
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+SPRITES_DIR = os.path.join(ROOT_DIR, 'assets', 'sprites')
+ELEMENTS_PATH = os.path.join(ROOT_DIR, 'src', 'magic', 'elements', 'Element.ts')
+OUTPUT_DIR = os.path.join(SPRITES_DIR, 'variants')
+MANIFEST_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'sprite-variants.json')
+
+# Source folders: (folder under assets/sprites, texture key prefix, frame size)
+# Keys match the placeholder / spriteKey names the game already uses
+# (enemy_slime, item_coin, spell_fireball, wizard-south). A frame size of
+# None, or one that does not divide the image, treats the image as one frame.
+SOURCES = [
+    ('enemies', 'enemy_', 16),
+    ('enemies/bosses', 'boss_', 32),
+    ('items', 'item_', 16),
+    ('projectiles', 'spell_', 16),
+    ('player/rotations', 'wizard-', None),
+]
+
+# Effect settings
+ALPHA_THRESHOLD = 128
+OUTLINE_COLOR = (255, 255, 255)
+TINT_STRENGTH = 0.6
+
+
+def load_element_colors():
+    """Element id -> RGB, parsed from ELEMENT_PROPERTIES in Element.ts."""
+    with open(ELEMENTS_PATH) as f:
+        source = f.read()
+    ids = dict(re.findall(r"^\s*(\w+) = '(\w+)',", source, re.M))
+    colors = re.findall(r"\[MagicElement\.(\w+)\]: \{[^}]*?color: 0x([0-9a-fA-F]{6})", source)
+    if not colors:
+        raise RuntimeError("No element colors found in Element.ts")
+    return {ids[name]: tuple(int(value[i:i + 2], 16) for i in (0, 2, 4)) for name, value in colors}
+
+
+def split_frames(pixels, frame_w, frame_h):
+    """(H, W, 4) sheet -> (rows, cols, frame_h, frame_w, 4) frames."""
+    rows, cols = pixels.shape[0] // frame_h, pixels.shape[1] // frame_w
+    return pixels.reshape(rows, frame_h, cols, frame_w, 4).swapaxes(1, 2)
+
+
+def join_frames(frames):
+    rows, cols, frame_h, frame_w, _ = frames.shape
+    return frames.swapaxes(1, 2).reshape(rows * frame_h, cols * frame_w, 4)
+
+
+def outline(frames):
+    """Frames with a 1px outline around every opaque region."""
+    solid = frames[..., 3] >= ALPHA_THRESHOLD
+    grown = solid.copy()
+    # Shifts stay inside each frame (the frame axes are the last two)
+    grown[..., 1:, :] |= solid[..., :-1, :]
+    grown[..., :-1, :] |= solid[..., 1:, :]
+    grown[..., :, 1:] |= solid[..., :, :-1]
+    grown[..., :, :-1] |= solid[..., :, 1:]
+    ring = grown & ~solid
+
+    result = frames.copy()
+    result[ring] = (*OUTLINE_COLOR, 255)
+    return result
+
+
+def flash(frames):
+    """Frames with every visible pixel white."""
+    result = frames.copy()
+    result[..., :3] = np.where(frames[..., 3:] > 0, 255, frames[..., :3])
+    return result
+
+
+def tint(frames, color):
+    """Frames tinted toward an element color, keeping their shading."""
+    weights = np.array([0.299, 0.587, 0.114])
+    rgb = frames[..., :3].astype(np.float64)
+    # The element color scaled to each pixel's luminance (a "color" blend,
+    # so dark elements do not just darken the sprite)
+    color = np.array(color, dtype=np.float64)
+    tinted = (rgb @ weights)[..., None] * color / max(color @ weights, 1.0)
+    mixed = rgb * (1 - TINT_STRENGTH) + tinted * TINT_STRENGTH
+    result = frames.copy()
+    result[..., :3] = np.clip(mixed.round(), 0, 255).astype(np.uint8)
+    return result
+
+
+def find_sources():
+    """(folder, key prefix, frame size, path) for every sprite to bake."""
+    for folder, prefix, frame_size in SOURCES:
+        directory = os.path.join(SPRITES_DIR, *folder.split('/'))
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith('.png'):
+                yield folder, prefix, frame_size, os.path.join(directory, filename)
+
+
+def main():
+    """Bake variant sheets for every sprite found."""
+    print("Baking sprite variants...")
+
+    elements = load_element_colors()
+    variants = ['base', 'outline', 'flash'] + list(elements)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    manifest = {"variants": variants, "sheets": []}
+    written = set()
+
+    for folder, prefix, frame_size, path in find_sources():
+        name = os.path.splitext(os.path.basename(path))[0]
+        pixels = np.asarray(Image.open(path).convert('RGBA'), dtype=np.uint8)
+        height, width = pixels.shape[:2]
+
+        frame_w, frame_h = (frame_size, frame_size) if frame_size else (width, height)
+        if width % frame_w or height % frame_h:
+            print(f"  {folder}/{name}.png: {width}x{height} is not a multiple of {frame_size}, using one frame")
+            frame_w, frame_h = width, height
+
+        frames = split_frames(pixels, frame_w, frame_h)
+        blocks = [frames, outline(frames), flash(frames)] + [tint(frames, elements[e]) for e in elements]
+        sheet = np.concatenate([join_frames(block) for block in blocks], axis=0)
+
+        filename = f"{folder.replace('/', '-')}-{name}.png"
+        written.add(filename)
+        Image.fromarray(sheet, 'RGBA').save(os.path.join(OUTPUT_DIR, filename), optimize=True)
+
+        manifest["sheets"].append({
+            "key": f"variants-{prefix}{name}",
+            "source": f"{prefix}{name}",
+            "path": f"assets/sprites/variants/{filename}",
+            "frameWidth": frame_w,
+            "frameHeight": frame_h,
+            "frames": frames.shape[0] * frames.shape[1],
+        })
+        print(f"  {filename} ({sheet.shape[1]}x{sheet.shape[0]}, "
+              f"{frames.shape[0] * frames.shape[1]} frames x {len(variants)} variants)")
+
+    # Sheets whose source art is gone (or no longer baked) would still be shipped
+    for filename in sorted(os.listdir(OUTPUT_DIR)):
+        if filename.endswith('.png') and filename not in written:
+            os.remove(os.path.join(OUTPUT_DIR, filename))
+            print(f"  Removed stale sheet: {filename}")
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Saved manifest to: {MANIFEST_PATH}")
+    print(f"Baked {len(manifest['sheets'])} sprite sheets")
+
+
+if __name__ == '__main__':
+    main()
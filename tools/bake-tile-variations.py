@@ -0,0 +1,184 @@
+"""
+Precompute the floor/wall tile variation frames GameScene picks with its
+position hash, so rendering reads a byte instead of hashing every tile.
+
+getFloorTileVariation / getWallTileVariation (GameScene.ts) are ported
+with exact JavaScript number semantics:
+- `^` and `>>` convert their operands with ToInt32 (wrap to signed 32-bit)
+- `*` is a float64 multiply: the product of an int32 and 0x85ebca6b is
+  rounded to the nearest double before the next ToInt32 sees it
+- `&` and `%` on the final non-negative 16-bit value are plain integer ops
+
+Output (uint8 arrays, base64, row-major):
+- floor / wall: frame for every (x, y) in a width x height table covering
+  every room template and MAX_ROOM_WIDTH x MAX_ROOM_HEIGHT; frames depend
+  only on the position, so resized rooms can use it too
+- rooms: per template, the frame each tile gets (wall frame for wall and
+  torch tiles, floor frame otherwise), for pre-baking tools
+
+--check runs the original TypeScript functions under node and compares
+them against the port over the table and a set of negative / large
+coordinates; a mismatch exits with status 1.
+
+Usage:
+    python bake-tile-variations.py
+    python bake-tile-variations.py --check
+
+Output: assets/data/tile-variations.json
+"""
+
+import argparse
+import base64
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+ROOMS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'rooms', 'index.json')
+GAME_SCENE_PATH = os.path.join(ROOT_DIR, 'src', 'scenes', 'GameScene.ts')
+OUTPUT_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'tile-variations.json')
+
+# Room size limits (Constants.ts)
+MAX_ROOM_WIDTH = 15
+MAX_ROOM_HEIGHT = 15
+
+# Tiles rendered as walls (wall, torch)
+WALL_TILES = (1, 8)
+
+# Hash constants (GameScene.ts)
+FLOOR_PRIMES = (73, 37)
+WALL_PRIMES = (59, 97)
+MIX_1 = 0x85ebca6b
+MIX_2 = 0xc2b2ae35
+FLOOR_FRAMES = 16
+WALL_FIRST_FRAME = 16
+WALL_FRAMES = 8
+
+# Extra coordinates compared by --check
+CHECK_COORDS = [(-1, -1), (-7, 3), (5, -9), (1000, 77), (-4096, 4096), (65535, 65537), (123456, -654321)]
+
+
+def to_int32(value: int) -> int:
+    """ECMAScript ToInt32 of an integral value."""
+    value &= 0xFFFFFFFF
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+def js_mul(a: int, b: int) -> int:
+    """`a * b` in JavaScript: the exact product rounded to float64 (still integral here)."""
+    return int(float(a * b))
+
+
+def mix(hash_value: int) -> int:
+    """The shared xor-shift / multiply rounds; `hash_value` is already ToInt32'd."""
+    hash_value = js_mul(to_int32(hash_value) >> 16 ^ to_int32(hash_value), MIX_1)
+    hash_value = js_mul(to_int32(hash_value) >> 16 ^ to_int32(hash_value), MIX_2)
+    return (to_int32(hash_value) >> 16 ^ to_int32(hash_value)) & 0xFFFF
+
+
+def floor_variation(grid_x: int, grid_y: int) -> int:
+    """getFloorTileVariation: frames 0-15."""
+    a, b = FLOOR_PRIMES
+    return mix(to_int32(js_mul(grid_x, a)) ^ to_int32(js_mul(grid_y, b))) % FLOOR_FRAMES
+
+
+def wall_variation(grid_x: int, grid_y: int) -> int:
+    """getWallTileVariation: frames 16-23."""
+    a, b = WALL_PRIMES
+    return WALL_FIRST_FRAME + mix(to_int32(js_mul(grid_x, a)) ^ to_int32(js_mul(grid_y, b))) % WALL_FRAMES
+
+
+def variation_table(func, width, height):
+    return np.array([[func(x, y) for x in range(width)] for y in range(height)], dtype=np.uint8)
+
+
+def encode(grid: np.ndarray) -> str:
+    return base64.b64encode(np.ascontiguousarray(grid, dtype=np.uint8).tobytes()).decode('ascii')
+
+
+def extract_method(source: str, name: str) -> str:
+    """Body of a GameScene method as a plain JS function."""
+    match = re.search(rf'private {name}\(gridX: number, gridY: number\): number \{{(.*?)\n  \}}', source, re.S)
+    if not match:
+        raise RuntimeError(f"{name} not found in GameScene.ts")
+    return f"function {name}(gridX, gridY) {{{match.group(1)}\n}}"
+
+
+def check_parity(coords) -> list:
+    """Run the TypeScript hashes under node; returns mismatch messages."""
+    if shutil.which('node') is None:
+        raise RuntimeError("--check needs node on PATH")
+    with open(GAME_SCENE_PATH) as f:
+        source = f.read()
+    script = "\n".join([
+        # Force the hash path (the methods read this table first once baked)
+        "const TileVariations = { floor: () => undefined, wall: () => undefined };",
+        extract_method(source, 'getFloorTileVariation'),
+        extract_method(source, 'getWallTileVariation'),
+        f"const coords = {json.dumps(coords)};",
+        "console.log(JSON.stringify(coords.map(([x, y]) => [getFloorTileVariation(x, y), getWallTileVariation(x, y)])));",
+    ])
+    result = subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True)
+    expected = json.loads(result.stdout)
+
+    failures = []
+    for (x, y), (floor, wall) in zip(coords, expected):
+        got = (floor_variation(x, y), wall_variation(x, y))
+        if got != (floor, wall):
+            failures.append(f"({x}, {y}): python {got}, typescript {(floor, wall)}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake tile variation frames")
+    parser.add_argument("--check", action="store_true", help="compare against GameScene.ts under node, write nothing")
+    args = parser.parse_args()
+
+    with open(ROOMS_PATH) as f:
+        rooms = json.load(f)['rooms']
+
+    width = max([MAX_ROOM_WIDTH] + [room['width'] for room in rooms])
+    height = max([MAX_ROOM_HEIGHT] + [room['height'] for room in rooms])
+
+    if args.check:
+        coords = [(x, y) for y in range(height) for x in range(width)] + CHECK_COORDS
+        failures = check_parity(coords)
+        if failures:
+            for failure in failures[:20]:
+                print(f"  MISMATCH {failure}")
+            print(f"{len(failures)} of {len(coords)} coordinates differ")
+            sys.exit(1)
+        print(f"Parity OK: {len(coords)} coordinates match GameScene.ts")
+        return
+
+    floor = variation_table(floor_variation, width, height)
+    wall = variation_table(wall_variation, width, height)
+
+    room_frames = {}
+    for room in rooms:
+        tiles = np.array(room['tiles'])
+        h, w = tiles.shape
+        frames = np.where(np.isin(tiles, WALL_TILES), wall[:h, :w], floor[:h, :w])
+        room_frames[room['id']] = encode(frames)
+
+    output = {
+        "width": width,
+        "height": height,
+        "floor": encode(floor),
+        "wall": encode(wall),
+        "rooms": room_frames,
+    }
+    with open(OUTPUT_PATH, 'w') as f:
+        json.dump(output, f, separators=(',', ':'))
+    print(f"Baked {width}x{height} variation table and {len(room_frames)} room grids")
+    print(f"Saved variations to: {OUTPUT_PATH} ({os.path.getsize(OUTPUT_PATH)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
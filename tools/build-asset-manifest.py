@@ -0,0 +1,341 @@
+"""
+Build the zone-scoped, content-hashed asset manifest.
+A run only ever visits one zone at a time (ZoneManager picks it per floor),
+so instead of PreloadScene loading every zone tileset, lightmap and prop
+before the menu appears, assets are grouped by when they are needed:
+
+- boot:   data the registries read at startup, menu music and the variant
+          sheets the menu shows (PreloadScene)
+- sfx:    UI sounds, either the individual files or the packed audio sprite
+          (PreloadScene picks one via USE_SFX_SPRITE)
+- shared: game assets every zone uses (fallback tileset, sprite variant
+          sheets, chest); loaded with the first zone
+- zones:  per zone its tileset, the baked lightmaps of its rooms and the
+          props its rooms contain; `prefetch` lists the zones that can come
+          up on the following floors, streamed in while the zone is played
+
+Sources scanned:
+- src/managers/ZoneManager.ts           zone ids, tileset keys, room types, floor ranges
+- tools/generate-zone-tilesets.py       zone palettes (a zone without one is reported)
+- assets/data/rooms/index.json          which rooms (and so which props) a zone can use
+- assets/data/lightmaps.json            baked lightmaps per zone and room
+- assets/data/sprite-variants.json      baked variant sheets
+- the asset tree, to report files no group references
+
+Every entry carries the first HASH_LENGTH hex digits of the file's sha256.
+By default URLs point at the source files with a `?v=<hash>` suffix, so
+changed files get new URLs and unchanged ones stay cached. --emit DIR copies
+each asset to a content-hashed filename (`tileset.3fa2c0d1e9.png`) under DIR
+(e.g. the build output) and writes the manifest there instead.
+
+Usage:
+    python build-asset-manifest.py
+    python build-asset-manifest.py --check        # exit 1 if the manifest is stale
+    python build-asset-manifest.py --emit dist
+
+Output: assets/data/asset-manifest.json (loaded by PreloadScene)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+ZONE_MANAGER_PATH = os.path.join(ROOT_DIR, 'src', 'managers', 'ZoneManager.ts')
+CONSTANTS_PATH = os.path.join(ROOT_DIR, 'src', 'config', 'Constants.ts')
+PALETTES_PATH = os.path.join(os.path.dirname(__file__), 'generate-zone-tilesets.py')
+ROOMS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'rooms', 'index.json')
+LIGHTMAPS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'lightmaps.json')
+SPRITE_VARIANTS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'sprite-variants.json')
+MANIFEST_PATH = os.path.join('assets', 'data', 'asset-manifest.json')
+
+HASH_LENGTH = 10
+TILE_SIZE = 16
+
+# Data read by the registries in PreloadScene.create: (key, loader type, path)
+BOOT_DATA = [
+    ('rooms', 'json', 'assets/data/rooms/index.packed.json'),
+    ('flowfields', 'json', 'assets/data/flowfields.json'),
+    ('lightmaps', 'json', 'assets/data/lightmaps.json'),
+    ('layout-bank', 'json', 'assets/data/layout-bank.json'),
+    ('layout-bank-data', 'binary', 'assets/data/layout-bank.bin'),
+    ('spells', 'json', 'assets/data/spells.json'),
+    ('enemies', 'json', 'assets/data/enemies.json'),
+    ('items', 'json', 'assets/data/items.json'),
+    ('loot-tables', 'json', 'assets/data/loot-tables.json'),
+    ('autotile', 'json', 'assets/data/autotile.json'),
+    ('tile-variations', 'json', 'assets/data/tile-variations.json'),
+    ('sprite-variants', 'json', 'assets/data/sprite-variants.json'),
+]
+
+# Menu music (the only track played before a run)
+BOOT_AUDIO = [
+    ('music_menu', 'assets/audio/music/menu.mp3'),
+]
+
+# Variant sheets MenuScene shows (character select portraits); the rest
+# go in the shared group
+MENU_VARIANT_SHEETS = ('variants-wizard-south',)
+
+# UI sounds: every sfx/<name>.mp3 is loaded as sfx_<name>; the packed sprite
+# (tools/pack-audio-sprite.py) replaces them when USE_SFX_SPRITE is on
+SFX_DIR = 'assets/audio/sfx'
+SFX_SPRITE_NAME = 'sfx-sprite'
+
+# Game assets independent of the zone
+SHARED_ASSETS = [
+    ('depths-tileset', 'spritesheet', 'assets/sprites/depths/tileset.png'),
+    ('depths-tilemap', 'json', 'assets/data/depths-tilemap.json'),
+    ('depths-chest', 'image', 'assets/sprites/depths/chest.png'),
+]
+
+# Props GameScene draws for a room tile id
+PROP_TILES = {
+    6: ('depths-barrel', 'assets/sprites/depths/barrel.png'),
+    8: ('depths-torch', 'assets/sprites/depths/torch.png'),
+}
+
+# Room types allowed in every zone (ZoneManager.filterRoomsForZone)
+ALWAYS_ROOM_TYPES = ('hub', 'start')
+
+# Files the game does not load (sources, previews, docs)
+IGNORED_SUFFIXES = ('.md', '-preview.png', '-metadata.json')
+IGNORED_FILES = {'.gitkeep', 'index.json', 'asset-manifest.json'}
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def load_zones():
+    """Zones from ZoneManager.initializeZones, in declaration order."""
+    zones = {}
+    for zone_id, body in re.findall(r"this\.zones\.set\('(\w+)',\s*\{(.*?)\}\);", read(ZONE_MANAGER_PATH), re.S):
+        zones[zone_id] = {
+            "tilesetKey": re.search(r"tilesetKey:\s*'([^']+)'", body).group(1),
+            "roomTypes": re.findall(r"'(\w+)'", re.search(r"roomTypes:\s*\[([^\]]*)\]", body).group(1)),
+            "minFloor": int(re.search(r"minFloor:\s*(\d+)", body).group(1)),
+            "maxFloor": int(re.search(r"maxFloor:\s*(\d+)", body).group(1)),
+        }
+    if not zones:
+        raise RuntimeError("No zones found in ZoneManager.ts")
+    return zones
+
+
+def load_palette_zones():
+    """Zone ids that have a palette in generate-zone-tilesets.py."""
+    block = re.search(r"ZONE_PALETTES = \{(.*?)\n\}", read(PALETTES_PATH), re.S)
+    return set(re.findall(r"^    '(\w+)': \{", block.group(1), re.M)) if block else set()
+
+
+def sfx_sprite_key():
+    match = re.search(r"SFX_SPRITE_KEY = '([^']+)'", read(CONSTANTS_PATH))
+    return match.group(1) if match else SFX_SPRITE_NAME
+
+
+def sprite_resources(json_path):
+    """Audio files listed in an audio-sprite JSON (pack-audio-sprite.py), project-relative."""
+    with open(os.path.join(ROOT_DIR, json_path)) as f:
+        resources = json.load(f).get('resources', [])
+    # Bare names were written for sprites packed outside the project
+    return [r if '/' in r else f"{os.path.dirname(json_path)}/{r}" for r in resources]
+
+
+def prefetch_zones(zone_id, zones):
+    """Zones that can be picked on the floors after this zone's first floor."""
+    zone = zones[zone_id]
+    floors = range(zone['minFloor'] + 1, zone['maxFloor'] + 2)
+    return [other for other, z in zones.items()
+            if other != zone_id and any(z['minFloor'] <= f <= z['maxFloor'] for f in floors)]
+
+
+def zone_rooms(zone_id, zone, rooms):
+    """Room templates that can appear in a zone."""
+    return [room for room in rooms
+            if room.get('zone') in (None, zone_id)
+            and (room['type'] in ALWAYS_ROOM_TYPES or room['type'] in zone['roomTypes'])]
+
+
+class ManifestBuilder:
+    """Hashes files and builds manifest entries, optionally emitting hashed copies."""
+
+    def __init__(self, emit_dir=None):
+        self.emit_dir = emit_dir
+        self.referenced = set()
+
+    def file_hash(self, path):
+        with open(os.path.join(ROOT_DIR, path), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+
+    def url(self, path, digest):
+        if self.emit_dir is None:
+            return f"{path}?v={digest}"
+        stem, ext = os.path.splitext(path)
+        hashed = f"{stem}.{digest}{ext}"
+        target = os.path.join(self.emit_dir, hashed)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(os.path.join(ROOT_DIR, path), target)
+        return hashed
+
+    def entry(self, key, kind, path, **extra):
+        full = os.path.join(ROOT_DIR, path)
+        if not os.path.exists(full):
+            print(f"  WARNING: {path} ({key}) is missing, skipped")
+            return None
+        self.referenced.add(os.path.normpath(path))
+        digest = self.file_hash(path)
+        entry = {"key": key, "type": kind, "url": self.url(path, digest), "hash": digest,
+                 "bytes": os.path.getsize(full)}
+        if kind == 'spritesheet':
+            entry["frameWidth"] = extra.pop('frameWidth', TILE_SIZE)
+            entry["frameHeight"] = extra.pop('frameHeight', TILE_SIZE)
+        entry.update(extra)
+        return entry
+
+    def entries(self, specs):
+        return [e for e in (self.entry(*spec) for spec in specs) if e is not None]
+
+    def audio_sprite(self, key, json_path, audio_paths):
+        sprite = self.entry(key, 'audioSprite', json_path)
+        if sprite is None:
+            return None
+        audio = [self.entry(key, 'audio', path) for path in audio_paths]
+        audio = [a for a in audio if a is not None]
+        if not audio:
+            return None
+        sprite["audio"] = [a["url"] for a in audio]
+        sprite["bytes"] += sum(a["bytes"] for a in audio)
+        return sprite
+
+
+def build_manifest(builder):
+    zones = load_zones()
+    palette_zones = load_palette_zones()
+    with open(ROOMS_PATH) as f:
+        rooms = json.load(f)['rooms']
+    with open(LIGHTMAPS_PATH) as f:
+        lightmaps = json.load(f)['lightmaps']
+    with open(SPRITE_VARIANTS_PATH) as f:
+        variant_sheets = json.load(f)['sheets']
+
+    boot = builder.entries(BOOT_DATA) + builder.entries((key, 'audio', path) for key, path in BOOT_AUDIO)
+
+    sfx_files = sorted(f for f in os.listdir(os.path.join(ROOT_DIR, SFX_DIR))
+                       if f.endswith('.mp3') and not f.startswith(SFX_SPRITE_NAME))
+    sfx = {
+        "files": builder.entries((f"sfx_{os.path.splitext(f)[0]}", 'audio', f"{SFX_DIR}/{f}") for f in sfx_files),
+        "sprite": None,
+    }
+    sprite_json = f"{SFX_DIR}/{SFX_SPRITE_NAME}.json"
+    if os.path.exists(os.path.join(ROOT_DIR, sprite_json)):
+        sfx["sprite"] = builder.audio_sprite(sfx_sprite_key(), sprite_json, sprite_resources(sprite_json))
+        if sfx["sprite"] is None:
+            print(f"  WARNING: {sprite_json} lists no existing audio, USE_SFX_SPRITE will load the individual files")
+
+    shared = builder.entries(SHARED_ASSETS)
+    for sheet in variant_sheets:
+        entry = builder.entry(sheet['key'], 'spritesheet', sheet['path'],
+                              frameWidth=sheet['frameWidth'], frameHeight=sheet['frameHeight'])
+        if entry is not None:
+            (boot if sheet['key'] in MENU_VARIANT_SHEETS else shared).append(entry)
+
+    zone_groups = {}
+    for zone_id, zone in zones.items():
+        if zone_id not in palette_zones:
+            print(f"  WARNING: zone {zone_id} has no palette in generate-zone-tilesets.py")
+        assets = builder.entries([(zone['tilesetKey'], 'spritesheet', f"assets/sprites/depths/{zone['tilesetKey']}.png")])
+
+        room_list = zone_rooms(zone_id, zone, rooms)
+        room_ids = {room['id'] for room in room_list}
+        assets += builder.entries((lm['key'], 'image', lm['path']) for lm in lightmaps
+                                  if lm['zone'] == zone_id and lm['room'] in room_ids)
+
+        used_tiles = {tile for room in room_list for row in room['tiles'] for tile in row}
+        assets += builder.entries((key, 'image', path) for tile, (key, path) in sorted(PROP_TILES.items())
+                                  if tile in used_tiles)
+
+        zone_groups[zone_id] = {
+            "floors": [zone['minFloor'], zone['maxFloor']],
+            "rooms": sorted(room_ids),
+            "assets": assets,
+            "prefetch": prefetch_zones(zone_id, zones),
+        }
+
+    return {
+        "version": 1,
+        "hashLength": HASH_LENGTH,
+        "boot": boot,
+        "sfx": sfx,
+        "shared": shared,
+        "zones": zone_groups,
+    }
+
+
+def unreferenced_files(referenced):
+    """Files under assets/ that no group loads."""
+    missing = []
+    for directory, _, files in os.walk(os.path.join(ROOT_DIR, 'assets')):
+        for filename in files:
+            if filename in IGNORED_FILES or filename.endswith(IGNORED_SUFFIXES):
+                continue
+            path = os.path.normpath(os.path.relpath(os.path.join(directory, filename), ROOT_DIR))
+            if path not in referenced:
+                missing.append(path)
+    return sorted(missing)
+
+
+def kb(entries):
+    return sum(e["bytes"] for e in entries) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the zone-scoped asset manifest")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the written manifest is out of date")
+    parser.add_argument("--emit", metavar="DIR", help="copy assets to content-hashed filenames under DIR")
+    args = parser.parse_args()
+
+    print("Building asset manifest...")
+    builder = ManifestBuilder(emit_dir=args.emit)
+    manifest = build_manifest(builder)
+
+    sfx_files = manifest["sfx"]["files"]
+    eager = kb(manifest["boot"]) + kb(sfx_files) + kb(manifest["shared"]) + sum(
+        kb(z["assets"]) for z in manifest["zones"].values())
+    print(f"  boot:   {len(manifest['boot'])} files, {kb(manifest['boot']):.1f} KB "
+          f"(+ {len(sfx_files)} sfx, {kb(sfx_files):.1f} KB)")
+    print(f"  shared: {len(manifest['shared'])} files, {kb(manifest['shared']):.1f} KB")
+    for zone_id, zone in manifest["zones"].items():
+        print(f"  {zone_id:<14} floors {zone['floors'][0]}-{zone['floors'][1]}: {len(zone['assets'])} files, "
+              f"{kb(zone['assets']):.1f} KB, prefetch {', '.join(zone['prefetch']) or '-'}")
+    before_menu = kb(manifest['boot']) + kb(sfx_files)
+    print(f"  before menu: {before_menu:.1f} KB of {eager:.1f} KB previously loaded up front")
+
+    unused = unreferenced_files(builder.referenced)
+    if unused:
+        print(f"  Not in any group ({len(unused)}): {', '.join(os.path.basename(p) for p in unused)}")
+
+    output_path = os.path.join(args.emit or ROOT_DIR, MANIFEST_PATH)
+    text = json.dumps(manifest, indent=2) + "\n"
+
+    if args.check:
+        current = read(output_path) if os.path.exists(output_path) else None
+        if current != text:
+            print(f"{MANIFEST_PATH} is out of date: run build-asset-manifest.py")
+            sys.exit(1)
+        print("Manifest is up to date")
+        return
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w') as f:
+        f.write(text)
+    print(f"Saved manifest to: {output_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Loot Table Compiler
+===================
+
+Compiles loot data into Walker/Vose alias tables so every drop roll in the
+game is O(1): one uniform column pick plus one fixed-point comparison,
+however many items and spells the pool holds.
+
+Sources:
+- enemies.json: each enemy's / boss's `loot` block (gold min/max, dropChance,
+  guaranteed drops), plus a chest source for treasure rooms
+- items.json and spells.json: every entry's `rarity`
+
+One table is built per source x zone x floor tier. Its outcomes are "no drop"
+(1 - dropChance) and every item/spell, with probability
+dropChance * P(rarity at this tier) / entries of that rarity, and entries of
+the zone's elements weighted up inside their rarity.
+
+Probabilities are fixed point: column thresholds are integers in
+[0, PROB_SCALE], built with integer arithmetic so the table is exact for the
+quantized weights.
+
+A verification pass samples every table (--samples rolls, vectorized) and
+fails if:
+- a quantized probability is further than QUANT_TOLERANCE from its target
+- an empirical frequency is more than --sigma standard errors off
+
+Usage:
+    python compile-loot-tables.py
+    python compile-loot-tables.py --samples 5000000 --binary
+
+Output:
+    assets/data/loot-tables.json   (loaded by PreloadScene into LootTableRegistry)
+    assets/data/loot-tables.bin    (--binary: the same tables as uint16 arrays)
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+DATA_DIR = os.path.join(ROOT_DIR, 'assets', 'data')
+ENEMIES_PATH = os.path.join(DATA_DIR, 'enemies.json')
+ITEMS_PATH = os.path.join(DATA_DIR, 'items.json')
+SPELLS_PATH = os.path.join(DATA_DIR, 'spells.json')
+OUTPUT_PATH = os.path.join(DATA_DIR, 'loot-tables.json')
+BINARY_PATH = os.path.join(DATA_DIR, 'loot-tables.bin')
+
+# Fixed-point scale for column thresholds (fits uint16)
+PROB_SCALE = 0xFFFF
+
+# Largest allowed gap between a quantized and a target probability
+QUANT_TOLERANCE = 1e-4
+
+# Floor tiers (inclusive floor ranges)
+FLOOR_TIERS = [(1, 2), (3, 4), (5, 6), (7, 8)]
+
+# Chance of each rarity class per floor tier (renormalized over classes
+# that have entries)
+RARITY_WEIGHTS = {
+    'common':    [60, 50, 40, 30],
+    'uncommon':  [30, 32, 32, 30],
+    'rare':      [9, 15, 22, 28],
+    'epic':      [1, 3, 6, 10],
+    'legendary': [0, 0, 0, 2],
+}
+
+# Zone element themes (ZoneManager zone ids); matching entries are weighted
+# up by ZONE_ELEMENT_BONUS inside their rarity class
+ZONE_ELEMENTS = {
+    'catacombs': ['shadow', 'light'],
+    'library': ['arcane'],
+    'crystal_caves': ['ice', 'lightning'],
+    'forge_depths': ['fire'],
+}
+ZONE_ELEMENT_BONUS = 1.5
+
+# Gold scales with depth
+GOLD_TIER_MULTIPLIER = [1.0, 1.25, 1.5, 2.0]
+
+# Treasure room chests always drop something
+CHEST_SOURCE = {"id": "chest", "loot": {"gold": {"min": 10, "max": 30}, "dropChance": 1.0}}
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_sources():
+    """Enemies, bosses and the chest, each with a loot block."""
+    data = load_json(ENEMIES_PATH)
+    return data['enemies'] + data.get('bosses', []) + [CHEST_SOURCE]
+
+
+def load_pool():
+    """Every droppable entry as (outcome id, rarity, element)."""
+    pool = []
+    for item in load_json(ITEMS_PATH)['items']:
+        pool.append((f"item:{item['id']}", item['rarity'], item.get('effect', {}).get('element')))
+    for spell in load_json(SPELLS_PATH)['spells']:
+        pool.append((f"spell:{spell['id']}", spell['rarity'], spell.get('element')))
+    return pool
+
+
+def drop_probabilities(pool, drop_chance, zone, tier):
+    """Target probability per outcome: index 0 is "no drop", then the pool in order."""
+    themed = ZONE_ELEMENTS.get(zone, [])
+    weights = np.array([ZONE_ELEMENT_BONUS if element in themed else 1.0 for _, _, element in pool])
+    rarities = [rarity for _, rarity, _ in pool]
+
+    present = sorted(set(rarities), key=list(RARITY_WEIGHTS).index)
+    class_weight = {r: RARITY_WEIGHTS[r][tier] for r in present}
+    total = sum(class_weight.values())
+
+    probs = np.zeros(len(pool) + 1)
+    probs[0] = 1.0 - drop_chance
+    for rarity in present:
+        members = np.array([r == rarity for r in rarities])
+        share = drop_chance * class_weight[rarity] / total
+        probs[1:][members] = share * weights[members] / weights[members].sum()
+    return probs
+
+
+def quantize(probs):
+    """
+    Integer weights summing to exactly len(probs) * PROB_SCALE.
+
+    Largest-remainder rounding keeps every weight within one unit of its
+    target.
+    """
+    n = len(probs)
+    total = n * PROB_SCALE
+    exact = probs / probs.sum() * total
+    weights = np.floor(exact).astype(np.int64)
+    remainder = total - weights.sum()
+    weights[np.argsort(-(exact - weights), kind='stable')[:remainder]] += 1
+    return weights
+
+
+def build_alias(weights):
+    """
+    Vose's alias method on integer weights (sum = n * PROB_SCALE).
+
+    Returns (threshold, alias): column i keeps outcome i when a uniform
+    integer in [0, PROB_SCALE) is below threshold[i], else takes alias[i].
+    """
+    n = len(weights)
+    scaled = weights.astype(np.int64).copy()
+    threshold = np.full(n, PROB_SCALE, dtype=np.int64)
+    alias = np.arange(n, dtype=np.int64)
+
+    small = [i for i in range(n) if scaled[i] < PROB_SCALE]
+    large = [i for i in range(n) if scaled[i] >= PROB_SCALE]
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        threshold[s] = scaled[s]
+        alias[s] = g
+        scaled[g] -= PROB_SCALE - scaled[s]
+        (small if scaled[g] < PROB_SCALE else large).append(g)
+    # With exact integer sums every leftover column is full
+    for i in small + large:
+        threshold[i] = PROB_SCALE
+    return threshold, alias
+
+
+def table_probabilities(threshold, alias):
+    """Exact outcome probabilities a (threshold, alias) table produces."""
+    n = len(threshold)
+    mass = threshold.astype(np.float64)
+    np.add.at(mass, alias, PROB_SCALE - threshold)
+    return mass / (n * PROB_SCALE)
+
+
+def sample(threshold, alias, count, rng):
+    """Vectorized alias sampling (what LootTableRegistry.roll does once)."""
+    column = rng.integers(0, len(threshold), count)
+    keep = rng.integers(0, PROB_SCALE, count) < threshold[column]
+    return np.where(keep, column, alias[column])
+
+
+def verify(tables, samples, sigma, rng):
+    """Check quantization error and empirical frequencies; returns failure messages."""
+    failures = []
+    worst_quant = 0.0
+    worst_sigma = 0.0
+    for key, table in tables.items():
+        threshold = np.array(table['threshold'])
+        alias = np.array(table['alias'])
+        target = np.array(table['_target'])
+        exact = table_probabilities(threshold, alias)
+
+        quant_error = np.abs(exact - target).max()
+        worst_quant = max(worst_quant, quant_error)
+        if quant_error > QUANT_TOLERANCE:
+            failures.append(f"{key}: quantization error {quant_error:.2e}")
+
+        counts = np.bincount(sample(threshold, alias, samples, rng), minlength=len(exact))
+        observed = counts / samples
+        stderr = np.sqrt(np.maximum(exact * (1 - exact), 1e-12) / samples)
+        z = np.abs(observed - exact) / stderr
+        worst_sigma = max(worst_sigma, z.max())
+        if z.max() > sigma:
+            j = int(z.argmax())
+            failures.append(f"{key}: outcome {j} observed {observed[j]:.5f}, expected {exact[j]:.5f} ({z.max():.1f} sigma)")
+
+    print(f"  Worst quantization error: {worst_quant:.2e} (limit {QUANT_TOLERANCE:.0e})")
+    print(f"  Worst empirical deviation: {worst_sigma:.2f} sigma (limit {sigma})")
+    return failures
+
+
+def write_binary(path, tables):
+    """
+    Binary form: 'LOOT', uint16 table count, then per table uint16 column
+    count followed by uint16 outcome ids, thresholds and aliases.
+    Table order matches the JSON "tables" keys.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'LOOT')
+        f.write(struct.pack('<H', len(tables)))
+        for table in tables.values():
+            n = len(table['threshold'])
+            f.write(struct.pack('<H', n))
+            for field in ('outcomes', 'threshold', 'alias'):
+                f.write(np.asarray(table[field], dtype='<u2').tobytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile loot alias tables")
+    parser.add_argument("--samples", type=int, default=1_000_000, help="verification rolls per table")
+    parser.add_argument("--sigma", type=float, default=6.0, help="allowed empirical deviation (standard errors)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--binary", action="store_true", help="also write loot-tables.bin")
+    args = parser.parse_args()
+
+    sources = load_sources()
+    pool = load_pool()
+    outcomes = [None] + [outcome for outcome, _, _ in pool]
+    print(f"Compiling loot tables: {len(sources)} sources x {len(ZONE_ELEMENTS)} zones x "
+          f"{len(FLOOR_TIERS)} tiers, {len(pool)} droppable entries")
+
+    tables = {}
+    for source in sources:
+        loot = source.get('loot', {})
+        drop_chance = loot.get('dropChance', 0.0)
+        gold = loot.get('gold', {"min": 0, "max": 0})
+        for zone in ZONE_ELEMENTS:
+            for tier in range(len(FLOOR_TIERS)):
+                target = drop_probabilities(pool, drop_chance, zone, tier)
+                # Outcomes that can never happen get no column
+                live = np.flatnonzero(target > 0)
+                threshold, alias = build_alias(quantize(target[live]))
+                tables[f"{source['id']}|{zone}|{tier}"] = {
+                    "outcomes": live.tolist(),
+                    "threshold": threshold.tolist(),
+                    "alias": alias.tolist(),
+                    "gold": {
+                        "min": int(gold['min'] * GOLD_TIER_MULTIPLIER[tier]),
+                        "max": int(gold['max'] * GOLD_TIER_MULTIPLIER[tier]),
+                    },
+                    "guaranteed": loot.get('guaranteed', []),
+                    "_target": target[live].tolist(),
+                }
+
+    print(f"Verifying {len(tables)} tables with {args.samples:,} rolls each...")
+    failures = verify(tables, args.samples, args.sigma, np.random.default_rng(args.seed))
+    if failures:
+        for failure in failures:
+            print(f"  FAIL {failure}")
+        sys.exit(1)
+
+    for table in tables.values():
+        del table['_target']
+
+    output = {
+        "probScale": PROB_SCALE,
+        "floorTiers": [list(t) for t in FLOOR_TIERS],
+        "outcomes": outcomes,
+        "tables": tables,
+    }
+    with open(OUTPUT_PATH, 'w') as f:
+        json.dump(output, f, separators=(',', ':'))
+    print(f"Saved tables to: {OUTPUT_PATH} ({os.path.getsize(OUTPUT_PATH)} bytes)")
+
+    if args.binary:
+        write_binary(BINARY_PATH, tables)
+        print(f"Saved binary tables to: {BINARY_PATH} ({os.path.getsize(BINARY_PATH)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Streaming Audio Converter
+=========================
+
+Resamples, downmixes and re-quantizes generated WAVs for the game without
+loading whole files. MusicGen writes 32 kHz float32; the browser decodes
+everything to float32 at the AudioContext rate, so music usually wants
+44.1/48 kHz and SFX can drop to 22.05 kHz mono to halve their decoded
+footprint.
+
+Input files are memory-mapped and processed in fixed-size blocks:
+- downmix each block to the target channel count (average to mono,
+  duplicate mono to stereo)
+- polyphase resample with the same Kaiser low-pass FIR scipy's
+  resample_poly designs, run overlap-save across blocks so the result
+  matches resample_poly on the whole file
+- convert to 16/24/32-bit PCM or 32-bit float (TPDF dither below 24 bits)
+- append to the output WAV, whose header sizes are patched at the end
+
+Memory use depends on --block, not on track length.
+
+Requirements:
+    pip install numpy scipy
+
+Usage:
+    python convert-audio.py                          # output/*.wav, music preset
+    python convert-audio.py output/sfx --preset sfx
+    python convert-audio.py menu.wav --rate 48000 --channels 2 --bits 24
+    python convert-audio.py output --verify          # compare against resample_poly
+
+Converted files are written to ./output/converted/ (same relative paths).
+"""
+
+import argparse
+import struct
+import sys
+import time
+from math import gcd
+from pathlib import Path
+
+# Check dependencies
+try:
+    import numpy as np
+    import scipy.io.wavfile as wavfile
+    from scipy.signal import firwin, resample_poly, upfirdn
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install numpy scipy")
+    sys.exit(1)
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+CONVERTED_DIR = OUTPUT_DIR / "converted"
+
+# Target formats: sample rate, channels (None = keep), bits ("32f" = float)
+PRESETS = {
+    "music": {"rate": 44100, "channels": None, "bits": "16"},
+    "music48": {"rate": 48000, "channels": None, "bits": "16"},
+    "sfx": {"rate": 22050, "channels": 1, "bits": "16"},
+}
+
+# Input frames per block (rounded to a multiple of the decimation factor)
+BLOCK_FRAMES = 1 << 16
+
+# resample_poly's default filter window
+FILTER_WINDOW = ("kaiser", 5.0)
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+
+
+def to_float(block: np.ndarray) -> np.ndarray:
+    """PCM or float samples as float32 in [-1, 1]."""
+    if block.dtype == np.uint8:
+        return (block.astype(np.float32) - 128.0) / 128.0
+    if block.dtype.kind == "i":
+        return block.astype(np.float32) / float(-np.iinfo(block.dtype).min)
+    return block.astype(np.float32)
+
+
+def downmix(block: np.ndarray, channels: int) -> np.ndarray:
+    """(frames, channels) block at the target channel count."""
+    if block.shape[1] == channels:
+        return block
+    mono = block.mean(axis=1, keepdims=True)
+    return mono if channels == 1 else np.repeat(mono, channels, axis=1)
+
+
+class StreamingResampler:
+    """
+    Block-wise equivalent of scipy.signal.resample_poly.
+
+    Feed input blocks in order with process(), then call flush(); the
+    concatenated outputs equal resample_poly(whole_signal, up, down).
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int, channels: int, total_frames: int):
+        g = gcd(src_rate, dst_rate)
+        self.up = dst_rate // g
+        self.down = src_rate // g
+        self.channels = channels
+        self.passthrough = self.up == self.down
+        self.remaining = -(-total_frames * self.up // self.down)
+        if self.passthrough:
+            return
+
+        # Same filter, padding and delay as resample_poly
+        max_rate = max(self.up, self.down)
+        half_len = 10 * max_rate
+        h = firwin(2 * half_len + 1, 1.0 / max_rate, window=FILTER_WINDOW) * self.up
+        n_pre_pad = self.down - half_len % self.down
+        self.h = np.concatenate([np.zeros(n_pre_pad), h]).astype(np.float32)
+        self.skip = (half_len + n_pre_pad) // self.down
+
+        # Input history so each block sees every sample the filter reaches
+        # back to; kept a multiple of `down` so block outputs stay aligned
+        context = -(-len(self.h) // self.up)
+        self.context = -(-context // self.down) * self.down
+        self.history = np.zeros((self.context, channels), dtype=np.float32)
+        self.pending = np.zeros((0, channels), dtype=np.float32)
+
+    def block_frames(self, requested: int) -> int:
+        if self.passthrough:
+            return requested
+        return max(self.down, requested // self.down * self.down)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Resample the next input block; returns the output frames it completes."""
+        if self.passthrough:
+            return self._emit(block)
+
+        # Only whole multiples of `down` are filtered; the rest waits
+        block = np.concatenate([self.pending, block]) if len(self.pending) else block
+        usable = len(block) // self.down * self.down
+        self.pending = block[usable:]
+        if usable == 0:
+            return np.zeros((0, self.channels), dtype=np.float32)
+        return self._filter(block[:usable])
+
+    def flush(self) -> np.ndarray:
+        """Drain the filter with trailing zeros."""
+        if self.passthrough:
+            return np.zeros((0, self.channels), dtype=np.float32)
+
+        outputs = []
+        tail = self.pending
+        self.pending = np.zeros((0, self.channels), dtype=np.float32)
+        pad = (-len(tail)) % self.down
+        block = np.concatenate([tail, np.zeros((pad, self.channels), dtype=np.float32)])
+        while self.remaining > 0:
+            if len(block) == 0:
+                block = np.zeros((self.context, self.channels), dtype=np.float32)
+            outputs.append(self._filter(block))
+            block = np.zeros((0, self.channels), dtype=np.float32)
+        return np.concatenate(outputs) if outputs else np.zeros((0, self.channels), dtype=np.float32)
+
+    def _filter(self, block: np.ndarray) -> np.ndarray:
+        chunk = np.concatenate([self.history, block])
+        out = upfirdn(self.h, chunk, self.up, self.down, axis=0)
+        start = self.context * self.up // self.down
+        out = out[start:start + len(block) * self.up // self.down]
+        self.history = chunk[-self.context:]
+
+        # Drop the filter delay at the start
+        if self.skip:
+            dropped = min(self.skip, len(out))
+            out = out[dropped:]
+            self.skip -= dropped
+        return self._emit(out.astype(np.float32, copy=False))
+
+    def _emit(self, out: np.ndarray) -> np.ndarray:
+        out = out[:self.remaining]
+        self.remaining -= len(out)
+        return out
+
+
+class WavWriter:
+    """Streaming WAV writer; RIFF/data sizes are patched on close."""
+
+    def __init__(self, path: Path, rate: int, channels: int, bits: str, dither: bool, seed: int = 0):
+        self.file = open(path, "wb")
+        self.channels = channels
+        self.float = bits == "32f"
+        self.width = 4 if self.float else int(bits) // 8
+        self.dither = dither and not self.float and self.width < 3
+        self.rng = np.random.default_rng(seed)
+        self.frames = 0
+
+        fmt = WAVE_FORMAT_IEEE_FLOAT if self.float else WAVE_FORMAT_PCM
+        block_align = channels * self.width
+        self.file.write(b"RIFF\0\0\0\0WAVE")
+        self.file.write(b"fmt " + struct.pack("<IHHIIHH", 16, fmt, channels, rate, rate * block_align,
+                                               block_align, self.width * 8))
+        self.file.write(b"data\0\0\0\0")
+
+    def write(self, block: np.ndarray):
+        if len(block) == 0:
+            return
+        if self.float:
+            data = block.astype("<f4").tobytes()
+        else:
+            scale = float(1 << (self.width * 8 - 1))
+            samples = block.astype(np.float64) * scale
+            if self.dither:
+                samples += self.rng.random(samples.shape) - self.rng.random(samples.shape)
+            ints = np.clip(np.round(samples), -scale, scale - 1).astype("<i4")
+            if self.width == 1:
+                data = (ints + 128).astype(np.uint8).tobytes()
+            elif self.width == 2:
+                data = ints.astype("<i2").tobytes()
+            elif self.width == 3:
+                data = ints.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+            else:
+                data = ints.tobytes()
+        self.file.write(data)
+        self.frames += len(block)
+
+    def close(self):
+        data_size = self.frames * self.channels * self.width
+        if data_size % 2:
+            self.file.write(b"\0")
+        self.file.seek(4)
+        self.file.write(struct.pack("<I", 36 + data_size + data_size % 2))
+        self.file.seek(40)
+        self.file.write(struct.pack("<I", data_size))
+        self.file.close()
+
+
+def convert(input_path: Path, output_path: Path, rate: int, channels, bits: str,
+            dither: bool = True, block: int = BLOCK_FRAMES) -> dict:
+    """Stream one WAV through downmix, resample and quantize. Returns stats."""
+    src_rate, source = wavfile.read(str(input_path), mmap=True)
+    if source.ndim == 1:
+        source = source[:, None]
+    total, src_channels = source.shape
+    channels = channels or src_channels
+
+    resampler = StreamingResampler(src_rate, rate, channels, total)
+    step = resampler.block_frames(block)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    writer = WavWriter(output_path, rate, channels, bits, dither)
+    try:
+        for start in range(0, total, step):
+            # Copy one block out of the memory map; nothing else is resident
+            chunk = downmix(to_float(np.asarray(source[start:start + step])), channels)
+            writer.write(resampler.process(chunk))
+        writer.write(resampler.flush())
+    finally:
+        writer.close()
+        del source
+
+    return {
+        "seconds": total / src_rate,
+        "src": f"{src_rate} Hz x{src_channels}",
+        "dst": format_name(rate, channels, bits),
+        "in_bytes": input_path.stat().st_size,
+        "out_bytes": output_path.stat().st_size,
+        "frames": writer.frames,
+    }
+
+
+def verify(input_path: Path, output_path: Path, rate: int, channels) -> float:
+    """Max abs difference between the streamed output and in-memory resample_poly."""
+    src_rate, source = wavfile.read(str(input_path))
+    source = source[:, None] if source.ndim == 1 else source
+    reference = downmix(to_float(source), channels or source.shape[1])
+    if src_rate != rate:
+        g = gcd(src_rate, rate)
+        reference = resample_poly(reference, rate // g, src_rate // g, axis=0)
+    _, streamed = wavfile.read(str(output_path))
+    streamed = to_float(streamed[:, None] if streamed.ndim == 1 else streamed)
+    if streamed.shape != reference.shape:
+        return float("inf")
+    return float(np.abs(streamed - reference).max())
+
+
+def format_name(rate: int, channels, bits: str) -> str:
+    depth = "32-bit float" if bits == "32f" else f"{bits}-bit"
+    layout = f"x{channels}" if channels else "source channels"
+    return f"{rate} Hz {layout} {depth}"
+
+
+def find_wavs(paths):
+    """(file, base directory) pairs; converted output is never re-read."""
+    found = []
+    for path in paths:
+        if path.is_dir():
+            found.extend((p, path) for p in sorted(path.rglob("*.wav")) if CONVERTED_DIR not in p.parents)
+        else:
+            found.append((path, path.parent))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resample, downmix and re-quantize WAVs in constant memory")
+    parser.add_argument("inputs", nargs="*", type=Path, default=[OUTPUT_DIR], help="WAV files or directories")
+    parser.add_argument("--preset", choices=PRESETS, default="music")
+    parser.add_argument("--rate", type=int, help="target sample rate (overrides preset)")
+    parser.add_argument("--channels", type=int, choices=(1, 2), help="target channels (overrides preset)")
+    parser.add_argument("--bits", choices=("8", "16", "24", "32", "32f"), help="target sample format (overrides preset)")
+    parser.add_argument("--no-dither", action="store_true", help="disable TPDF dither for 8/16-bit output")
+    parser.add_argument("--block", type=int, default=BLOCK_FRAMES, help="input frames per block")
+    parser.add_argument("--out", type=Path, default=CONVERTED_DIR, help="output directory")
+    parser.add_argument("--verify", action="store_true", help="compare 32f output against resample_poly (loads files)")
+    args = parser.parse_args()
+
+    preset = PRESETS[args.preset]
+    rate = args.rate or preset["rate"]
+    channels = args.channels or preset["channels"]
+    bits = "32f" if args.verify else (args.bits or preset["bits"])
+
+    files = find_wavs(args.inputs)
+    if not files:
+        print("No WAV files found.")
+        sys.exit(1)
+
+    print(f"Converting {len(files)} files to {format_name(rate, channels, bits)}")
+    failures = 0
+    for path, base in files:
+        output_path = args.out / path.relative_to(base)
+        start = time.perf_counter()
+        stats = convert(path, output_path, rate, channels, bits, not args.no_dither, args.block)
+        elapsed = time.perf_counter() - start
+        line = (f"  {path.name}: {stats['src']} -> {stats['dst']}, "
+                f"{stats['in_bytes'] / 1024:.0f} KB -> {stats['out_bytes'] / 1024:.0f} KB, "
+                f"{stats['seconds'] / max(elapsed, 1e-9):.0f}x real time")
+        if args.verify:
+            error = verify(path, output_path, rate, channels)
+            failures += error > 1e-5
+            line += f", max error {error:.1e}"
+        print(line)
+
+    print(f"Output: {args.out}")
+    if failures:
+        print(f"{failures} files differ from resample_poly")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
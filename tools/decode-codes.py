@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Batch Decoder for Stored EnCodec Token Streams
+==============================================
+
+Renders `.codes.npz` files written by the generation scripts (run them with
+--save-codes) back to WAV. Only the EnCodec decoder runs here, so clips can
+be re-rendered at a different sample rate, length or with a loop crossfade
+without repeating the expensive MusicGen generation step.
+
+Requirements:
+    pip install torch transformers scipy
+
+Usage:
+    python decode-codes.py                          # every codes file in output/
+    python decode-codes.py output/menu.codes.npz --sample-rate 44100
+    python decode-codes.py --duration 8 --loop-crossfade 0.5
+
+Decoded files are written to ./output/decoded/
+"""
+
+import argparse
+import sys
+from math import gcd
+from pathlib import Path
+
+# Check dependencies
+try:
+    import numpy as np
+    import torch
+    from transformers import EncodecModel
+    import scipy.io.wavfile as wavfile
+    from scipy.signal import resample_poly
+    from audio_codes import CODES_SUFFIX, load_codes
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install torch transformers scipy")
+    sys.exit(1)
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+DECODED_DIR = OUTPUT_DIR / "decoded"
+
+# EnCodec model used by all MusicGen checkpoints
+DEFAULT_ENCODER = "facebook/encodec_32khz"
+
+
+def decode(encoder, codes: np.ndarray, device: str) -> np.ndarray:
+    """Decode (num_codebooks, frames) codes to a mono float32 waveform."""
+    # EnCodec expects (chunks, batch, num_codebooks, frames)
+    audio_codes = torch.from_numpy(codes)[None, None].to(device)
+    with torch.no_grad():
+        # Tuple output: the first element is the audio on every transformers release
+        audio = encoder.decode(audio_codes, [None], return_dict=False)[0]
+    return audio[0, 0].cpu().numpy().astype(np.float32)
+
+
+def loop_crossfade(audio: np.ndarray, fade_samples: int) -> np.ndarray:
+    """Fold the tail into the head with an equal-power fade for seamless loops."""
+    fade_samples = min(fade_samples, len(audio) // 2)
+    if fade_samples <= 0:
+        return audio
+    t = np.linspace(0.0, np.pi / 2, fade_samples, dtype=np.float32)
+    head = audio[:fade_samples] * np.sin(t)
+    tail = audio[-fade_samples:] * np.cos(t)
+    looped = audio[:-fade_samples].copy()
+    looped[:fade_samples] = head + tail
+    return looped
+
+
+def render(encoder, path: Path, args, device: str) -> Path:
+    data = load_codes(path)
+    audio = decode(encoder, data["codes"], device)
+    sample_rate = data["sample_rate"]
+
+    duration = args.duration if args.duration is not None else data["duration"]
+    audio = audio[:int(duration * sample_rate)]
+
+    if args.loop_crossfade:
+        audio = loop_crossfade(audio, int(args.loop_crossfade * sample_rate))
+
+    if args.sample_rate and args.sample_rate != sample_rate:
+        g = gcd(args.sample_rate, sample_rate)
+        audio = resample_poly(audio, args.sample_rate // g, sample_rate // g).astype(np.float32)
+        sample_rate = args.sample_rate
+
+    name = path.name[:-len(CODES_SUFFIX)] if path.name.endswith(CODES_SUFFIX) else path.stem
+    output_path = args.out / f"{name}.wav"
+    wavfile.write(str(output_path), sample_rate, audio)
+    print(f"  {path.name} -> {output_path} ({len(audio) / sample_rate:.2f}s @ {sample_rate} Hz)")
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render stored EnCodec codes to WAV")
+    parser.add_argument("files", nargs="*", type=Path, help="codes files (default: all in output/)")
+    parser.add_argument("--out", type=Path, default=DECODED_DIR, help="output directory")
+    parser.add_argument("--sample-rate", type=int, default=None, help="resample to this rate")
+    parser.add_argument("--duration", type=float, default=None, help="trim to this many seconds")
+    parser.add_argument("--loop-crossfade", type=float, default=0.0,
+                        help="crossfade the tail into the head (seconds)")
+    parser.add_argument("--encoder", default=DEFAULT_ENCODER, help="EnCodec model name")
+    args = parser.parse_args()
+
+    files = args.files or sorted(OUTPUT_DIR.glob(f"*{CODES_SUFFIX}"))
+    if not files:
+        print(f"No codes files found in {OUTPUT_DIR}")
+        return
+
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    print(f"Loading EnCodec decoder: {args.encoder}")
+    encoder = EncodecModel.from_pretrained(args.encoder).to(device).eval()
+
+    print(f"Decoding {len(files)} file(s)...")
+    for path in files:
+        try:
+            render(encoder, path, args, device)
+        except Exception as e:
+            print(f"  ERROR decoding {path.name}: {e}")
+
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Chiptune Pattern Sequencer
+==========================
+
+Tracker-style music renderer for the retro menu and dungeon loops. Songs
+are patterns of notes for NES-style channels (two pulse, triangle, noise)
+played through instrument definitions with ADSR envelopes. Audio is
+rendered one pattern row at a time with NumPy and streamed straight to
+disk, so memory use stays constant however long the track is and a
+minute of music renders in well under a second.
+
+Requirements:
+    pip install numpy
+    pip install soundfile      # optional, for .ogg output
+
+Usage:
+    python generate-chiptune.py                     # all built-in songs
+    python generate-chiptune.py menu --loops 8
+    python generate-chiptune.py --song my_song.json --format ogg
+
+Song format (built-ins in SONGS below, or a JSON file with the same keys):
+    bpm, rows_per_beat       tempo; one row is one step of every pattern
+    instruments              name -> {channel, duty, volume, attack, decay,
+                             sustain, release}
+    patterns                 name -> {channel: [cell, ...]}
+    order                    pattern names played in sequence
+
+Cells are tracker notes: "C-4", "D#3", "..." (no change), "===" (note off).
+Channel names: pulse1, pulse2, triangle, noise. A noise cell's note picks
+the noise clock rate. Each channel plays the instrument of the same name
+unless a pattern cell is written as "C-4 lead" to select another one.
+
+The generated files will be saved to ./output/chiptune/
+"""
+
+import argparse
+import json
+import sys
+import time
+import wave
+from pathlib import Path
+
+# Check dependencies
+try:
+    import numpy as np
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install numpy")
+    sys.exit(1)
+
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+# Output directory
+OUTPUT_DIR = Path(__file__).parent / "output" / "chiptune"
+
+SAMPLE_RATE = 44100
+
+CHANNELS = ("pulse1", "pulse2", "triangle", "noise")
+
+# Mix headroom so all four channels at full volume stay below clipping
+MIX_GAIN = 0.5
+
+NOTE_NAMES = {"C-": 0, "C#": 1, "D-": 2, "D#": 3, "E-": 4, "F-": 5,
+              "F#": 6, "G-": 7, "G#": 8, "A-": 9, "A#": 10, "B-": 11}
+
+DEFAULT_INSTRUMENTS = {
+    "pulse1": {"channel": "pulse", "duty": 0.5, "volume": 0.5, "attack": 0.005, "decay": 0.1, "sustain": 0.6, "release": 0.05},
+    "pulse2": {"channel": "pulse", "duty": 0.25, "volume": 0.35, "attack": 0.005, "decay": 0.15, "sustain": 0.5, "release": 0.08},
+    "triangle": {"channel": "triangle", "volume": 0.6, "attack": 0.002, "decay": 0.0, "sustain": 1.0, "release": 0.02},
+    "noise": {"channel": "noise", "volume": 0.3, "attack": 0.0, "decay": 0.08, "sustain": 0.0, "release": 0.01},
+}
+
+SONGS = {
+    # Slow, minor-key menu loop
+    "menu": {
+        "bpm": 84,
+        "rows_per_beat": 4,
+        "instruments": {
+            "pulse1": {"channel": "pulse", "duty": 0.25, "volume": 0.35, "attack": 0.02, "decay": 0.3, "sustain": 0.5, "release": 0.2},
+            "pulse2": {"channel": "pulse", "duty": 0.125, "volume": 0.2, "attack": 0.01, "decay": 0.2, "sustain": 0.3, "release": 0.15},
+        },
+        "patterns": {
+            "intro": {
+                "pulse1": ["A-4", "...", "...", "...", "C-5", "...", "B-4", "...", "A-4", "...", "...", "...", "E-4", "...", "...", "..."],
+                "pulse2": ["A-3", "...", "E-4", "...", "A-3", "...", "E-4", "...", "F-3", "...", "C-4", "...", "E-3", "...", "B-3", "..."],
+                "triangle": ["A-2", "...", "...", "...", "...", "...", "...", "...", "F-2", "...", "...", "...", "E-2", "...", "...", "..."],
+                "noise": ["...", "...", "...", "...", "...", "...", "...", "...", "...", "...", "...", "...", "...", "...", "...", "..."],
+            },
+            "theme": {
+                "pulse1": ["E-5", "...", "D-5", "...", "C-5", "...", "B-4", "...", "C-5", "...", "A-4", "...", "...", "...", "===", "..."],
+                "pulse2": ["A-3", "...", "E-4", "...", "A-3", "...", "E-4", "...", "D-3", "...", "A-3", "...", "E-3", "...", "G#3", "..."],
+                "triangle": ["A-2", "...", "...", "...", "A-2", "...", "...", "...", "D-2", "...", "...", "...", "E-2", "...", "...", "..."],
+                "noise": ["C-6", "...", "...", "...", "...", "...", "...", "...", "C-6", "...", "...", "...", "...", "...", "...", "..."],
+            },
+        },
+        "order": ["intro", "theme", "intro", "theme"],
+    },
+    # Driving dungeon loop
+    "dungeon": {
+        "bpm": 132,
+        "rows_per_beat": 4,
+        "instruments": {
+            "pulse1": {"channel": "pulse", "duty": 0.5, "volume": 0.3, "attack": 0.003, "decay": 0.08, "sustain": 0.4, "release": 0.04},
+            "pulse2": {"channel": "pulse", "duty": 0.25, "volume": 0.22, "attack": 0.003, "decay": 0.05, "sustain": 0.2, "release": 0.03},
+            "kick": {"channel": "noise", "volume": 0.4, "attack": 0.0, "decay": 0.12, "sustain": 0.0, "release": 0.01},
+        },
+        "patterns": {
+            "drive": {
+                "pulse1": ["D-4", "...", "F-4", "...", "A-4", "...", "F-4", "...", "D-4", "...", "C-4", "...", "D-4", "...", "...", "==="],
+                "pulse2": ["D-3", "D-4", "D-3", "D-4", "D-3", "D-4", "D-3", "D-4", "A#2", "A#3", "A#2", "A#3", "C-3", "C-4", "C-3", "C-4"],
+                "triangle": ["D-2", "...", "...", "D-2", "...", "...", "D-2", "...", "A#1", "...", "...", "A#1", "C-2", "...", "C-2", "..."],
+                "noise": ["C-3 kick", "...", "C-7", "...", "C-5", "...", "C-7", "...", "C-3 kick", "...", "C-7", "...", "C-5", "...", "C-7", "C-7"],
+            },
+            "climb": {
+                "pulse1": ["A-4", "...", "G-4", "...", "F-4", "...", "E-4", "...", "F-4", "...", "G-4", "...", "A-4", "...", "C#5", "..."],
+                "pulse2": ["F-3", "F-4", "F-3", "F-4", "C-3", "C-4", "C-3", "C-4", "A#2", "A#3", "A#2", "A#3", "A-2", "A-3", "A-2", "A-3"],
+                "triangle": ["F-2", "...", "...", "F-2", "C-2", "...", "...", "C-2", "A#1", "...", "...", "A#1", "A-1", "...", "A-1", "..."],
+                "noise": ["C-3 kick", "...", "C-7", "...", "C-5", "...", "C-7", "...", "C-3 kick", "...", "C-7", "...", "C-5", "C-5", "C-5", "C-5"],
+            },
+        },
+        "order": ["drive", "drive", "climb", "drive"],
+    },
+}
+
+
+def note_to_midi(note: str) -> int:
+    """Tracker note ("C-4", "F#2") to a MIDI note number."""
+    return 12 * (int(note[2]) + 1) + NOTE_NAMES[note[:2]]
+
+
+def midi_to_freq(midi: float) -> float:
+    return 440.0 * 2.0 ** ((midi - 69) / 12.0)
+
+
+def build_lfsr_table() -> np.ndarray:
+    """One period of the NES 15-bit noise LFSR as -1/+1 samples."""
+    reg = 1
+    out = np.empty(32767, dtype=np.float32)
+    for i in range(32767):
+        bit = (reg ^ (reg >> 1)) & 1
+        reg = (reg >> 1) | (bit << 14)
+        out[i] = 1.0 if reg & 1 else -1.0
+    return out
+
+
+# NES triangle: 32-step, 4-bit quantized ramp
+TRIANGLE_STEPS = np.concatenate([np.arange(15, -1, -1), np.arange(0, 16)]).astype(np.float32) / 7.5 - 1.0
+
+
+class Voice:
+    """Playback state for one channel; survives across rendered blocks."""
+
+    def __init__(self, name: str, instruments: dict, lfsr: np.ndarray):
+        self.name = name
+        self.instruments = instruments
+        self.instrument = instruments[name]
+        self.lfsr = lfsr
+        self.freq = 0.0
+        self.phase = 0.0
+        self.note_time = 0.0
+        self.release_time = None
+        self.release_level = 0.0
+        self.active = False
+
+    def trigger(self, cell: str):
+        """Apply a pattern cell at the start of a row."""
+        if cell.startswith("..."):
+            return
+        if cell.startswith("==="):
+            if self.active and self.release_time is None:
+                self.release_level = self._envelope(np.array([self.note_time]))[0]
+                self.release_time = 0.0
+            return
+        note, _, instrument = cell.partition(" ")
+        self.instrument = self.instruments[instrument or self.name]
+        self.freq = midi_to_freq(note_to_midi(note))
+        if self.instrument["channel"] == "noise":
+            # Higher notes clock the LFSR faster; C-4 is ~4.7 kHz
+            self.freq *= 18.0
+        self.note_time = 0.0
+        self.release_time = None
+        self.active = True
+
+    def _envelope(self, t: np.ndarray) -> np.ndarray:
+        inst = self.instrument
+        attack, decay, sustain = inst["attack"], inst["decay"], inst["sustain"]
+        attack_env = t / attack if attack > 0 else np.ones_like(t)
+        decay_env = 1.0 - (1.0 - sustain) * ((t - attack) / decay) if decay > 0 else np.full_like(t, sustain)
+        return np.where(t < attack, attack_env, np.where(t < attack + decay, decay_env, sustain))
+
+    def render(self, frames: int, sample_rate: int) -> np.ndarray:
+        if not self.active:
+            return np.zeros(frames, dtype=np.float32)
+        inst = self.instrument
+        dt = np.arange(frames, dtype=np.float64) / sample_rate
+
+        if self.release_time is None:
+            env = self._envelope(self.note_time + dt)
+        else:
+            release = max(inst["release"], 1e-6)
+            env = self.release_level * np.clip(1.0 - (self.release_time + dt) / release, 0.0, 1.0)
+            self.release_time += frames / sample_rate
+            if self.release_time >= release:
+                self.active = False
+
+        phase = self.phase + self.freq * dt
+        self.phase = (self.phase + self.freq * frames / sample_rate) % 32767.0
+        self.note_time += frames / sample_rate
+
+        channel = inst["channel"]
+        if channel == "pulse":
+            wave = np.where((phase % 1.0) < inst.get("duty", 0.5), 1.0, -1.0)
+        elif channel == "triangle":
+            wave = TRIANGLE_STEPS[(np.floor((phase % 1.0) * 32)).astype(np.int64)]
+        else:
+            wave = self.lfsr[np.floor(phase).astype(np.int64) % len(self.lfsr)]
+        return (wave * env * inst["volume"]).astype(np.float32)
+
+
+def load_song(song: dict) -> dict:
+    """Merge a song's instruments over the channel defaults."""
+    instruments = {name: dict(inst) for name, inst in DEFAULT_INSTRUMENTS.items()}
+    for name, inst in song.get("instruments", {}).items():
+        instruments[name] = {**DEFAULT_INSTRUMENTS.get(name, {}), **inst}
+    return {**song, "instruments": instruments}
+
+
+def iter_blocks(song: dict, loops: int = 1, sample_rate: int = SAMPLE_RATE):
+    """
+    Yield rendered audio one pattern row at a time.
+
+    Row boundaries are tracked in fractional samples so tempo never drifts,
+    however many loops are rendered.
+    """
+    song = load_song(song)
+    lfsr = build_lfsr_table()
+    voices = [Voice(name, song["instruments"], lfsr) for name in CHANNELS]
+    samples_per_row = sample_rate * 60.0 / (song["bpm"] * song.get("rows_per_beat", 4))
+
+    position = 0.0
+    written = 0
+    for _ in range(loops):
+        for pattern_name in song["order"]:
+            pattern = song["patterns"][pattern_name]
+            rows = max(len(cells) for cells in pattern.values())
+            for row in range(rows):
+                for voice in voices:
+                    cells = pattern.get(voice.name, [])
+                    if row < len(cells):
+                        voice.trigger(cells[row])
+                position += samples_per_row
+                frames = int(round(position)) - written
+                written += frames
+                block = sum(voice.render(frames, sample_rate) for voice in voices)
+                yield np.clip(block * MIX_GAIN, -1.0, 1.0)
+
+
+def render_to_file(song: dict, output_path: Path, loops: int = 1, sample_rate: int = SAMPLE_RATE) -> float:
+    """Stream a song to WAV (or OGG via soundfile). Returns seconds written."""
+    frames = 0
+    if output_path.suffix == ".ogg":
+        if soundfile is None:
+            raise RuntimeError("OGG output needs soundfile: pip install soundfile")
+        with soundfile.SoundFile(str(output_path), "w", sample_rate, 1, format="OGG", subtype="VORBIS") as f:
+            for block in iter_blocks(song, loops, sample_rate):
+                f.write(block)
+                frames += len(block)
+    else:
+        with wave.open(str(output_path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(sample_rate)
+            for block in iter_blocks(song, loops, sample_rate):
+                f.writeframes((block * 32767).astype("<i2").tobytes())
+                frames += len(block)
+    return frames / sample_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render chiptune patterns to audio")
+    parser.add_argument("names", nargs="*", help="built-in songs to render (default: all)")
+    parser.add_argument("--song", type=Path, help="render a song from a JSON file instead")
+    parser.add_argument("--loops", type=int, default=2, help="times to play the pattern order")
+    parser.add_argument("--format", choices=("wav", "ogg"), default="wav")
+    parser.add_argument("--sample-rate", type=int, default=SAMPLE_RATE)
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR, help="output directory")
+    args = parser.parse_args()
+
+    if args.format == "ogg" and soundfile is None:
+        print("Missing dependencies. Install with:")
+        print("  pip install soundfile      # needed for --format ogg")
+        sys.exit(1)
+
+    if args.song:
+        with open(args.song) as f:
+            songs = {args.song.stem: json.load(f)}
+    else:
+        names = args.names or list(SONGS)
+        unknown = [name for name in names if name not in SONGS]
+        if unknown:
+            print(f"Unknown songs: {', '.join(unknown)}")
+            print(f"Available: {', '.join(SONGS)}")
+            sys.exit(1)
+        songs = {name: SONGS[name] for name in names}
+
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    for name, song in songs.items():
+        output_path = args.out / f"{name}.{args.format}"
+        start = time.perf_counter()
+        seconds = render_to_file(song, output_path, args.loops, args.sample_rate)
+        elapsed = time.perf_counter() - start
+        print(f"  {output_path.name}: {seconds:.1f}s of audio in {elapsed:.2f}s ({seconds / max(elapsed, 1e-9):.0f}x real time)")
+
+    print(f"Output: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Dungeon Layout Bank Generator
+=============================
+
+Generates floor layouts offline, validates them, and packs the accepted
+ones into a compact binary bank. At floor start the game picks a layout by
+index instead of running the generator and template search live.
+
+Each candidate seed is run through a Python port of the runtime rules:
+- SeededRandom (xorshift128+ with SplitMix seeding), bit-exact with
+  src/utils/Random.ts, so a seed gives the same sequence in both languages
+- DungeonGenerator.generate: random-walk grid placement, boss room next to
+  the room furthest from the start, adjacent rooms connected
+- LiveDungeonManager.generateRoomForDoor: template choice per room from
+  assets/data/rooms/index.json (required door toward the room it is entered
+  from, floor and difficulty limits, unused templates first, weighted pick,
+  occasional treasure/shop rooms, fallback to any type)
+
+A door is only usable when both rooms' templates have a slot facing each
+other. Layouts are rejected when, over usable doors:
+- a room or the boss room cannot be reached from the start room
+- the boss room is fewer than --min-boss-distance rooms from the start
+- more than --max-dead-ends combat rooms have a single exit
+- a room has no matching template
+
+Candidate seeds are checked in parallel with multiprocessing.
+
+Usage:
+    python generate-layout-bank.py                      # floors 1-8, 256 layouts each
+    python generate-layout-bank.py --floors 1 3 --count 20000 --workers 8
+
+Output:
+    assets/data/layout-bank.bin   records (little-endian, fixed size, see RECORD FORMAT)
+    assets/data/layout-bank.json  template/type tables and per-floor record ranges
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from collections import Counter, deque
+from multiprocessing import Pool
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+ROOMS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'rooms', 'index.json')
+BANK_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'layout-bank.bin')
+INDEX_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'layout-bank.json')
+
+# Room count range GameScene passes to DungeonGenerator.generate
+MIN_ROOMS = 6
+MAX_ROOMS = 10
+
+# Room size range for DungeonGenerator.createRoom (Constants.ts); only
+# consumed from the RNG so the sequence stays in step with the game
+MIN_ROOM_SIZE = 7
+MAX_ROOM_SIZE = 15
+
+# Rooms per record: the main path plus the boss room
+MAX_LAYOUT_ROOMS = MAX_ROOMS + 1
+
+# Chance a room entered after the first two becomes treasure/shop (LiveDungeonManager)
+SPECIAL_ROOM_CHANCE = 0.15
+
+# Template repeats are allowed once this many have been used (LiveDungeonManager)
+REPEAT_AFTER_USED = 10
+
+# Zone floor ranges (ZoneManager.initializeZones)
+ZONE_FLOORS = {
+    'catacombs': (1, 3),
+    'library': (2, 5),
+    'crystal_caves': (3, 6),
+    'forge_depths': (4, 8),
+}
+
+# Room types in record order (RoomType in Room.ts)
+ROOM_TYPES = ['start', 'normal', 'treasure', 'shop', 'boss', 'secret', 'challenge', 'hub']
+
+# Grid neighbours in DungeonGenerator order, with their door bit in the record
+NORTH, SOUTH, EAST, WEST = 'north', 'south', 'east', 'west'
+NEIGHBOURS = [(0, -1, NORTH), (0, 1, SOUTH), (1, 0, EAST), (-1, 0, WEST)]
+OPPOSITE = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
+DOOR_BITS = {NORTH: 1, EAST: 2, SOUTH: 4, WEST: 8}
+
+# RECORD FORMAT
+#   uint32 seed, uint8 roomCount, uint8 bossIndex, uint8 bossDistance, uint8 deadEnds
+#   then MAX_LAYOUT_ROOMS x (int8 gridX, int8 gridY, uint8 template, uint8 type << 4 | doorBits)
+# Room 0 is the start room; unused room slots are zero.
+BANK_MAGIC = b'DLB1'
+BANK_VERSION = 1
+RECORD_HEADER = struct.Struct('<IBBBB')
+ROOM_ENTRY = struct.Struct('<bbBB')
+RECORD_SIZE = RECORD_HEADER.size + MAX_LAYOUT_ROOMS * ROOM_ENTRY.size
+
+# Seeds per worker task
+SEED_BATCH = 2000
+
+# Give up on a floor after this many candidate seeds per requested layout
+MAX_SEEDS_PER_LAYOUT = 200
+
+M32 = 0xFFFFFFFF
+
+
+def to_uint32(x):
+    """JS ToUint32 (for `>>>`)."""
+    return int(x) & M32
+
+
+def to_int32(x):
+    """JS ToInt32 (for `| 0`, `^` and Math.imul)."""
+    x = int(x) & M32
+    return x - 0x100000000 if x & 0x80000000 else x
+
+
+class SeededRandom:
+    """Port of SeededRandom (src/utils/Random.ts) with identical integer semantics."""
+
+    def __init__(self, seed):
+        # SplitMix32 seeding; Math.imul(a, b) is the low 32 bits of the product
+        self.state = [0, 0, 0, 0]
+        s = to_int32(seed)
+        for i in range(4):
+            s = to_int32(s + 0x9e3779b9)
+            z = s
+            z = to_int32((to_int32(z) ^ (to_uint32(z) >> 16)) * 0x85ebca6b)
+            z = to_int32((z ^ (to_uint32(z) >> 13)) * 0xc2b2ae35)
+            z = z ^ (to_uint32(z) >> 16)
+            self.state[i] = to_uint32(z)
+
+    def next(self):
+        s0, s1, s2, s3 = self.state
+        result = (s0 + s3) & M32
+        s1 ^= s0
+        s3 ^= s2
+        self.state = [
+            (((s0 << 24) | (s0 >> 8)) ^ s1 ^ (s1 << 16)) & M32,
+            ((s1 << 17) | (s1 >> 15)) & M32,
+            (((s2 << 19) | (s2 >> 13)) ^ s3 ^ (s3 << 21)) & M32,
+            ((s3 << 5) | (s3 >> 27)) & M32,
+        ]
+        return result / 4294967296.0
+
+    def int_between(self, lo, hi):
+        return int(self.next() * (hi - lo + 1)) + lo
+
+    def chance(self, probability=0.5):
+        return self.next() < probability
+
+    def pick(self, items):
+        return items[self.int_between(0, len(items) - 1)]
+
+    def shuffle(self, items):
+        for i in range(len(items) - 1, 0, -1):
+            j = self.int_between(0, i)
+            items[i], items[j] = items[j], items[i]
+        return items
+
+    def weighted_pick(self, items, weights):
+        remaining = self.next() * sum(weights)
+        for item, weight in zip(items, weights):
+            remaining -= weight
+            if remaining <= 0:
+                return item
+        return items[-1]
+
+
+# =============================================================================
+# GRID PLACEMENT (DungeonGenerator.ts)
+# =============================================================================
+
+def place_rooms(rng):
+    """
+    Run DungeonGenerator.generate's placement.
+
+    Returns (positions, types) in creation order; room 0 is the start room.
+    The boss room is missing when the furthest room had no free neighbour.
+    """
+    positions = []
+    types = []
+    occupied = set()
+
+    def create_room(room_type, x, y):
+        rng.int_between(MIN_ROOM_SIZE, MAX_ROOM_SIZE)  # width
+        rng.int_between(MIN_ROOM_SIZE, MAX_ROOM_SIZE)  # height
+        positions.append((x, y))
+        types.append(room_type)
+        occupied.add((x, y))
+
+    def add_frontier(x, y):
+        for dx, dy, _ in NEIGHBOURS:
+            if (x + dx, y + dy) not in occupied:
+                frontier.append((x + dx, y + dy))
+
+    target = rng.int_between(MIN_ROOMS, MAX_ROOMS)
+    create_room('start', 0, 0)
+
+    frontier = []
+    add_frontier(0, 0)
+    while len(positions) < target and frontier:
+        pos = frontier.pop(rng.int_between(0, len(frontier) - 1))
+        if pos in occupied:
+            continue
+        create_room('normal', *pos)
+        add_frontier(*pos)
+
+    # Boss next to the room furthest (Manhattan) from the start
+    furthest, max_distance = 0, 0
+    for i, (x, y) in enumerate(positions):
+        if abs(x) + abs(y) > max_distance:
+            furthest, max_distance = i, abs(x) + abs(y)
+    fx, fy = positions[furthest]
+    for dx, dy, _ in rng.shuffle(list(NEIGHBOURS)):
+        if (fx + dx, fy + dy) not in occupied:
+            create_room('boss', fx + dx, fy + dy)
+            break
+
+    # placeSpecialRooms only shuffles (the type change is still a TODO there)
+    normal_rooms = [i for i, t in enumerate(types) if t == 'normal']
+    if len(normal_rooms) >= 2:
+        rng.shuffle(normal_rooms)
+
+    return positions, types
+
+
+# =============================================================================
+# TEMPLATE SELECTION (LiveDungeonManager.ts / RoomComponent.ts)
+# =============================================================================
+
+def load_templates():
+    """Load room templates from the room index."""
+    with open(ROOMS_PATH) as f:
+        return json.load(f)['rooms']
+
+
+def template_slots(template):
+    return {slot['direction'] for slot in template['doorSlots']}
+
+
+def matches(template, required_door, room_type, floor, used, difficulty=True):
+    """roomMatchesConstraints, plus the zone's floor range for combat rooms."""
+    if required_door not in template_slots(template):
+        return False
+    if room_type is not None and template['type'] != room_type:
+        return False
+    if floor < template.get('minFloor', floor) or floor > template.get('maxFloor', floor):
+        return False
+    if used is not None and template['id'] in used:
+        return False
+    if template['type'] != 'normal':
+        return True
+
+    # The difficulty window and zones only apply to combat rooms: start, shop
+    # and treasure templates are difficulty 0, bosses 10
+    if difficulty and not max(1, floor - 1) <= template['difficulty'] <= floor + 2:
+        return False
+    zone = template.get('zone')
+    return zone not in ZONE_FLOORS or ZONE_FLOORS[zone][0] <= floor <= ZONE_FLOORS[zone][1]
+
+
+def find_template(templates, required_door, room_type, floor, used, rng):
+    """
+    Weighted pick of a matching template index, or None.
+
+    Relaxes constraints in order: unused templates of the room type, repeats,
+    any difficulty, then (like LiveDungeonManager's fallback) any type.
+    """
+    used_filter = None if len(used) > REPEAT_AFTER_USED else used
+    attempts = [
+        (room_type, used_filter, True),
+        (room_type, None, True),
+        (room_type, None, False),
+        (None, None, False),
+    ]
+    for type_filter, excluded, difficulty in attempts:
+        candidates = [i for i, t in enumerate(templates)
+                      if matches(t, required_door, type_filter, floor, excluded, difficulty)]
+        if candidates:
+            weights = [templates[i].get('weight', 1) for i in candidates]
+            return rng.weighted_pick(candidates, weights)
+    return None
+
+
+def assign_templates(rng, templates, positions, types, floor):
+    """
+    Choose a template per room, visiting rooms in the order a player would
+    first reach them (breadth-first from the start over grid adjacency).
+
+    Returns (template indices, final room types) or None.
+    """
+    index_at = {pos: i for i, pos in enumerate(positions)}
+    chosen = [None] * len(positions)
+    final_types = list(types)
+    used = set()
+
+    # Breadth-first entry order and the door each room is entered through
+    entry_door = {0: NORTH}  # the start room needs an exit (LiveDungeonManager.initialize)
+    order = [0]
+    queue = deque([0])
+    while queue:
+        i = queue.popleft()
+        x, y = positions[i]
+        for dx, dy, direction in NEIGHBOURS:
+            j = index_at.get((x + dx, y + dy))
+            if j is not None and j not in entry_door:
+                entry_door[j] = OPPOSITE[direction]
+                order.append(j)
+                queue.append(j)
+
+    for count, i in enumerate(order):
+        room_type = final_types[i]
+        if room_type == 'normal' and count > 2 and rng.chance(SPECIAL_ROOM_CHANCE):
+            room_type = rng.pick(['treasure', 'shop'])
+
+        t = find_template(templates, entry_door[i], room_type, floor, used, rng)
+        if t is None:
+            return None
+        chosen[i] = t
+        final_types[i] = templates[t]['type']
+        used.add(templates[t]['id'])
+
+    return chosen, final_types
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def usable_doors(templates, positions, chosen):
+    """Door bitmask per room: adjacent rooms whose templates both have facing slots."""
+    index_at = {pos: i for i, pos in enumerate(positions)}
+    slots = [template_slots(templates[t]) for t in chosen]
+    doors = [0] * len(positions)
+    for i, (x, y) in enumerate(positions):
+        for dx, dy, direction in NEIGHBOURS:
+            j = index_at.get((x + dx, y + dy))
+            if j is not None and direction in slots[i] and OPPOSITE[direction] in slots[j]:
+                doors[i] |= DOOR_BITS[direction]
+    return doors
+
+
+def room_distances(positions, doors):
+    """Rooms-from-start over usable doors (-1 = unreachable)."""
+    index_at = {pos: i for i, pos in enumerate(positions)}
+    distance = [-1] * len(positions)
+    distance[0] = 0
+    queue = deque([0])
+    while queue:
+        i = queue.popleft()
+        x, y = positions[i]
+        for dx, dy, direction in NEIGHBOURS:
+            if doors[i] & DOOR_BITS[direction]:
+                j = index_at[(x + dx, y + dy)]
+                if distance[j] < 0:
+                    distance[j] = distance[i] + 1
+                    queue.append(j)
+    return distance
+
+
+def build_layout(seed, floor, templates, limits):
+    """
+    Generate and validate one seed.
+
+    Returns (record bytes, None) when accepted, else (None, rejection reason).
+    """
+    rng = SeededRandom(seed)
+    positions, types = place_rooms(rng)
+    if 'boss' not in types:
+        return None, 'no_boss_slot'
+
+    assigned = assign_templates(rng, templates, positions, types, floor)
+    if assigned is None:
+        return None, 'no_template'
+    chosen, final_types = assigned
+    if 'boss' not in final_types:
+        return None, 'no_boss_template'
+
+    doors = usable_doors(templates, positions, chosen)
+    distance = room_distances(positions, doors)
+    if min(distance) < 0:
+        boss = final_types.index('boss')
+        return None, 'boss_unreachable' if distance[boss] < 0 else 'room_unreachable'
+
+    boss = final_types.index('boss')
+    if distance[boss] < limits['min_boss_distance']:
+        return None, 'boss_too_close'
+
+    dead_ends = sum(1 for t, d in zip(final_types, doors)
+                    if t == 'normal' and bin(d).count('1') == 1)
+    if dead_ends > limits['max_dead_ends']:
+        return None, 'dead_ends'
+
+    record = bytearray(RECORD_SIZE)
+    RECORD_HEADER.pack_into(record, 0, seed, len(positions), boss, distance[boss], dead_ends)
+    for i, ((x, y), t, room_type, door_bits) in enumerate(zip(positions, chosen, final_types, doors)):
+        ROOM_ENTRY.pack_into(record, RECORD_HEADER.size + i * ROOM_ENTRY.size,
+                             x, y, t, ROOM_TYPES.index(room_type) << 4 | door_bits)
+    return bytes(record), None
+
+
+def check_batch(task):
+    """Worker: validate a batch of seeds, keeping accepted records in seed order."""
+    floor, seeds, limits = task
+    templates = load_templates()
+    accepted = []
+    rejected = Counter()
+    for seed in seeds:
+        record, reason = build_layout(seed, floor, templates, limits)
+        if record is None:
+            rejected[reason] += 1
+        else:
+            accepted.append(record)
+    return accepted, rejected
+
+
+def generate_floor(pool, workers, floor, count, seed_base, limits):
+    """Collect `count` accepted layouts for one floor, one seed batch per worker per round."""
+    next_seed = (seed_base + floor * 0x01000000) & M32
+    records = []
+    rejected = Counter()
+    checked = 0
+    while len(records) < count:
+        if checked >= count * MAX_SEEDS_PER_LAYOUT:
+            print(f"  Floor {floor}: gave up after {checked} seeds ({len(records)} accepted)")
+            break
+        tasks = []
+        for _ in range(workers):
+            tasks.append((floor, [(next_seed + k) & M32 for k in range(SEED_BATCH)], limits))
+            next_seed += SEED_BATCH
+        for accepted, batch_rejected in pool.map(check_batch, tasks):
+            records.extend(accepted)
+            rejected.update(batch_rejected)
+            checked += SEED_BATCH
+    return records[:count], rejected, checked
+
+
+def parse_floors(values):
+    if len(values) == 2:
+        return list(range(values[0], values[1] + 1))
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate validated dungeon layouts")
+    parser.add_argument("--floors", type=int, nargs="+", default=[1, 8],
+                        help="first and last floor (or a single floor)")
+    parser.add_argument("--count", type=int, default=256, help="layouts per floor")
+    parser.add_argument("--seed-base", type=int, default=0, help="first candidate seed offset")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--min-boss-distance", type=int, default=3, help="minimum rooms from start to boss")
+    parser.add_argument("--max-dead-ends", type=int, default=2, help="maximum combat rooms with a single exit")
+    args = parser.parse_args()
+
+    templates = load_templates()
+    if len(templates) > 255:
+        print("Too many room templates for a uint8 index.")
+        sys.exit(1)
+
+    floors = parse_floors(args.floors)
+    limits = {"min_boss_distance": args.min_boss_distance, "max_dead_ends": args.max_dead_ends}
+
+    print(f"Generating {args.count} layouts for floors {floors[0]}-{floors[-1]} with {args.workers} workers...")
+    index = {
+        "version": BANK_VERSION,
+        "recordSize": RECORD_SIZE,
+        "headerSize": len(BANK_MAGIC) + 4,
+        "maxRooms": MAX_LAYOUT_ROOMS,
+        "templates": [t['id'] for t in templates],
+        "roomTypes": ROOM_TYPES,
+        "doorBits": DOOR_BITS,
+        "floors": {},
+    }
+
+    bank = bytearray()
+    start_time = time.time()
+    total_checked = 0
+    with Pool(args.workers) as pool:
+        for floor in floors:
+            records, rejected, checked = generate_floor(pool, args.workers, floor, args.count, args.seed_base, limits)
+            total_checked += checked
+            index["floors"][str(floor)] = {"offset": len(bank) // RECORD_SIZE, "count": len(records)}
+            bank.extend(b''.join(records))
+
+            reasons = ", ".join(f"{reason} {n}" for reason, n in rejected.most_common())
+            print(f"  Floor {floor}: {len(records)} accepted of {checked} seeds ({reasons})")
+
+    elapsed = time.time() - start_time
+    with open(BANK_PATH, 'wb') as f:
+        f.write(BANK_MAGIC)
+        f.write(struct.pack('<I', len(bank) // RECORD_SIZE))
+        f.write(bank)
+    with open(INDEX_PATH, 'w') as f:
+        json.dump(index, f, indent=2)
+
+    print(f"Checked {total_checked} seeds in {elapsed:.1f}s ({total_checked / elapsed:.0f} seeds/s)")
+    print(f"Saved bank to: {BANK_PATH} ({len(bank) // RECORD_SIZE} layouts, {RECORD_SIZE} bytes each)")
+    print(f"Saved index to: {INDEX_PATH}")
+
+
+if __name__ == '__main__':
+    main()
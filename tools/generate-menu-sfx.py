@@ -1,56 +1,79 @@
 
+import argparse
 import os
 import sys
 from pathlib import Path
 import torch
-from transformers import AutoProcessor, MusicgenForConditionalGeneration, MusicgenConfig
 import scipy.io.wavfile as wavfile
+from model_snapshot import load_model
+from text_encoder_cache import TextEncoderCache
+from audio_codes import codes_path_for, generated_audio, generated_codes, save_codes
+from audio_fingerprint import DUPLICATES_DIR_NAME, FingerprintIndex, candidate_files, check_new_clip
 
-def generate_sfx(model, processor, prompt: str, duration: float, base_name: str, output_dir: Path):
+def generate_sfx(model, text_cache, prompt: str, duration: float, base_name: str, output_dir: Path,
+                 keep_codes: bool = False, write_wav: bool = True, index: FingerprintIndex = None,
+                 prune_dir: Path = None):
     print(f"Generating: {base_name}")
     print(f"  Prompt: {prompt}")
     
-    inputs = processor(
-        text=[prompt],
-        padding=True,
-        return_tensors="pt",
-    )
-    
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    inputs = {k: v.to(device) for k, v in inputs.items()}
     model = model.to(device)
     
+    # Reuse cached encoder states so repeated candidates skip T5
+    inputs = text_cache.generate_kwargs(prompt, device, guidance_scale=3.0)
+    
     # MusicGen small is 50 tokens/sec
     tokens_per_second = 50
     max_tokens = max(int(duration * tokens_per_second), 25) # Ensure at least some tokens
     
     with torch.no_grad():
-        audio_values = model.generate(
+        outputs = model.generate(
             **inputs,
             max_new_tokens=max_tokens,
             do_sample=True,
             guidance_scale=3.0,
+            return_dict_in_generate=True,
         )
     
     sample_rate = model.config.audio_encoder.sampling_rate
-    audio_data = audio_values[0, 0].cpu().numpy()
+    audio_data = generated_audio(outputs)
     
     # Trim to exact duration
     samples_needed = int(duration * sample_rate)
     if len(audio_data) > samples_needed:
         audio_data = audio_data[:samples_needed]
         
-    # Unique filename logic
+    # Unique filename logic (a candidate counts as taken if either file exists)
     output_path = output_dir / f"{base_name}.wav"
     counter = 1
-    while output_path.exists():
+    while output_path.exists() or codes_path_for(output_path).exists():
         output_path = output_dir / f"{base_name}_{counter}.wav"
         counter += 1
     
+    if keep_codes:
+        codes = generated_codes(outputs, model.decoder.num_codebooks)
+        save_codes(codes_path_for(output_path), codes, sample_rate,
+                   model.config.audio_encoder.frame_rate, text_cache.model_name, prompt, duration)
+    
+    if not write_wav:
+        return
+    
     wavfile.write(str(output_path), sample_rate, audio_data)
     print(f"  Saved: {output_path}")
+    
+    # Compare against earlier candidates so near-identical takes are caught now
+    if index is not None:
+        check_new_clip(index, output_path, prune_dir)
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate menu SFX candidates")
+    parser.add_argument("--save-codes", action="store_true", help="also store EnCodec tokens (.codes.npz)")
+    parser.add_argument("--codes-only", action="store_true", help="store tokens only, skip WAV output")
+    parser.add_argument("--prune-duplicates", action="store_true",
+                        help="move candidates that sound like an earlier one to output/duplicates/")
+    parser.add_argument("--no-snapshot", action="store_true", help="load from the hub even if a local snapshot exists")
+    args = parser.parse_args()
+    
     print("Generating Menu SFX...")
     
     # Output directory
@@ -60,15 +83,15 @@ def main():
     model_name = "facebook/musicgen-small"
     
     try:
-        # Fix for transformers bug
-        MusicgenForConditionalGeneration.config_class = MusicgenConfig
-        
-        print(f"Loading model: {model_name}")
-        processor = AutoProcessor.from_pretrained(model_name)
-        model = MusicgenForConditionalGeneration.from_pretrained(model_name)
+        processor, model = load_model(model_name, use_snapshot=not args.no_snapshot)
     except Exception as e:
         print(f"Error loading model: {e}")
         sys.exit(1)
+    
+    text_cache = TextEncoderCache(model, processor, model_name)
+    index = FingerprintIndex()
+    index.sync(candidate_files(OUTPUT_DIR))
+    prune_dir = OUTPUT_DIR / DUPLICATES_DIR_NAME if args.prune_duplicates else None
         
     # Prompts for menu clicks
     # 8bit/retro style to match the music
@@ -81,7 +104,11 @@ def main():
     ]
     
     for name, prompt in prompts:
-        generate_sfx(model, processor, prompt, 0.5, name, OUTPUT_DIR)
+        generate_sfx(model, text_cache, prompt, 0.5, name, OUTPUT_DIR,
+                     keep_codes=args.save_codes or args.codes_only, write_wav=not args.codes_only,
+                     index=index, prune_dir=prune_dir)
+    
+    print(text_cache.summary())
 
 if __name__ == "__main__":
     main()
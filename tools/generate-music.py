@@ -14,10 +14,13 @@ For GPU acceleration (recommended):
 
 Usage:
     python generate-music.py
+    python generate-music.py --save-codes   # also keep EnCodec tokens
+    python generate-music.py --codes-only   # tokens only, render later with decode-codes.py
 
 The generated files will be saved to ../assets/audio/music/
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -25,8 +28,10 @@ from pathlib import Path
 # Check dependencies
 try:
     import torch
-    from transformers import AutoProcessor, MusicgenForConditionalGeneration, MusicgenConfig
     import scipy.io.wavfile as wavfile
+    from model_snapshot import load_model
+    from text_encoder_cache import TextEncoderCache
+    from audio_codes import codes_path_for, generated_audio, generated_codes, save_codes
 except ImportError:
     print("Missing dependencies. Install with:")
     print("  pip install torch torchaudio transformers scipy")
@@ -66,42 +71,48 @@ MUSIC_PROMPTS = {
 }
 
 
-def generate_music(model, processor, prompt: str, duration: int, output_path: Path):
+def generate_music(model, text_cache, prompt: str, duration: int, output_path: Path,
+                   keep_codes: bool = False, write_wav: bool = True):
     """Generate music from a text prompt."""
     print(f"Generating: {output_path.name}")
     print(f"  Prompt: {prompt[:50]}...")
     print(f"  Duration: {duration}s")
     
-    # Prepare inputs
-    inputs = processor(
-        text=[prompt],
-        padding=True,
-        return_tensors="pt",
-    )
-    
     # Move to GPU if available
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    inputs = {k: v.to(device) for k, v in inputs.items()}
     model = model.to(device)
     
+    # Prepare inputs (encoder states are cached per prompt across runs)
+    inputs = text_cache.generate_kwargs(prompt, device, guidance_scale=3.0)
+    
     # Generate (256 tokens ≈ 5 seconds for musicgen-small)
     # Adjust max_new_tokens based on desired duration
     tokens_per_second = 50  # approximate for musicgen-small
     max_tokens = duration * tokens_per_second
     
     with torch.no_grad():
-        audio_values = model.generate(
+        outputs = model.generate(
             **inputs,
             max_new_tokens=min(max_tokens, 1500),  # Cap at ~30s for memory
             do_sample=True,
             guidance_scale=3.0,
+            return_dict_in_generate=True,
         )
     
     # Get sample rate from model config
     sample_rate = model.config.audio_encoder.sampling_rate
     
+    # Keep the discrete tokens so the track can be re-rendered later
+    if keep_codes:
+        codes = generated_codes(outputs, model.decoder.num_codebooks)
+        save_codes(codes_path_for(output_path), codes, sample_rate,
+                   model.config.audio_encoder.frame_rate, text_cache.model_name, prompt)
+    
+    if not write_wav:
+        return output_path
+    
     # Convert to numpy and save
-    audio_data = audio_values[0, 0].cpu().numpy()
+    audio_data = generated_audio(outputs)
     wavfile.write(str(output_path), sample_rate, audio_data)
     
     print(f"  Saved: {output_path}")
@@ -109,6 +120,12 @@ def generate_music(model, processor, prompt: str, duration: int, output_path: Pa
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate game music with MusicGen")
+    parser.add_argument("--save-codes", action="store_true", help="also store EnCodec tokens (.codes.npz)")
+    parser.add_argument("--codes-only", action="store_true", help="store tokens only, skip WAV output")
+    parser.add_argument("--no-snapshot", action="store_true", help="load from the hub even if a local snapshot exists")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("MusicGen Audio Generator for Arcane Depths")
     print("=" * 60)
@@ -126,17 +143,14 @@ def main():
     model_name = "facebook/musicgen-small"
     
     try:
-        # Fix for transformers bug where config_class is incorrect
-        MusicgenForConditionalGeneration.config_class = MusicgenConfig
-        
-        processor = AutoProcessor.from_pretrained(model_name)
-        model = MusicgenForConditionalGeneration.from_pretrained(model_name)
-        print(f"Loaded model: {model_name}")
+        processor, model = load_model(model_name, use_snapshot=not args.no_snapshot)
     except Exception as e:
         print(f"Error loading model: {e}")
         print("\nTry running: huggingface-cli login")
         sys.exit(1)
     
+    text_cache = TextEncoderCache(model, processor, model_name)
+    
     # Generate each track
     print(f"\nGenerating {len(MUSIC_PROMPTS)} tracks...")
     print(f"Output directory: {OUTPUT_DIR}")
@@ -148,16 +162,19 @@ def main():
         try:
             generate_music(
                 model=model,
-                processor=processor,
+                text_cache=text_cache,
                 prompt=config["prompt"],
                 duration=config["duration"],
                 output_path=output_path,
+                keep_codes=args.save_codes or args.codes_only,
+                write_wav=not args.codes_only,
             )
         except Exception as e:
             print(f"  ERROR generating {name}: {e}")
             continue
     
     print("-" * 60)
+    print(text_cache.summary())
     print("Done! Convert to MP3/OGG for smaller file sizes:")
     print("  ffmpeg -i menu.wav -b:a 128k menu.mp3")
     print("  ffmpeg -i menu.wav -c:a libvorbis -q:a 4 menu.ogg")
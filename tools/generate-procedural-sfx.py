@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Procedural SFX Generator (sfxr-style, NumPy)
+============================================
+
+Renders retro sound effects from sfxr parameter sets without any AI model.
+Whole batches of parameter sets are rendered at once as (clips, samples)
+NumPy arrays, so hundreds of short clips render per second on a CPU and
+the same seed always produces the same file.
+
+Parameters use the sfxr/jsfxr names and 0..1 ranges (ramps are -1..1):
+    wave_type          0 square, 1 sawtooth, 2 sine, 3 noise
+    env_attack / env_sustain / env_punch / env_decay
+    base_freq / freq_limit / freq_ramp / freq_dramp
+    vib_strength / vib_speed
+    arp_mod / arp_speed
+    duty / duty_ramp
+    repeat_speed
+    lpf_freq / lpf_ramp / lpf_resonance / hpf_freq / hpf_ramp
+    sound_vol
+
+Differences from the reference sfxr loop: the oscillator runs at the
+output rate instead of 8x oversampling, and filter ramps are applied per
+block of samples rather than per sample. The phaser is not modelled.
+
+Requirements:
+    pip install numpy scipy
+
+Usage:
+    python generate-procedural-sfx.py                       # every preset
+    python generate-procedural-sfx.py ui_click pickup_item  # selected presets
+    python generate-procedural-sfx.py --variations 8 --seed 7
+
+The generated files will be saved to ./output/procedural/
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Check dependencies
+try:
+    import numpy as np
+    import scipy.io.wavfile as wavfile
+    from scipy.signal import lfilter
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install numpy scipy")
+    sys.exit(1)
+
+# Output directory
+OUTPUT_DIR = Path(__file__).parent / "output" / "procedural"
+
+SAMPLE_RATE = 44100
+
+# Output gain; keeps a full-punch sine envelope (peak 2.2) below clipping
+MASTER_VOL = 0.4
+
+# Filter coefficients are held constant over blocks of this many samples
+FILTER_BLOCK = 512
+
+# Clips rendered together in one set of array operations
+RENDER_CHUNK = 32
+
+SQUARE, SAWTOOTH, SINE, NOISE = 0, 1, 2, 3
+
+DEFAULT_PARAMS = {
+    "wave_type": SQUARE,
+    "env_attack": 0.0,
+    "env_sustain": 0.3,
+    "env_punch": 0.0,
+    "env_decay": 0.4,
+    "base_freq": 0.3,
+    "freq_limit": 0.0,
+    "freq_ramp": 0.0,
+    "freq_dramp": 0.0,
+    "vib_strength": 0.0,
+    "vib_speed": 0.0,
+    "arp_mod": 0.0,
+    "arp_speed": 0.0,
+    "duty": 0.0,
+    "duty_ramp": 0.0,
+    "repeat_speed": 0.0,
+    "lpf_freq": 1.0,
+    "lpf_ramp": 0.0,
+    "lpf_resonance": 0.0,
+    "hpf_freq": 0.0,
+    "hpf_ramp": 0.0,
+    "sound_vol": 0.5,
+}
+
+# Presets covering the SFX_PROMPTS categories in generate-sfx.py plus the
+# menu sounds shipped in assets/audio/sfx
+SFX_PRESETS = {
+    # Spells
+    "spell_fire": {
+        "wave_type": NOISE, "env_attack": 0.05, "env_sustain": 0.25, "env_punch": 0.3,
+        "env_decay": 0.45, "base_freq": 0.45, "freq_ramp": -0.2, "lpf_freq": 0.6,
+        "lpf_ramp": -0.15, "lpf_resonance": 0.3,
+    },
+    "spell_ice": {
+        "wave_type": SINE, "env_sustain": 0.2, "env_punch": 0.4, "env_decay": 0.4,
+        "base_freq": 0.75, "freq_ramp": 0.1, "vib_strength": 0.3, "vib_speed": 0.7,
+        "arp_mod": 0.5, "arp_speed": 0.6, "hpf_freq": 0.2,
+    },
+    "spell_lightning": {
+        "wave_type": SAWTOOTH, "env_sustain": 0.15, "env_punch": 0.6, "env_decay": 0.35,
+        "base_freq": 0.8, "freq_ramp": -0.45, "repeat_speed": 0.7, "duty": 0.3,
+        "hpf_freq": 0.15,
+    },
+    "spell_arcane": {
+        "wave_type": SQUARE, "env_attack": 0.1, "env_sustain": 0.25, "env_decay": 0.4,
+        "base_freq": 0.5, "freq_ramp": 0.15, "vib_strength": 0.2, "vib_speed": 0.5,
+        "duty": 0.4, "duty_ramp": 0.3, "lpf_freq": 0.7, "lpf_resonance": 0.5,
+    },
+
+    # Combat
+    "hit_enemy": {
+        "wave_type": NOISE, "env_sustain": 0.05, "env_punch": 0.5, "env_decay": 0.2,
+        "base_freq": 0.5, "freq_ramp": -0.4, "lpf_freq": 0.8,
+    },
+    "hit_player": {
+        "wave_type": SQUARE, "env_sustain": 0.08, "env_punch": 0.4, "env_decay": 0.25,
+        "base_freq": 0.35, "freq_ramp": -0.5, "duty": 0.6, "hpf_freq": 0.05,
+    },
+    "enemy_death": {
+        "wave_type": SAWTOOTH, "env_sustain": 0.2, "env_punch": 0.2, "env_decay": 0.55,
+        "base_freq": 0.4, "freq_ramp": -0.3, "freq_dramp": -0.2, "vib_strength": 0.4,
+        "vib_speed": 0.4, "lpf_freq": 0.55,
+    },
+    "explosion": {
+        "wave_type": NOISE, "env_sustain": 0.3, "env_punch": 0.6, "env_decay": 0.6,
+        "base_freq": 0.2, "freq_ramp": -0.1, "repeat_speed": 0.35, "lpf_freq": 0.5,
+        "lpf_ramp": -0.05,
+    },
+
+    # Items
+    "pickup_item": {
+        "wave_type": SQUARE, "env_sustain": 0.05, "env_punch": 0.45, "env_decay": 0.3,
+        "base_freq": 0.5, "arp_mod": 0.45, "arp_speed": 0.6, "duty": 0.2,
+    },
+    "pickup_health": {
+        "wave_type": SINE, "env_attack": 0.1, "env_sustain": 0.15, "env_decay": 0.35,
+        "base_freq": 0.4, "freq_ramp": 0.2, "vib_strength": 0.15, "vib_speed": 0.6,
+    },
+    "pickup_mana": {
+        "wave_type": SINE, "env_sustain": 0.1, "env_punch": 0.3, "env_decay": 0.35,
+        "base_freq": 0.55, "arp_mod": 0.35, "arp_speed": 0.55, "vib_strength": 0.2,
+        "vib_speed": 0.8,
+    },
+    "chest_open": {
+        "wave_type": SAWTOOTH, "env_attack": 0.05, "env_sustain": 0.3, "env_decay": 0.35,
+        "base_freq": 0.25, "freq_ramp": 0.08, "vib_strength": 0.5, "vib_speed": 0.3,
+        "lpf_freq": 0.4, "lpf_resonance": 0.4,
+    },
+
+    # Environment
+    "door_open": {
+        "wave_type": NOISE, "env_attack": 0.15, "env_sustain": 0.4, "env_decay": 0.45,
+        "base_freq": 0.12, "freq_ramp": 0.02, "lpf_freq": 0.3, "lpf_resonance": 0.3,
+        "sound_vol": 0.35,
+    },
+    "footstep": {
+        "wave_type": NOISE, "env_sustain": 0.03, "env_punch": 0.3, "env_decay": 0.15,
+        "base_freq": 0.3, "freq_ramp": -0.3, "lpf_freq": 0.35,
+    },
+
+    # UI
+    "ui_click": {
+        "wave_type": SQUARE, "env_sustain": 0.05, "env_decay": 0.2, "base_freq": 0.6,
+        "duty": 0.5, "hpf_freq": 0.1,
+    },
+    "ui_hover": {
+        "wave_type": SINE, "env_sustain": 0.06, "env_decay": 0.2, "base_freq": 0.45,
+        "freq_ramp": 0.25,
+    },
+    "ui_back": {
+        "wave_type": SQUARE, "env_sustain": 0.04, "env_decay": 0.15, "base_freq": 0.35,
+        "freq_ramp": -0.2, "duty": 0.3,
+    },
+    "ui_start": {
+        "wave_type": SQUARE, "env_sustain": 0.1, "env_punch": 0.3, "env_decay": 0.3,
+        "base_freq": 0.4, "arp_mod": 0.4, "arp_speed": 0.55, "duty": 0.25,
+    },
+    "level_up": {
+        "wave_type": SQUARE, "env_sustain": 0.35, "env_punch": 0.35, "env_decay": 0.5,
+        "base_freq": 0.35, "arp_mod": 0.55, "arp_speed": 0.45, "repeat_speed": 0.45,
+        "duty": 0.35,
+    },
+}
+
+# Parameters jittered when generating variations (name -> max absolute change)
+MUTATIONS = {
+    "base_freq": 0.05,
+    "freq_ramp": 0.05,
+    "env_sustain": 0.03,
+    "env_decay": 0.05,
+    "env_punch": 0.05,
+    "duty": 0.05,
+    "vib_speed": 0.05,
+    "lpf_freq": 0.05,
+}
+
+
+def make_params(preset: dict) -> dict:
+    """Fill in sfxr defaults for any parameter a preset leaves out."""
+    params = dict(DEFAULT_PARAMS)
+    params.update(preset)
+    return params
+
+
+def mutate(params: dict, rng, amount: float = 1.0) -> dict:
+    """Return a jittered copy of a parameter set (sfxr's "mutate" button)."""
+    mutated = dict(params)
+    for name, spread in MUTATIONS.items():
+        low = -1.0 if name.endswith("_ramp") else 0.0
+        mutated[name] = float(np.clip(params[name] + rng.uniform(-spread, spread) * amount, low, 1.0))
+    return mutated
+
+
+def _column(param_sets, name):
+    return np.array([p[name] for p in param_sets], dtype=np.float64)[:, None]
+
+
+def _noise(cycle_index, seeds):
+    """Deterministic white noise in [-1, 1) from integer (cycle, seed) pairs."""
+    x = cycle_index.astype(np.uint32) * np.uint32(0x9E3779B1) ^ seeds.astype(np.uint32)
+    x ^= x >> np.uint32(16)
+    x *= np.uint32(0x7FEB352D)
+    x ^= x >> np.uint32(15)
+    x *= np.uint32(0x846CA68B)
+    x ^= x >> np.uint32(16)
+    return x.astype(np.float64) / 2147483648.0 - 1.0
+
+
+def _filter_rows(signal, coefficients):
+    """
+    Run a per-row IIR filter whose coefficients may change every block.
+
+    `coefficients(row, block_start)` returns (b, a) for that block; the
+    filter state carries over between blocks.
+    """
+    out = np.empty_like(signal)
+    for row in range(signal.shape[0]):
+        zi = None
+        for start in range(0, signal.shape[1], FILTER_BLOCK):
+            b, a = coefficients(row, start)
+            block = signal[row, start:start + FILTER_BLOCK]
+            if zi is None:
+                zi = np.zeros(max(len(a), len(b)) - 1)
+            out[row, start:start + FILTER_BLOCK], zi = lfilter(b, a, block, zi=zi)
+    return out
+
+
+def render_batch(param_sets, seeds=None, sample_rate: int = SAMPLE_RATE):
+    """
+    Render a batch of sfxr parameter sets.
+
+    Returns (audio, lengths): a float32 (clips, samples) array padded with
+    silence to the longest clip, and the length of each clip in samples.
+    Clips are rendered in chunks of similar length so short UI blips are
+    not padded out to the longest explosion.
+    """
+    n = len(param_sets)
+    seeds = np.arange(n) if seeds is None else np.asarray(seeds)
+    lengths = np.array([sum(max(p[name] ** 2 * 100000 * sample_rate / 44100.0, 1)
+                            for name in ("env_attack", "env_sustain", "env_decay"))
+                        for p in param_sets]).astype(np.int64)
+    audio = np.zeros((n, int(lengths.max())), dtype=np.float32)
+
+    order = np.argsort(lengths, kind="stable")
+    for start in range(0, n, RENDER_CHUNK):
+        rows = order[start:start + RENDER_CHUNK]
+        chunk, chunk_lengths = _render_chunk([param_sets[i] for i in rows], seeds[rows], sample_rate)
+        audio[rows, :chunk.shape[1]] = chunk
+        lengths[rows] = chunk_lengths
+    return audio, lengths
+
+
+def _render_chunk(param_sets, seeds, sample_rate):
+    n = len(param_sets)
+    col = lambda name: _column(param_sets, name)  # noqa: E731
+
+    # sfxr envelope stage lengths are defined at 44.1 kHz
+    rate_scale = sample_rate / 44100.0
+    env_len = [np.maximum(col(name) ** 2 * 100000 * rate_scale, 1) for name in ("env_attack", "env_sustain", "env_decay")]
+    lengths = (env_len[0] + env_len[1] + env_len[2])[:, 0].astype(np.int64)
+    total = int(lengths.max())
+    t = np.arange(total, dtype=np.float64)[None, :]
+
+    # Envelope: attack ramp, punchy sustain, linear decay
+    punch = col("env_punch")
+    a_end = env_len[0]
+    s_end = a_end + env_len[1]
+    d_end = s_end + env_len[2]
+    env = np.select(
+        [t < a_end, t < s_end, t < d_end],
+        [t / a_end, 1.0 + (1.0 - (t - a_end) / env_len[1]) * 2.0 * punch, 1.0 - (t - s_end) / env_len[2]],
+        0.0,
+    )
+    if np.any(col("env_attack") == 0):
+        # A zero-length attack starts straight at the sustain level
+        env = np.where((col("env_attack") == 0) & (t == 0), 1.0 + 2.0 * punch, env)
+
+    # Repeat restarts the pitch sweep, arpeggio and duty sweep
+    repeat = col("repeat_speed")
+    rep_limit = np.where(repeat > 0, ((1.0 - repeat) ** 2 * 20000 + 32) * rate_scale, total + 1)
+    local_t = np.mod(t, np.floor(rep_limit))
+    local_index = local_t.astype(np.int64)
+
+    # Period sweep: fperiod *= fslide every sample while fslide += fdslide.
+    # Both are closed-form per local sample index, so a cumulative sum of
+    # log(fslide) gives the whole trajectory at once.
+    fperiod0 = 100.0 / (col("base_freq") ** 2 + 0.001)
+    fmaxperiod = 100.0 / (col("freq_limit") ** 2 + 0.001)
+    fslide0 = 1.0 - col("freq_ramp") ** 3 * 0.01
+    fdslide = -col("freq_dramp") ** 3 * 0.000001
+    steps = np.arange(1, total + 1, dtype=np.float64)[None, :] / rate_scale
+    log_slide = np.cumsum(np.log(np.clip(fslide0 + steps * fdslide, 1e-6, None)) / rate_scale, axis=1)
+    log_slide = np.concatenate([np.zeros((n, 1)), log_slide], axis=1)
+    period = fperiod0 * np.exp(np.take_along_axis(log_slide, local_index, axis=1))
+
+    # freq_limit ends the sound once the period passes the floor frequency
+    limited = col("freq_limit") > 0
+    alive = ~(limited & (period > fmaxperiod))
+    alive = np.cumprod(alive, axis=1).astype(bool)
+    period = np.minimum(period, fmaxperiod)
+
+    # Arpeggio: a single pitch jump after arp_limit samples
+    arp = col("arp_mod")
+    arp_mul = np.where(arp >= 0, 1.0 - arp ** 2 * 0.9, 1.0 + arp ** 2 * 10.0)
+    arp_speed = col("arp_speed")
+    arp_limit = np.where(arp_speed == 1.0, 0.0, ((1.0 - arp_speed) ** 2 * 20000 + 32) * rate_scale)
+    period = np.where((arp != 0) & (local_t >= arp_limit), period * arp_mul, period)
+
+    # Vibrato
+    vib_amp = col("vib_strength") ** 2 * 0.5
+    vib_speed = col("vib_speed") ** 2 * 0.01 / rate_scale
+    period = period * (1.0 + np.sin(t * vib_speed) * vib_amp)
+
+    # sfxr periods count 8x-oversampled steps at 44.1 kHz
+    period = np.maximum(period, 8.0)
+    phase = np.cumsum(8.0 / (period * rate_scale), axis=1)
+    frac = phase - np.floor(phase)
+
+    duty = np.clip(0.5 - col("duty") * 0.5 + local_t * (-col("duty_ramp") * 0.00005 / rate_scale), 0.0, 0.5)
+
+    wave = col("wave_type").astype(np.int64)
+    seed_col = seeds[:, None]
+    waveform = np.select(
+        [wave == SQUARE, wave == SAWTOOTH, wave == SINE],
+        [np.where(frac < duty, 0.5, -0.5), 1.0 - frac * 2.0, np.sin(frac * 2.0 * np.pi)],
+        _noise(np.floor(phase * 32.0).astype(np.int64), seed_col),
+    )
+
+    # Low-pass: the sfxr resonant filter is a 2nd-order recurrence,
+    # p'' = a*w*x - (a*w - 1 - a) p' - a p with a = 1 - damping
+    lpf_freq = col("lpf_freq")[:, 0]
+    lpf_ramp = col("lpf_ramp")[:, 0]
+    resonance = col("lpf_resonance")[:, 0]
+    needs_lpf = (lpf_freq < 1.0) | (lpf_ramp != 0)
+
+    def lpf_coefficients(row, start):
+        w0 = lpf_freq[row] ** 3 * 0.1
+        w = float(np.clip(w0 * (1.0 + lpf_ramp[row] * 0.0001) ** (start / rate_scale), 0.0, 0.1))
+        damping = min(5.0 / (1.0 + resonance[row] ** 2 * 20.0) * (0.01 + w), 0.8)
+        a = 1.0 - damping
+        return [a * w], [1.0, a * w - 1.0 - a, a]
+
+    if needs_lpf.any():
+        rows = np.flatnonzero(needs_lpf)
+        filtered = _filter_rows(waveform[rows], lambda r, s: lpf_coefficients(rows[r], s))
+        waveform[rows] = filtered
+
+    # High-pass: y' = (y + x' - x) * (1 - hp)
+    hpf_freq = col("hpf_freq")[:, 0]
+    hpf_ramp = col("hpf_ramp")[:, 0]
+    needs_hpf = (hpf_freq > 0) | (hpf_ramp != 0)
+
+    def hpf_coefficients(row, start):
+        hp0 = hpf_freq[row] ** 2 * 0.1
+        hp = float(np.clip(hp0 * (1.0 + hpf_ramp[row] * 0.0003) ** (start / rate_scale), 0.00001, 0.1))
+        return [1.0 - hp, -(1.0 - hp)], [1.0, -(1.0 - hp)]
+
+    if needs_hpf.any():
+        rows = np.flatnonzero(needs_hpf)
+        waveform[rows] = _filter_rows(waveform[rows], lambda r, s: hpf_coefficients(rows[r], s))
+
+    audio = waveform * env * alive * MASTER_VOL * 2.0 * col("sound_vol")
+    audio = np.where(t < lengths[:, None], audio, 0.0)
+    return np.clip(audio, -1.0, 1.0).astype(np.float32), lengths
+
+
+def write_wav(path: Path, audio: np.ndarray, sample_rate: int = SAMPLE_RATE):
+    """Write a float clip as 16-bit PCM."""
+    wavfile.write(str(path), sample_rate, (audio * 32767).astype(np.int16))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render sfxr-style SFX presets with NumPy")
+    parser.add_argument("names", nargs="*", help="presets to render (default: all)")
+    parser.add_argument("--variations", type=int, default=1, help="clips per preset")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for variations and noise")
+    parser.add_argument("--sample-rate", type=int, default=SAMPLE_RATE)
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR, help="output directory")
+    args = parser.parse_args()
+
+    names = args.names or list(SFX_PRESETS)
+    unknown = [name for name in names if name not in SFX_PRESETS]
+    if unknown:
+        print(f"Unknown presets: {', '.join(unknown)}")
+        print(f"Available: {', '.join(SFX_PRESETS)}")
+        sys.exit(1)
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(args.seed)
+
+    # Variation 0 is always the preset itself
+    param_sets, filenames = [], []
+    for name in names:
+        base = make_params(SFX_PRESETS[name])
+        for i in range(args.variations):
+            param_sets.append(base if i == 0 else mutate(base, rng))
+            filenames.append(f"{name}.wav" if i == 0 else f"{name}_{i}.wav")
+
+    print(f"Rendering {len(param_sets)} clips...")
+    start = time.perf_counter()
+    seeds = args.seed * 1000003 + np.arange(len(param_sets))
+    audio, lengths = render_batch(param_sets, seeds, args.sample_rate)
+    elapsed = time.perf_counter() - start
+
+    for filename, clip, length in zip(filenames, audio, lengths):
+        write_wav(args.out / filename, clip[:length], args.sample_rate)
+
+    print(f"Rendered {len(param_sets)} clips in {elapsed:.2f}s ({len(param_sets) / max(elapsed, 1e-9):.0f} clips/s)")
+    print(f"Output: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,24 @@
 
+import argparse
 import os
 import sys
 from pathlib import Path
 import torch
-from transformers import AutoProcessor, MusicgenForConditionalGeneration, MusicgenConfig
 import scipy.io.wavfile as wavfile
+from model_snapshot import load_model
+from text_encoder_cache import TextEncoderCache
+from audio_codes import codes_path_for, generated_audio, generated_codes, save_codes
+from audio_fingerprint import DUPLICATES_DIR_NAME, FingerprintIndex, candidate_files, check_new_clip
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate a short music sample")
+    parser.add_argument("--save-codes", action="store_true", help="also store EnCodec tokens (.codes.npz)")
+    parser.add_argument("--codes-only", action="store_true", help="store tokens only, skip WAV output")
+    parser.add_argument("--prune-duplicates", action="store_true",
+                        help="move the sample to output/duplicates/ if it sounds like an earlier one")
+    parser.add_argument("--no-snapshot", action="store_true", help="load from the hub even if a local snapshot exists")
+    args = parser.parse_args()
+    
     print("Generating short sample music...")
     
     # Output directory
@@ -16,12 +28,7 @@ def main():
     model_name = "facebook/musicgen-small"
     
     try:
-        # Fix for transformers bug
-        MusicgenForConditionalGeneration.config_class = MusicgenConfig
-        
-        print(f"Loading model: {model_name}")
-        processor = AutoProcessor.from_pretrained(model_name)
-        model = MusicgenForConditionalGeneration.from_pretrained(model_name)
+        processor, model = load_model(model_name, use_snapshot=not args.no_snapshot)
     except Exception as e:
         print(f"Error loading model: {e}")
         sys.exit(1)
@@ -33,40 +40,50 @@ def main():
     output_path = OUTPUT_DIR / f"{base_name}.wav"
     
     counter = 1
-    while output_path.exists():
+    while output_path.exists() or codes_path_for(output_path).exists():
         output_path = OUTPUT_DIR / f"{base_name}_{counter}.wav"
         counter += 1
     
+    # Earlier candidates, to compare the new sample against
+    index = FingerprintIndex()
+    index.sync(candidate_files(OUTPUT_DIR))
+    
     print(f"Generating: {output_path.name}")
     print(f"  Prompt: {prompt}")
     print(f"  Duration: {duration}s")
     
-    inputs = processor(
-        text=[prompt],
-        padding=True,
-        return_tensors="pt",
-    )
-    
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    inputs = {k: v.to(device) for k, v in inputs.items()}
     model = model.to(device)
     
+    # Encoder states are cached on disk, so reruns of the same prompt skip T5
+    text_cache = TextEncoderCache(model, processor, model_name)
+    inputs = text_cache.generate_kwargs(prompt, device, guidance_scale=3.0)
+    
     tokens_per_second = 50
     max_tokens = duration * tokens_per_second
     
     with torch.no_grad():
-        audio_values = model.generate(
+        outputs = model.generate(
             **inputs,
             max_new_tokens=max_tokens,
             do_sample=True,
             guidance_scale=3.0,
+            return_dict_in_generate=True,
         )
         
     sample_rate = model.config.audio_encoder.sampling_rate
-    audio_data = audio_values[0, 0].cpu().numpy()
-    wavfile.write(str(output_path), sample_rate, audio_data)
     
-    print(f"Saved: {output_path}")
+    if args.save_codes or args.codes_only:
+        codes = generated_codes(outputs, model.decoder.num_codebooks)
+        save_codes(codes_path_for(output_path), codes, sample_rate,
+                   model.config.audio_encoder.frame_rate, model_name, prompt, duration)
+    
+    if not args.codes_only:
+        audio_data = generated_audio(outputs)
+        wavfile.write(str(output_path), sample_rate, audio_data)
+        print(f"Saved: {output_path}")
+        check_new_clip(index, output_path, OUTPUT_DIR / DUPLICATES_DIR_NAME if args.prune_duplicates else None)
+    print(text_cache.summary())
 
 if __name__ == "__main__":
     main()
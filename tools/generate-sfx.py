@@ -11,10 +11,15 @@ Requirements:
 
 Usage:
     python generate-sfx.py
+    python generate-sfx.py --save-codes     # also keep EnCodec tokens
+    python generate-sfx.py --codes-only     # tokens only, render later with decode-codes.py
+    python generate-sfx.py --silence-db -50 # stop once the tail stays below -50 dBFS
+    python generate-sfx.py --no-early-stop  # always run the full token budget
 
 The generated files will be saved to ../assets/audio/sfx/
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -22,8 +27,12 @@ from pathlib import Path
 # Check dependencies
 try:
     import torch
-    from transformers import AutoProcessor, MusicgenForConditionalGeneration, MusicgenConfig
+    from transformers import StoppingCriteriaList
     import scipy.io.wavfile as wavfile
+    from model_snapshot import load_model
+    from text_encoder_cache import TextEncoderCache
+    from audio_codes import codes_path_for, generated_audio, generated_codes, save_codes
+    from silence_stopping import SilenceStoppingCriteria, SILENCE_DB, SILENCE_HOLD
 except ImportError:
     print("Missing dependencies. Install with:")
     print("  pip install torch torchaudio transformers scipy")
@@ -115,34 +124,58 @@ SFX_PROMPTS = {
 }
 
 
-def generate_sfx(model, processor, prompt: str, duration: float, output_path: Path):
-    """Generate a sound effect from a text prompt."""
+def generate_sfx(model, text_cache, prompt: str, duration: float, output_path: Path,
+                 keep_codes: bool = False, write_wav: bool = True, early_stop: dict = None) -> int:
+    """
+    Generate a sound effect from a text prompt.
+    
+    `early_stop` holds SilenceStoppingCriteria options (None = full budget).
+    Returns the number of tokens saved by stopping early.
+    """
     print(f"Generating: {output_path.name}")
     
-    inputs = processor(
-        text=[prompt],
-        padding=True,
-        return_tensors="pt",
-    )
-    
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    inputs = {k: v.to(device) for k, v in inputs.items()}
     model = model.to(device)
     
+    # Encoder states come from the on-disk cache; T5 only runs for new prompts
+    inputs = text_cache.generate_kwargs(prompt, device, guidance_scale=3.0)
+    
     # Short duration for SFX
     tokens_per_second = 50
     max_tokens = max(int(duration * tokens_per_second), 25)
     
+    # End generation once the clip has decayed to silence
+    stopper = None
+    stopping_criteria = None
+    if early_stop is not None:
+        stopper = SilenceStoppingCriteria(model, max_tokens, **early_stop)
+        stopping_criteria = StoppingCriteriaList([stopper])
+    
     with torch.no_grad():
-        audio_values = model.generate(
+        outputs = model.generate(
             **inputs,
             max_new_tokens=max_tokens,
             do_sample=True,
             guidance_scale=3.0,
+            return_dict_in_generate=True,
+            stopping_criteria=stopping_criteria,
         )
     
+    if stopper is not None:
+        print(stopper.report())
+    saved = stopper.tokens_saved if stopper is not None else 0
+    
     sample_rate = model.config.audio_encoder.sampling_rate
-    audio_data = audio_values[0, 0].cpu().numpy()
+    
+    if keep_codes:
+        codes = generated_codes(outputs, model.decoder.num_codebooks)
+        save_codes(codes_path_for(output_path), codes, sample_rate,
+                   model.config.audio_encoder.frame_rate, text_cache.model_name, prompt, duration)
+    
+    if not write_wav:
+        return saved
+    
+    audio_data = generated_audio(outputs)
     
     # Trim to exact duration
     samples_needed = int(duration * sample_rate)
@@ -151,9 +184,21 @@ def generate_sfx(model, processor, prompt: str, duration: float, output_path: Pa
     
     wavfile.write(str(output_path), sample_rate, audio_data)
     print(f"  Saved: {output_path}")
+    return saved
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate game SFX with MusicGen")
+    parser.add_argument("--save-codes", action="store_true", help="also store EnCodec tokens (.codes.npz)")
+    parser.add_argument("--codes-only", action="store_true", help="store tokens only, skip WAV output")
+    parser.add_argument("--no-early-stop", action="store_true", help="disable silence-aware early stopping")
+    parser.add_argument("--silence-db", type=float, default=SILENCE_DB, help="tail level counted as silence (dBFS)")
+    parser.add_argument("--silence-hold", type=float, default=SILENCE_HOLD, help="seconds of silence before stopping")
+    parser.add_argument("--no-snapshot", action="store_true", help="load from the hub even if a local snapshot exists")
+    args = parser.parse_args()
+    
+    early_stop = None if args.no_early_stop else {"threshold_db": args.silence_db, "hold": args.silence_hold}
+    
     print("=" * 60)
     print("AudioGen SFX Generator for Arcane Depths")
     print("=" * 60)
@@ -170,27 +215,31 @@ def main():
     model_name = "facebook/musicgen-small"
     
     try:
-        # Fix for transformers bug
-        MusicgenForConditionalGeneration.config_class = MusicgenConfig
-        
-        processor = AutoProcessor.from_pretrained(model_name)
-        model = MusicgenForConditionalGeneration.from_pretrained(model_name)
+        processor, model = load_model(model_name, use_snapshot=not args.no_snapshot)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
     
+    text_cache = TextEncoderCache(model, processor, model_name)
+    
     print(f"\nGenerating {len(SFX_PROMPTS)} sound effects...")
     print(f"Output: {OUTPUT_DIR}")
     print("-" * 60)
     
+    tokens_saved = 0
     for name, config in SFX_PROMPTS.items():
         output_path = OUTPUT_DIR / f"{name}.wav"
         try:
-            generate_sfx(model, processor, config["prompt"], config["duration"], output_path)
+            tokens_saved += generate_sfx(model, text_cache, config["prompt"], config["duration"], output_path,
+                                         keep_codes=args.save_codes or args.codes_only,
+                                         write_wav=not args.codes_only, early_stop=early_stop)
         except Exception as e:
             print(f"  ERROR: {e}")
     
     print("-" * 60)
+    print(text_cache.summary())
+    if early_stop is not None:
+        print(f"Early stopping saved {tokens_saved} decoder steps")
     print("Done! Consider converting to OGG for web compatibility.")
 
 
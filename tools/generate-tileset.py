@@ -6,17 +6,28 @@ Output: 16x16 pixel tiles in a tileset PNG
 - Rows 0-1: Floor variations (8 tiles) - dark stone with subtle patterns
 - Row 2: Wall tiles (4 tiles) - stone brick walls
 - Row 3: Special tiles (transitions, corners)
+- Rows 4-9: 47-tile blob autotile walls (see autotile.py)
+- Rows 10-15: 47-tile blob autotile floor shadow overlays
 """
 
 from PIL import Image, ImageDraw
 import random
 import os
 
+from autotile import build_shadow_tiles, build_wall_tiles, paste_tiles, write_lut
+
 # Output configuration
 TILE_SIZE = 16
 COLUMNS = 8
 ROWS = 4
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sprites', 'depths')
+AUTOTILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'data', 'autotile.json')
+
+# Blob autotile rows below the base tiles (47 tiles per set, 8 per row)
+AUTOTILE_ROWS = 6
+WALL_BLOB_START = ROWS * COLUMNS
+SHADOW_BLOB_START = WALL_BLOB_START + AUTOTILE_ROWS * COLUMNS
+TOTAL_ROWS = ROWS + 2 * AUTOTILE_ROWS
 
 # Color palette (Enter the Gungeon inspired - dark dungeon theme)
 COLORS = {
@@ -231,7 +242,7 @@ def generate_transition_tile(tile_type):
 
 def generate_tileset():
     """Generate the complete tileset image."""
-    tileset = Image.new('RGBA', (COLUMNS * TILE_SIZE, ROWS * TILE_SIZE), (0, 0, 0, 0))
+    tileset = Image.new('RGBA', (COLUMNS * TILE_SIZE, TOTAL_ROWS * TILE_SIZE), (0, 0, 0, 0))
     
     # Row 0-1: Floor variations (16 tiles total for variety)
     for i in range(8):
@@ -272,6 +283,12 @@ def generate_tileset():
         special = generate_floor_tile((i + 2) % 8)
         tileset.paste(special, (i * TILE_SIZE, 3 * TILE_SIZE))
     
+    # Rows 4-15: blob autotiles composited from the first floor and wall tiles
+    floor = tileset.crop((0, 0, TILE_SIZE, TILE_SIZE))
+    wall = tileset.crop((0, 2 * TILE_SIZE, TILE_SIZE, 3 * TILE_SIZE))
+    paste_tiles(tileset, build_wall_tiles(wall, floor, COLORS), WALL_BLOB_START, COLUMNS)
+    paste_tiles(tileset, build_shadow_tiles(COLORS['floor_dark'], TILE_SIZE), SHADOW_BLOB_START, COLUMNS)
+    
     return tileset
 
 
@@ -302,7 +319,7 @@ def main():
         "tileWidth": TILE_SIZE,
         "tileHeight": TILE_SIZE,
         "columns": COLUMNS,
-        "rows": ROWS,
+        "rows": TOTAL_ROWS,
         "tiles": {
             "floor": {
                 "indices": list(range(16)),
@@ -315,6 +332,14 @@ def main():
             "transition": {
                 "indices": list(range(24, 32)),
                 "description": "Transition and special tiles"
+            },
+            "autotile_wall": {
+                "indices": list(range(WALL_BLOB_START, WALL_BLOB_START + 47)),
+                "description": "Blob autotile walls (assets/data/autotile.json maps neighbour masks)"
+            },
+            "autotile_shadow": {
+                "indices": list(range(SHADOW_BLOB_START, SHADOW_BLOB_START + 47)),
+                "description": "Blob autotile floor shadow overlays"
             }
         }
     }
@@ -325,11 +350,15 @@ def main():
         json.dump(metadata, f, indent=2)
     print(f"Saved metadata to: {metadata_path}")
     
-    print(f"\nTileset layout ({COLUMNS}x{ROWS} = {COLUMNS * ROWS} tiles):")
+    write_lut(AUTOTILE_PATH, WALL_BLOB_START, SHADOW_BLOB_START)
+    
+    print(f"\nTileset layout ({COLUMNS}x{TOTAL_ROWS} = {COLUMNS * TOTAL_ROWS} tiles):")
     print("  Row 0: Floor variations 0-7")
     print("  Row 1: Floor variations 8-15")
     print("  Row 2: Wall variations 0-7")
     print("  Row 3: Transitions and specials")
+    print(f"  Rows {ROWS}-{ROWS + AUTOTILE_ROWS - 1}: Autotile walls")
+    print(f"  Rows {ROWS + AUTOTILE_ROWS}-{TOTAL_ROWS - 1}: Autotile floor shadows")
 
 
 if __name__ == '__main__':
@@ -9,11 +9,20 @@ from PIL import Image, ImageDraw
 import random
 import os
 
+from autotile import build_shadow_tiles, build_wall_tiles, paste_tiles, write_lut
+
 # Output configuration
 TILE_SIZE = 16
 COLUMNS = 8
 ROWS = 4
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sprites', 'depths')
+AUTOTILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'data', 'autotile.json')
+
+# Blob autotile rows below the base tiles (47 tiles per set, 8 per row)
+AUTOTILE_ROWS = 6
+WALL_BLOB_START = ROWS * COLUMNS
+SHADOW_BLOB_START = WALL_BLOB_START + AUTOTILE_ROWS * COLUMNS
+TOTAL_ROWS = ROWS + 2 * AUTOTILE_ROWS
 
 # Zone color palettes
 ZONE_PALETTES = {
@@ -227,7 +236,7 @@ def generate_transition_tile(tile_type, colors=None):
 def generate_zone_tileset(zone_id: str, palette: dict):
     """Generate tileset for a specific zone with its color palette."""
     
-    tileset = Image.new('RGBA', (COLUMNS * TILE_SIZE, ROWS * TILE_SIZE), (0, 0, 0, 0))
+    tileset = Image.new('RGBA', (COLUMNS * TILE_SIZE, TOTAL_ROWS * TILE_SIZE), (0, 0, 0, 0))
     
     # Row 0-1: Floor variations (16 tiles total)
     for i in range(8):
@@ -259,6 +268,12 @@ def generate_zone_tileset(zone_id: str, palette: dict):
         special = generate_floor_tile((i + 2) % 8, palette)
         tileset.paste(special, (i * TILE_SIZE, 3 * TILE_SIZE))
     
+    # Rows 4-15: blob autotiles composited from the first floor and wall tiles
+    floor = tileset.crop((0, 0, TILE_SIZE, TILE_SIZE))
+    wall = tileset.crop((0, 2 * TILE_SIZE, TILE_SIZE, 3 * TILE_SIZE))
+    paste_tiles(tileset, build_wall_tiles(wall, floor, palette), WALL_BLOB_START, COLUMNS)
+    paste_tiles(tileset, build_shadow_tiles(palette['floor_dark'], TILE_SIZE), SHADOW_BLOB_START, COLUMNS)
+    
     # Save the tileset
     output_path = os.path.join(OUTPUT_DIR, f'{zone_id}-tileset.png')
     tileset.save(output_path)
@@ -280,6 +295,8 @@ def main():
     for zone_id, palette in ZONE_PALETTES.items():
         generate_zone_tileset(zone_id, palette)
     
+    write_lut(AUTOTILE_PATH, WALL_BLOB_START, SHADOW_BLOB_START)
+    
     print("\nAll zone tilesets generated!")
     print("Zone tilesets available:")
     for zone_id in ZONE_PALETTES.keys():
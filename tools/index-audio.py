@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Audio Candidate Deduplication
+=============================
+
+Fingerprints every WAV in ./output (see audio_fingerprint.py), reports groups
+of near-identical candidates and answers nearest-clip queries. The
+generation scripts add their own outputs to the same index as they write
+them, so running this is only needed after copying files in by hand or to
+clean up an existing pool.
+
+Requirements:
+    pip install numpy scipy
+
+Usage:
+    python index-audio.py                            # index output/, list near-duplicates
+    python index-audio.py --prune                    # move the newer duplicate of each pair to output/duplicates/
+    python index-audio.py --query output/menu_back.wav -k 3
+    python index-audio.py --threshold 0.95 --rebuild
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Check dependencies
+try:
+    from audio_fingerprint import (
+        DUPLICATE_SIMILARITY, INDEX_PATH, FingerprintIndex,
+        DUPLICATES_DIR_NAME, candidate_files, move_clip,
+    )
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install numpy scipy")
+    sys.exit(1)
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+
+
+def display(path: Path) -> str:
+    try:
+        return str(path.relative_to(OUTPUT_DIR.resolve()))
+    except ValueError:
+        return str(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate generated audio")
+    parser.add_argument("root", nargs="?", default=str(OUTPUT_DIR), help="directory to index (default: output/)")
+    parser.add_argument("--query", metavar="WAV", help="print the nearest indexed clips to a file")
+    parser.add_argument("-k", type=int, default=1, help="number of results for --query")
+    parser.add_argument("--threshold", type=float, default=DUPLICATE_SIMILARITY,
+                        help=f"cosine similarity counted as a duplicate (default {DUPLICATE_SIMILARITY})")
+    parser.add_argument("--prune", action="store_true", help="move newer duplicates to <root>/duplicates/")
+    parser.add_argument("--rebuild", action="store_true", help="discard the stored index first")
+    args = parser.parse_args()
+
+    if args.rebuild and INDEX_PATH.exists():
+        INDEX_PATH.unlink()
+
+    root = Path(args.root)
+    index = FingerprintIndex(threshold=args.threshold)
+    files = candidate_files(root)
+    fresh = index.sync(files)
+    index.save()
+    print(f"Indexed {len(index)} clips ({fresh} fingerprinted, {len(index) - fresh} unchanged)")
+
+    if args.query:
+        query = Path(args.query)
+        print(f"\nNearest to {query.name}:")
+        for path, similarity in index.query(query, k=args.k, exclude=query):
+            flag = "  DUPLICATE" if similarity >= index.threshold else ""
+            print(f"  {similarity:.3f}  {display(path)}{flag}")
+        return
+
+    pairs = index.duplicates()
+    if not pairs:
+        print("No near-duplicates")
+        return
+
+    print(f"\n{len(pairs)} near-duplicate pairs (similarity >= {index.threshold}):")
+    pruned = set()
+    for kept, duplicate, similarity in sorted(pairs, key=lambda p: -p[2]):
+        print(f"  {similarity:.3f}  {display(duplicate)}  ~  {display(kept)}")
+        if args.prune and kept not in pruned and duplicate not in pruned and duplicate.exists():
+            move_clip(duplicate, root / DUPLICATES_DIR_NAME)
+            pruned.add(duplicate)
+
+    if pruned:
+        for path in pruned:
+            index.remove(path)
+        index.save()
+        print(f"\nMoved {len(pruned)} files to: {root / DUPLICATES_DIR_NAME}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Local MusicGen Model Snapshots
+==============================
+
+`from_pretrained("facebook/musicgen-small")` resolves every file against the
+Hugging Face hub (network round trips, or timeouts when offline), reads the
+checkpoint into freshly allocated memory and randomly initializes every
+layer before overwriting it. For one-off runs like generate-sample.py that
+dominates the time to the first generated token.
+
+`snapshot-model.py` loads the model once (with the config_class fix
+applied) and writes a self-contained snapshot:
+
+    tools/cache/snapshots/<model>-<variant>/
+        manifest.json            model, variant, versions, weight file hash
+        model.safetensors        weights (deduplicated, optionally quantized)
+        config.json, generation_config.json, processor / tokenizer files
+
+`load_model` then builds the model skeleton without weight init and assigns
+tensors straight from the memory-mapped safetensors file, so pages are only
+read when a layer first touches them, with no hub lookups at all. It falls
+back to the hub when no snapshot exists.
+
+Variants:
+    fp32  weights as trained; loaded zero-copy from the mapping
+    fp16  half the file size; upcast to float32 on load
+    int8  per-row symmetric int8 for large weight matrices (about a quarter
+          of the size); dequantized to float32 on load
+
+The T5 text encoder is always stored in fp32. Its outputs are cached on disk
+by text_encoder_cache.py under the model name only, so every variant (and
+the hub model) has to produce bit-identical encoder states.
+
+Usage:
+    from model_snapshot import load_model
+
+    processor, model = load_model("facebook/musicgen-small")
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import torch
+import transformers
+from safetensors import safe_open
+from safetensors.torch import save_file
+from transformers import AutoProcessor, GenerationConfig, MusicgenConfig, MusicgenForConditionalGeneration
+from transformers.modeling_utils import no_init_weights
+
+# Snapshot directory
+SNAPSHOT_DIR = Path(__file__).parent / "cache" / "snapshots"
+
+# Storage variants, in the order load_model prefers them
+VARIANTS = ("fp32", "fp16", "int8")
+
+MANIFEST_NAME = "manifest.json"
+WEIGHTS_NAME = "model.safetensors"
+
+# int8: per-row scales are stored next to the quantized tensor
+SCALE_SUFFIX = ".int8_scale"
+INT8_MIN_ELEMENTS = 4096
+
+# Kept in fp32 in every variant (see the module docstring)
+FULL_PRECISION_PREFIXES = ("text_encoder.",)
+
+
+def patch_musicgen():
+    """Fix for transformers bug where config_class is incorrect."""
+    MusicgenForConditionalGeneration.config_class = MusicgenConfig
+
+
+def snapshot_path(model_name: str, variant: str, snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    return Path(snapshot_dir) / f"{model_name.replace('/', '--')}-{variant}"
+
+
+def find_snapshot(model_name: str, variant: str = None, snapshot_dir: Path = SNAPSHOT_DIR):
+    """Path of a complete snapshot for the model, or None."""
+    for candidate in ([variant] if variant else VARIANTS):
+        path = snapshot_path(model_name, candidate, snapshot_dir)
+        if not (path / MANIFEST_NAME).exists():
+            continue
+        # Reduced snapshots written before the text encoder was kept in fp32
+        # would reuse cached encoder states computed at another precision
+        if candidate != "fp32" and "full_precision" not in read_manifest(path):
+            print(f"  Skipping {path.name}: text encoder not stored in fp32 "
+                  f"(re-run snapshot-model.py --variant {candidate})")
+            continue
+        return path
+    return None
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def quantize_int8(tensor: torch.Tensor):
+    """Symmetric per-row int8: returns (int8 values, float32 scale per row)."""
+    weight = tensor.detach().float()
+    scale = weight.abs().amax(dim=1).clamp(min=1e-12) / 127.0
+    values = torch.round(weight / scale[:, None]).clamp(-127, 127).to(torch.int8)
+    return values, scale
+
+
+def dequantize_int8(values: torch.Tensor, scale: torch.Tensor) -> torch.Tensor:
+    return values.float() * scale[:, None]
+
+
+def _storage_tensors(state_dict: dict, variant: str):
+    """
+    Convert a state dict to the tensors written for a variant.
+
+    Tied parameters (e.g. the T5 shared embedding) share storage, which
+    safetensors refuses to save twice; they are stored once and recorded as
+    aliases. Returns (tensors, aliases, quantized names).
+    """
+    tensors, aliases, quantized = {}, {}, []
+    seen = {}
+    for name, tensor in state_dict.items():
+        key = (tensor.data_ptr(), tensor.dtype, tuple(tensor.shape), tuple(tensor.stride()))
+        if tensor.numel() and key in seen:
+            aliases[name] = seen[key]
+            continue
+        seen[key] = name
+
+        tensor = tensor.detach().cpu()
+        if tensor.is_floating_point() and not name.startswith(FULL_PRECISION_PREFIXES):
+            if variant == "fp16":
+                tensor = tensor.half()
+            elif variant == "int8" and tensor.dim() == 2 and tensor.numel() >= INT8_MIN_ELEMENTS:
+                tensor, scale = quantize_int8(tensor)
+                tensors[name + SCALE_SUFFIX] = scale.contiguous()
+                quantized.append(name)
+        tensors[name] = tensor.contiguous()
+    return tensors, aliases, quantized
+
+
+def load_from_hub(model_name: str):
+    """The scripts' original loading path: (processor, model) via the hub cache."""
+    patch_musicgen()
+    processor = AutoProcessor.from_pretrained(model_name)
+    model = MusicgenForConditionalGeneration.from_pretrained(model_name)
+    return processor, model
+
+
+def create_snapshot(model_name: str, variant: str = "fp32", snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    """Load the model from the hub and write a local snapshot; returns its path."""
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant {variant!r} (expected one of {', '.join(VARIANTS)})")
+
+    processor, model = load_from_hub(model_name)
+    tensors, aliases, quantized = _storage_tensors(model.state_dict(), variant)
+
+    # Write into a temporary directory so an interrupted run never leaves a
+    # half-written snapshot that find_snapshot would pick up
+    path = snapshot_path(model_name, variant, snapshot_dir)
+    staging = path.with_name(path.name + ".tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    save_file(tensors, str(staging / WEIGHTS_NAME), metadata={"format": "pt"})
+    model.config.save_pretrained(staging)
+    model.generation_config.save_pretrained(staging)
+    processor.save_pretrained(staging)
+
+    weights = staging / WEIGHTS_NAME
+    manifest = {
+        "model": model_name,
+        "variant": variant,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "transformers": transformers.__version__,
+        "torch": torch.__version__,
+        "sampling_rate": model.config.audio_encoder.sampling_rate,
+        "parameters": sum(p.numel() for p in model.parameters()),
+        "weights": {
+            "file": WEIGHTS_NAME,
+            "bytes": weights.stat().st_size,
+            "sha256": file_sha256(weights),
+        },
+        "aliases": aliases,
+        "quantized": quantized,
+        "full_precision": list(FULL_PRECISION_PREFIXES),
+    }
+    with open(staging / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(staging, path)
+    return path
+
+
+def read_manifest(path: Path) -> dict:
+    with open(Path(path) / MANIFEST_NAME) as f:
+        return json.load(f)
+
+
+def read_state_dict(path: Path, manifest: dict) -> dict:
+    """
+    State dict backed by the memory-mapped weight file.
+
+    fp32 tensors are views into the mapping; fp16 / int8 tensors are
+    converted to float32 as they are read.
+    """
+    quantized = set(manifest["quantized"])
+    state = {}
+    with safe_open(str(Path(path) / manifest["weights"]["file"]), framework="pt", device="cpu") as f:
+        for name in f.keys():
+            if name.endswith(SCALE_SUFFIX):
+                continue
+            tensor = f.get_tensor(name)
+            if name in quantized:
+                tensor = dequantize_int8(tensor, f.get_tensor(name + SCALE_SUFFIX))
+            elif tensor.is_floating_point() and tensor.dtype != torch.float32:
+                tensor = tensor.float()
+            state[name] = tensor
+    for alias, target in manifest["aliases"].items():
+        state[alias] = state[target]
+    return state
+
+
+def load_snapshot(path: Path):
+    """(processor, model) from a snapshot directory, without touching the network."""
+    path = Path(path)
+    manifest = read_manifest(path)
+    if manifest["transformers"] != transformers.__version__:
+        print(f"  Note: snapshot was written with transformers {manifest['transformers']}, "
+              f"running {transformers.__version__} (re-run snapshot-model.py if loading fails)")
+
+    patch_musicgen()
+    config = MusicgenConfig.from_pretrained(path, local_files_only=True)
+
+    # Skeleton without weight init; parameters are then replaced (assign=True)
+    # by the mapped tensors instead of being copied into
+    with no_init_weights():
+        model = MusicgenForConditionalGeneration(config)
+    model.load_state_dict(read_state_dict(path, manifest), strict=True, assign=True)
+    model.tie_weights()
+    model.eval()
+    model.generation_config = GenerationConfig.from_pretrained(path, local_files_only=True)
+
+    processor = AutoProcessor.from_pretrained(path, local_files_only=True)
+    return processor, model
+
+
+def load_model(model_name: str, variant: str = None, use_snapshot: bool = True):
+    """
+    (processor, model) for a MusicGen checkpoint.
+
+    Uses the local snapshot when one exists (any variant, in VARIANTS order,
+    unless `variant` is given), otherwise the hub with the config fix.
+    """
+    start = time.perf_counter()
+    path = find_snapshot(model_name, variant) if use_snapshot else None
+    if path is not None:
+        print(f"Loading snapshot: {path.name}")
+        processor, model = load_snapshot(path)
+    else:
+        print(f"Loading model: {model_name}")
+        if use_snapshot:
+            print("  (no local snapshot - run snapshot-model.py for faster startup)")
+        processor, model = load_from_hub(model_name)
+    print(f"  Loaded in {time.perf_counter() - start:.1f}s")
+    return processor, model
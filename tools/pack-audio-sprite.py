@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+SFX Audio Sprite Packer
+=======================
+
+Concatenates individual sound effects into one audio sprite with short
+silent guard gaps, and writes the Phaser audio-sprite JSON (resources +
+spritemap) that `PreloadScene` loads with `this.load.audioSprite`. The
+browser then makes one request and one `decodeAudioData` call for the
+whole SFX bank instead of one per file.
+
+Every clip is resampled to a common rate and channel count, and each clip
+starts on a multiple of --align samples, so marker offsets are exact in
+samples (also recorded in the JSON).
+
+Encoders delay the audio: an MP3 decodes with ~1100 samples of priming
+silence in front, which would make every marker early by that much. After
+encoding, the packer decodes each file, measures the delay against the WAV
+by cross-correlation, and re-encodes with that many samples trimmed from
+the silent lead-in, so one spritemap is exact for every resource. MP3s are
+written without the LAME gapless header so browsers and ffmpeg all see the
+same (compensated) stream.
+
+Requirements:
+    pip install numpy scipy
+    ffmpeg on PATH           # to read non-WAV inputs and encode .ogg/.mp3
+
+Usage:
+    python pack-audio-sprite.py                       # pack ../assets/audio/sfx (+ ogg/mp3 if ffmpeg is found)
+    python pack-audio-sprite.py output/procedural --encode ogg
+    python pack-audio-sprite.py a.wav b.wav --gap 0.1 --name ui-sprite
+
+Writes <name>.wav (+ encoded copies) and <name>.json to ../assets/audio/sfx/
+Set USE_SFX_SPRITE in src/config/Constants.ts once the sprite exists.
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+from math import gcd
+from pathlib import Path
+
+# Check dependencies
+try:
+    import numpy as np
+    import scipy.io.wavfile as wavfile
+    from scipy.signal import correlate, resample_poly
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install numpy scipy")
+    sys.exit(1)
+
+ROOT_DIR = Path(__file__).parent.parent
+SFX_DIR = ROOT_DIR / "assets" / "audio" / "sfx"
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".ogg", ".flac", ".m4a"}
+
+
+def read_audio(path: Path, sample_rate: int, channels: int) -> np.ndarray:
+    """Load a clip as float32 (frames, channels) at the target format."""
+    if path.suffix.lower() == ".wav":
+        rate, data = wavfile.read(str(path))
+        if data.dtype == np.int16:
+            data = data.astype(np.float32) / 32768.0
+        elif data.dtype == np.int32:
+            data = data.astype(np.float32) / 2147483648.0
+        elif data.dtype == np.uint8:
+            data = (data.astype(np.float32) - 128.0) / 128.0
+        else:
+            data = data.astype(np.float32)
+    else:
+        if shutil.which("ffmpeg") is None:
+            raise RuntimeError(f"ffmpeg is required to read {path.suffix} files")
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", str(path), "-f", "f32le", "-ac", str(channels), "-ar", str(sample_rate), "-"],
+            check=True, capture_output=True,
+        )
+        rate = sample_rate
+        data = np.frombuffer(result.stdout, dtype="<f4").reshape(-1, channels)
+
+    if data.ndim == 1:
+        data = data[:, None]
+
+    # Channel conversion: average down to mono, duplicate mono up
+    if data.shape[1] != channels:
+        mono = data.mean(axis=1, keepdims=True)
+        data = np.repeat(mono, channels, axis=1)
+
+    if rate != sample_rate:
+        g = gcd(rate, sample_rate)
+        data = resample_poly(data, sample_rate // g, rate // g, axis=0)
+
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+def pack(clips: dict, sample_rate: int, gap: float, align: int):
+    """
+    Lay clips out back to back.
+
+    Returns (sprite, markers) where markers maps name -> (start, end) in
+    samples. Each start is rounded up to `align` samples after a gap of at
+    least `gap` seconds of silence.
+    """
+    gap_samples = int(round(gap * sample_rate))
+    markers = {}
+    cursor = gap_samples  # lead-in absorbs encoder priming at the start
+    for name, data in clips.items():
+        start = -(-cursor // align) * align
+        markers[name] = (start, start + len(data))
+        cursor = start + len(data) + gap_samples
+
+    channels = next(iter(clips.values())).shape[1]
+    sprite = np.zeros((-(-cursor // align) * align, channels), dtype=np.float32)
+    for name, data in clips.items():
+        start, end = markers[name]
+        sprite[start:end] = data
+    return sprite, markers
+
+
+def encode(wav_path: Path, fmt: str, trim: int = 0) -> Path:
+    """Encode the packed WAV with ffmpeg, dropping `trim` samples from the start."""
+    output_path = wav_path.with_suffix(f".{fmt}")
+    if fmt == "ogg":
+        codec = ["-c:a", "libvorbis", "-q:a", "4"]
+    else:
+        # No Xing/LAME header: decoders that honour it would undo the trim
+        codec = ["-b:a", "128k", "-write_xing", "0"]
+    trim_filter = ["-af", f"atrim=start_sample={trim},asetpts=PTS-STARTPTS"] if trim else []
+    subprocess.run(["ffmpeg", "-v", "error", "-y", "-i", str(wav_path), *trim_filter, *codec, str(output_path)],
+                   check=True)
+    return output_path
+
+
+def measure_delay(reference: np.ndarray, decoded: np.ndarray, max_lag: int = 8192) -> int:
+    """
+    Samples by which `decoded` lags `reference` (both (frames, channels)),
+    found by cross-correlating the first channel over lags 0..max_lag.
+    """
+    ref = reference[:, 0].astype(np.float64)
+    dec = decoded[:, 0].astype(np.float64)
+    n = min(len(ref), len(dec) - max_lag)
+    if n <= 0:
+        return 0
+    scores = correlate(dec[:n + max_lag], ref[:n], mode="valid", method="fft")
+    return int(np.argmax(scores))
+
+
+def encode_aligned(wav_path: Path, fmt: str, sprite: np.ndarray, sample_rate: int, lead_in: int) -> Path:
+    """Encode, then re-encode with the measured decoder delay removed."""
+    channels = sprite.shape[1]
+    output_path = encode(wav_path, fmt)
+    delay = measure_delay(sprite, read_audio(output_path, sample_rate, channels))
+    if delay == 0:
+        print(f"  {output_path.name}: no decoder delay")
+        return output_path
+    if delay > lead_in:
+        print(f"  WARNING: {output_path.name} is delayed {delay} samples, more than the "
+              f"{lead_in}-sample lead-in; raise --gap (markers are early by the difference)")
+        delay = lead_in
+    output_path = encode(wav_path, fmt, trim=delay)
+    residual = measure_delay(sprite, read_audio(output_path, sample_rate, channels))
+    print(f"  {output_path.name}: trimmed {delay} samples of decoder delay (residual {residual})")
+    return output_path
+
+
+def resource_url(path: Path) -> str:
+    """Path as the game loads it (relative to the project root)."""
+    try:
+        return path.resolve().relative_to(ROOT_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack SFX into a Phaser audio sprite")
+    parser.add_argument("inputs", nargs="*", type=Path, help="audio files or directories (default: assets/audio/sfx)")
+    parser.add_argument("--out", type=Path, default=SFX_DIR, help="output directory")
+    parser.add_argument("--name", default="sfx-sprite", help="output file name (no extension)")
+    parser.add_argument("--prefix", default="sfx_", help="marker name prefix (matches the game's sound keys)")
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--channels", type=int, default=1)
+    parser.add_argument("--gap", type=float, default=0.1, help="silence between clips (seconds)")
+    parser.add_argument("--align", type=int, default=1152, help="start offsets are multiples of this many samples")
+    parser.add_argument("--encode", nargs="*", default=None, choices=("ogg", "mp3"),
+                        help="also encode with ffmpeg (default: ogg mp3 when ffmpeg is found; "
+                             "pass --encode alone for WAV only)")
+    args = parser.parse_args()
+
+    files = []
+    for entry in args.inputs or [SFX_DIR]:
+        if entry.is_dir():
+            files.extend(sorted(p for p in entry.iterdir() if p.suffix.lower() in AUDIO_EXTENSIONS))
+        else:
+            files.append(entry)
+    files = [p for p in files if not p.stem.startswith(args.name)]
+    if not files:
+        print("No audio files to pack.")
+        sys.exit(1)
+
+    print(f"Packing {len(files)} clips at {args.sample_rate} Hz, {args.channels} channel(s)...")
+    clips = {}
+    for path in files:
+        name = f"{args.prefix}{path.stem}"
+        if name in clips:
+            print(f"  Skipping {path.name}: duplicate marker {name}")
+            continue
+        try:
+            clips[name] = read_audio(path, args.sample_rate, args.channels)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            print("Install ffmpeg, or pass WAV inputs (e.g. output/procedural)")
+            sys.exit(1)
+
+    sprite, markers = pack(clips, args.sample_rate, args.gap, args.align)
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    wav_path = args.out / f"{args.name}.wav"
+    wavfile.write(str(wav_path), args.sample_rate, (np.clip(sprite, -1.0, 1.0) * 32767).astype(np.int16))
+
+    has_ffmpeg = shutil.which("ffmpeg") is not None
+    formats = args.encode if args.encode is not None else (["ogg", "mp3"] if has_ffmpeg else [])
+    resources = [wav_path]
+    if formats and not has_ffmpeg:
+        print("WARNING: ffmpeg not found, skipping --encode")
+    elif formats:
+        lead_in = markers[next(iter(markers))][0]
+        resources = [encode_aligned(wav_path, fmt, sprite, args.sample_rate, lead_in) for fmt in formats] + resources
+
+    spritemap = {}
+    for name, (start, end) in markers.items():
+        spritemap[name] = {
+            "start": round(start / args.sample_rate, 6),
+            "end": round(end / args.sample_rate, 6),
+            "loop": False,
+            "samples": [start, end],
+        }
+        print(f"  {name:<24} {start:>9} - {end:<9} ({(end - start) / args.sample_rate:.3f}s)")
+
+    manifest = {
+        "resources": [resource_url(p) for p in resources],
+        "spritemap": spritemap,
+        "meta": {"sampleRate": args.sample_rate, "channels": args.channels, "gap": args.gap, "align": args.align},
+    }
+    json_path = args.out / f"{args.name}.json"
+    with open(json_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    total = len(sprite) / args.sample_rate
+    print(f"Saved: {wav_path} ({total:.2f}s)")
+    print(f"Saved: {json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Pack room tile grids into compact byte strings.
+The room index stores every tile as a JSON number inside nested arrays,
+which is most of the file and most of its parse time. This tool encodes
+each grid (row-major) with the smallest of three codecs and writes a packed
+copy of the index that RoomComponentRegistry decodes at load time.
+
+Codecs (tile values 0-15 fit a nibble; see RoomComponent.ts):
+- nibble: two tiles per byte, high nibble first, odd tail padded with 0
+- rle:    one byte per run, high nibble = tile, low nibble = run length - 1;
+          runs longer than 16 are split
+- raw:    one byte per tile (fallback for values above 15)
+
+Every packed grid is decoded again and compared against the source before
+anything is written; a mismatch exits with status 1.
+
+assets/data/rooms/index.json stays the editable source of truth; other
+tools keep reading it.
+
+Usage:
+    python pack-room-tiles.py
+    python pack-room-tiles.py --check    # verify, write nothing, exit 1 if the packed file is stale
+
+Output: assets/data/rooms/index.packed.json (tiles replaced by
+        "tilesPacked": {"codec": ..., "data": base64})
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+ROOMS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'rooms', 'index.json')
+OUTPUT_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'rooms', 'index.packed.json')
+
+# Longest run one RLE byte can hold
+MAX_RUN = 16
+
+# Largest tile value the nibble codecs can hold
+MAX_NIBBLE = 15
+
+
+def encode_nibble(cells):
+    packed = bytearray()
+    for i in range(0, len(cells), 2):
+        high = cells[i]
+        low = cells[i + 1] if i + 1 < len(cells) else 0
+        packed.append((high << 4) | low)
+    return bytes(packed)
+
+
+def decode_nibble(data, count):
+    cells = []
+    for byte in data:
+        cells.append(byte >> 4)
+        cells.append(byte & 0x0F)
+    return cells[:count]
+
+
+def encode_rle(cells):
+    packed = bytearray()
+    i = 0
+    while i < len(cells):
+        run = 1
+        while i + run < len(cells) and cells[i + run] == cells[i] and run < MAX_RUN:
+            run += 1
+        packed.append((cells[i] << 4) | (run - 1))
+        i += run
+    return bytes(packed)
+
+
+def decode_rle(data, count):
+    cells = []
+    for byte in data:
+        cells.extend([byte >> 4] * ((byte & 0x0F) + 1))
+    return cells[:count]
+
+
+CODECS = {
+    'nibble': (encode_nibble, decode_nibble),
+    'rle': (encode_rle, decode_rle),
+    'raw': (bytes, lambda data, count: list(data[:count])),
+}
+
+
+def pack_grid(tiles):
+    """(codec name, bytes) of the smallest encoding of a row-major grid."""
+    cells = [tile for row in tiles for tile in row]
+    if max(cells) > MAX_NIBBLE:
+        return 'raw', bytes(cells)
+    candidates = [(name, CODECS[name][0](cells)) for name in ('rle', 'nibble')]
+    return min(candidates, key=lambda c: len(c[1]))
+
+
+def unpack_grid(codec, data, width, height):
+    cells = CODECS[codec][1](data, width * height)
+    return [cells[y * width:(y + 1) * width] for y in range(height)]
+
+
+def parse_time(text, repeats=200):
+    """Mean json.loads time in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        json.loads(text)
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack room tile grids")
+    parser.add_argument("--check", action="store_true",
+                        help="verify and report only; exit 1 if index.packed.json is out of date")
+    args = parser.parse_args()
+
+    with open(ROOMS_PATH) as f:
+        source_text = f.read()
+    source = json.loads(source_text)
+
+    packed_rooms = []
+    failures = []
+    codec_counts = {}
+    tile_json_bytes = 0
+    tile_packed_bytes = 0
+    for room in source['rooms']:
+        tiles = room['tiles']
+        height, width = len(tiles), len(tiles[0])
+        codec, data = pack_grid(tiles)
+        codec_counts[codec] = codec_counts.get(codec, 0) + 1
+
+        # Round trip through base64 as the game will see it
+        encoded = base64.b64encode(data).decode('ascii')
+        if unpack_grid(codec, base64.b64decode(encoded), width, height) != tiles:
+            failures.append(room['id'])
+
+        tile_json_bytes += len(json.dumps(tiles, separators=(',', ':')))
+        tile_packed_bytes += len(encoded)
+
+        packed = {k: v for k, v in room.items() if k != 'tiles'}
+        packed['tilesPacked'] = {"codec": codec, "data": encoded}
+        packed_rooms.append(packed)
+
+    if failures:
+        print(f"Round trip FAILED for: {', '.join(failures)}")
+        sys.exit(1)
+
+    output_text = json.dumps({"rooms": packed_rooms}, separators=(',', ':'))
+    print(f"Packed {len(packed_rooms)} rooms (round trip OK), codecs: "
+          + ", ".join(f"{name} x{count}" for name, count in sorted(codec_counts.items())))
+    print(f"  Tile data: {tile_json_bytes} -> {tile_packed_bytes} bytes "
+          f"({tile_packed_bytes / tile_json_bytes:.1%})")
+    print(f"  Index file: {len(source_text)} -> {len(output_text)} bytes "
+          f"({len(output_text) / len(source_text):.1%})")
+    print(f"  json.loads: {parse_time(source_text):.0f} -> {parse_time(output_text):.0f} us")
+
+    if args.check:
+        current = None
+        if os.path.exists(OUTPUT_PATH):
+            with open(OUTPUT_PATH) as f:
+                current = f.read()
+        if current != output_text:
+            print("index.packed.json is out of date: run pack-room-tiles.py")
+            sys.exit(1)
+        print("Packed rooms are up to date")
+        return
+
+    with open(OUTPUT_PATH, 'w') as f:
+        f.write(output_text)
+    print(f"Saved packed rooms to: {OUTPUT_PATH}")
+
+
+if __name__ == '__main__':
+    main()
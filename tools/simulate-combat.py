@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Combat Simulator
+============================
+
+Runs large batches of player-vs-enemy duels for every damaging spell in
+assets/data/spells.json against every enemy and boss in
+assets/data/enemies.json, to check balance numbers without playtesting.
+
+Every simulated fight is one row of a set of NumPy arrays and all rows step
+forward together in fixed time steps, so hundreds of thousands of fights
+advance per array operation. Finished fights are compacted out as they end.
+
+Each step models:
+- spell cooldown, mana cost and ManaComponent's integer mana regeneration
+- projectile hits (per projectile), crits and element matchups
+- status effects from statusChance / statusDuration: damage ticks and
+  changes to the enemy's attack rate, damage dealt and damage taken
+- enemy attacks on attackCooldown, with the player's invulnerability window
+
+Reported per spell/enemy pair:
+- win rate and time-to-kill percentiles
+- mana starvation: time the spell was off cooldown but unaffordable
+- player death and timeout rates
+
+Usage:
+    python simulate-combat.py                          # full matrix, 20000 fights per pair
+    python simulate-combat.py --spells fireball --enemies golem --trials 1000000
+    python simulate-combat.py --json output/combat-sim.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+SPELLS_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'spells.json')
+ENEMIES_PATH = os.path.join(ROOT_DIR, 'assets', 'data', 'enemies.json')
+
+# Player stats (src/config/Constants.ts)
+PLAYER_BASE_HEALTH = 100
+PLAYER_BASE_MANA = 100
+MANA_REGEN_RATE = 5         # per second
+INVULN_DURATION = 1000      # ms
+
+# Simulation step and fight length (ms)
+STEP_MS = 50
+TIME_LIMIT_MS = 60000
+
+# Hit chances: projectiles can miss, AoE around the target rarely does;
+# enemies miss when the player dodges
+PROJECTILE_HIT_CHANCE = 0.85
+AOE_HIT_CHANCE = 0.95
+ENEMY_HIT_CHANCE = 0.5
+
+# Crits (lightning's critModifier scales the chance, see Element.ts)
+BASE_CRIT_CHANCE = 0.05
+CRIT_MULTIPLIER = 1.5
+CRIT_MODIFIERS = {'lightning': 1.5}
+
+# Status effects (StatusEffectType). The game does not tune these yet, so
+# the values here are the working balance assumptions:
+#   tick: damage every TICK_MS while active
+#   attack_rate: enemy attack timer speed (0 = cannot attack)
+#   enemy_damage: enemy damage multiplier
+#   damage_taken: multiplier on the player's spell damage
+STATUS_EFFECTS = {
+    'burning':  {'tick': 5, 'attack_rate': 1.0, 'enemy_damage': 1.0, 'damage_taken': 1.0},
+    'poisoned': {'tick': 3, 'attack_rate': 1.0, 'enemy_damage': 1.0, 'damage_taken': 1.0},
+    'slowed':   {'tick': 0, 'attack_rate': 0.5, 'enemy_damage': 1.0, 'damage_taken': 1.0},
+    'frozen':   {'tick': 0, 'attack_rate': 0.0, 'enemy_damage': 1.0, 'damage_taken': 1.0},
+    'stunned':  {'tick': 0, 'attack_rate': 0.0, 'enemy_damage': 1.0, 'damage_taken': 1.0},
+    'shocked':  {'tick': 0, 'attack_rate': 1.0, 'enemy_damage': 1.0, 'damage_taken': 1.25},
+    'weakened': {'tick': 0, 'attack_rate': 1.0, 'enemy_damage': 0.75, 'damage_taken': 1.0},
+    'blinded':  {'tick': 0, 'attack_rate': 1.0, 'enemy_damage': 0.5, 'damage_taken': 1.0},
+}
+STATUS_NAMES = list(STATUS_EFFECTS)
+TICK_MS = 1000  # StatusEffect default tickInterval
+
+# Attacker element -> defender element multipliers (ElementInteractions.ts)
+ELEMENT_MATCHUPS = {
+    'fire':      {'fire': 0.5, 'ice': 1.5, 'lightning': 1.0, 'earth': 0.75, 'nature': 1.5},
+    'ice':       {'fire': 0.5, 'ice': 0.5, 'earth': 1.5},
+    'lightning': {'ice': 1.25, 'lightning': 0.5, 'earth': 0.5},
+    'earth':     {'fire': 1.25, 'ice': 0.75, 'lightning': 1.5, 'earth': 0.5, 'nature': 0.75},
+    'arcane':    {},
+    'nature':    {'fire': 0.5, 'earth': 1.25, 'nature': 0.5, 'shadow': 1.25, 'light': 0.75},
+    'shadow':    {'nature': 0.75, 'shadow': 0.5, 'light': 0.5},
+    'light':     {'nature': 1.25, 'shadow': 1.5, 'light': 0.5},
+}
+
+# Fights simulated together (bounds memory; ~100 bytes per fight)
+CHUNK_ROWS = 1 << 19
+
+# Compact finished fights out once fewer than this fraction are still running
+COMPACT_BELOW = 0.75
+
+
+def load_matrix(spell_ids=None, enemy_ids=None):
+    """Damaging spells and all enemies/bosses, optionally filtered by id."""
+    with open(SPELLS_PATH) as f:
+        spells = [s for s in json.load(f)['spells'] if s['baseDamage'] > 0]
+    with open(ENEMIES_PATH) as f:
+        data = json.load(f)
+    enemies = data['enemies'] + data.get('bosses', [])
+
+    if spell_ids:
+        spells = [s for s in spells if s['id'] in spell_ids]
+    if enemy_ids:
+        enemies = [e for e in enemies if e['id'] in enemy_ids]
+    return spells, enemies
+
+
+def enemy_attack_cooldown(enemy):
+    """attackCooldown, or a boss's fastest opening-phase attack."""
+    if 'attackCooldown' in enemy:
+        return enemy['attackCooldown']
+    return min(a['cooldown'] for a in enemy.get('attacks', []) if a.get('phase', 1) == 1)
+
+
+def pair_params(spells, enemies):
+    """Per-pair parameter table (one entry per spell x enemy), as float arrays."""
+    rows = []
+    for spell in spells:
+        statuses = spell.get('statusEffects') or []
+        status = STATUS_NAMES.index(statuses[0]) if statuses and statuses[0] in STATUS_EFFECTS else -1
+        projectile = spell['targetType'] == 'projectile'
+        for enemy in enemies:
+            element = ELEMENT_MATCHUPS.get(spell['element'], {}).get(enemy.get('element'), 1.0)
+            rows.append({
+                'mana_cost': spell['manaCost'],
+                'cooldown': spell['cooldown'],
+                'damage': spell['baseDamage'] * element,
+                'projectiles': spell.get('projectileCount', 1) if projectile else 1,
+                'hit_chance': PROJECTILE_HIT_CHANCE if projectile else AOE_HIT_CHANCE,
+                'crit_chance': BASE_CRIT_CHANCE * CRIT_MODIFIERS.get(spell['element'], 1.0),
+                'status': status,
+                'status_chance': spell.get('statusChance', 0.0) if status >= 0 else 0.0,
+                'status_duration': spell.get('statusDuration', 0),
+                'enemy_health': enemy['health'],
+                'enemy_damage': enemy['damage'],
+                'enemy_cooldown': enemy_attack_cooldown(enemy),
+            })
+    return {key: np.array([r[key] for r in rows]) for key in rows[0]}
+
+
+def simulate_chunk(params, pair_index, rng):
+    """
+    Run one batch of fights to completion.
+
+    `pair_index` gives each row's pair. Returns per-row outcome arrays:
+    end time (ms), whether the enemy died, whether the player died, casts,
+    and starved time (ms).
+    """
+    n = len(pair_index)
+    p = {key: value[pair_index] for key, value in params.items()}
+    p['projectiles'] = p['projectiles'].astype(np.int64)
+    p['status'] = p['status'].astype(np.int64)
+
+    status_tick = np.array([STATUS_EFFECTS[s]['tick'] for s in STATUS_NAMES], dtype=np.float32)
+    status_rate = np.array([STATUS_EFFECTS[s]['attack_rate'] for s in STATUS_NAMES], dtype=np.float32)
+    status_enemy_damage = np.array([STATUS_EFFECTS[s]['enemy_damage'] for s in STATUS_NAMES], dtype=np.float32)
+    status_taken = np.array([STATUS_EFFECTS[s]['damage_taken'] for s in STATUS_NAMES], dtype=np.float32)
+
+    # State; each spell has at most one status, so one timer per row is enough
+    state = {
+        'row': np.arange(n),
+        'enemy_hp': p['enemy_health'].astype(np.float32),
+        'player_hp': np.full(n, PLAYER_BASE_HEALTH, dtype=np.float32),
+        'mana': np.full(n, PLAYER_BASE_MANA, dtype=np.float32),
+        'mana_acc': np.zeros(n, dtype=np.float32),
+        'spell_cd': np.zeros(n, dtype=np.float32),
+        # Enemies open at a random point of their attack cycle
+        'enemy_cd': (rng.random(n) * p['enemy_cooldown']).astype(np.float32),
+        'invuln': np.zeros(n, dtype=np.float32),
+        'status_left': np.zeros(n, dtype=np.float32),
+        'tick_timer': np.zeros(n, dtype=np.float32),
+        'casts': np.zeros(n, dtype=np.int32),
+        'starved': np.zeros(n, dtype=np.float32),
+    }
+    for key in p:
+        state['p_' + key] = p[key]
+
+    end_time = np.full(n, TIME_LIMIT_MS, dtype=np.float32)
+    enemy_dead = np.zeros(n, dtype=bool)
+    player_dead = np.zeros(n, dtype=bool)
+    casts = np.zeros(n, dtype=np.int32)
+    starved = np.zeros(n, dtype=np.float32)
+
+    def finish(s, mask, now):
+        rows = s['row'][mask]
+        end_time[rows] = now
+        casts[rows] = s['casts'][mask]
+        starved[rows] = s['starved'][mask]
+
+    s = state
+    running = n
+    for t in range(0, TIME_LIMIT_MS, STEP_MS):
+        m = len(s['row'])
+        status = s['p_status']
+        has_status = (status >= 0) & (s['status_left'] > 0)
+        status_idx = np.where(status >= 0, status, 0)
+
+        # Player casts as soon as the spell is off cooldown and affordable
+        ready = s['spell_cd'] <= 0
+        cast = ready & (s['mana'] >= s['p_mana_cost'])
+        s['starved'] += np.where(ready & ~cast, STEP_MS, 0).astype(np.float32)
+        if cast.any():
+            s['mana'] -= np.where(cast, s['p_mana_cost'], 0).astype(np.float32)
+            s['spell_cd'] = np.where(cast, s['p_cooldown'], s['spell_cd']).astype(np.float32)
+            s['casts'] += cast
+
+            hits = rng.binomial(s['p_projectiles'], s['p_hit_chance']) * cast
+            crit = rng.random(m) < s['p_crit_chance']
+            taken = np.where(has_status, status_taken[status_idx], 1.0)
+            damage = hits * s['p_damage'] * np.where(crit, CRIT_MULTIPLIER, 1.0) * taken
+            s['enemy_hp'] -= damage.astype(np.float32)
+
+            applied = (hits > 0) & (status >= 0) & (rng.random(m) < s['p_status_chance'])
+            s['status_left'] = np.where(applied, s['p_status_duration'], s['status_left']).astype(np.float32)
+            s['tick_timer'] = np.where(applied & ~has_status, 0, s['tick_timer']).astype(np.float32)
+            has_status |= applied
+
+        # Status damage ticks
+        tick_damage = np.where(has_status, status_tick[status_idx], 0.0)
+        ticking = tick_damage > 0
+        if ticking.any():
+            s['tick_timer'] += np.where(ticking, STEP_MS, 0).astype(np.float32)
+            tick = ticking & (s['tick_timer'] >= TICK_MS)
+            s['tick_timer'] -= np.where(tick, TICK_MS, 0).astype(np.float32)
+            s['enemy_hp'] -= np.where(tick, tick_damage, 0).astype(np.float32)
+
+        # Enemy attacks on its (status-scaled) attack timer
+        rate = np.where(has_status, status_rate[status_idx], 1.0)
+        s['enemy_cd'] -= (STEP_MS * rate).astype(np.float32)
+        attack = (s['enemy_cd'] <= 0) & (s['enemy_hp'] > 0)
+        s['enemy_cd'] += np.where(attack, s['p_enemy_cooldown'], 0).astype(np.float32)
+        hit = attack & (s['invuln'] <= 0) & (rng.random(m) < ENEMY_HIT_CHANCE)
+        enemy_damage = s['p_enemy_damage'] * np.where(has_status, status_enemy_damage[status_idx], 1.0)
+        s['player_hp'] -= np.where(hit, enemy_damage, 0).astype(np.float32)
+        s['invuln'] = np.where(hit, INVULN_DURATION, s['invuln'] - STEP_MS).astype(np.float32)
+
+        # Mana regeneration in whole points (ManaComponent.update)
+        regen = s['mana'] < PLAYER_BASE_MANA
+        s['mana_acc'] += np.where(regen, MANA_REGEN_RATE * STEP_MS / 1000, 0).astype(np.float32)
+        whole = np.floor(s['mana_acc'])
+        s['mana_acc'] -= whole
+        s['mana'] = np.minimum(s['mana'] + whole, PLAYER_BASE_MANA).astype(np.float32)
+
+        s['spell_cd'] -= STEP_MS
+        s['status_left'] -= STEP_MS
+
+        # Resolve finished fights (the enemy dying first counts as a win)
+        won = s['enemy_hp'] <= 0
+        lost = ~won & (s['player_hp'] <= 0)
+        done = won | lost
+        if done.any():
+            enemy_dead[s['row'][won]] = True
+            player_dead[s['row'][lost]] = True
+            finish(s, done, t + STEP_MS)
+            running -= int(done.sum())
+            if running == 0:
+                break
+            if running < COMPACT_BELOW * m:
+                keep = ~done & (s['row'] >= 0)
+                s = {key: value[keep] for key, value in s.items()}
+            else:
+                # Park finished rows so they never finish twice
+                s['enemy_hp'][done] = np.inf
+                s['player_hp'][done] = np.inf
+                s['row'][done] = -1
+
+    # Timed-out fights
+    if running > 0:
+        finish(s, s['row'] >= 0, TIME_LIMIT_MS)
+
+    return end_time, enemy_dead, player_dead, casts, starved
+
+
+def summarize(spells, enemies, pair_index, end_time, enemy_dead, player_dead, casts, starved):
+    """Per-pair distribution summaries."""
+    results = []
+    order = np.argsort(pair_index, kind='stable')
+    bounds = np.searchsorted(pair_index[order], np.arange(len(spells) * len(enemies) + 1))
+    for i, spell in enumerate(spells):
+        for j, enemy in enumerate(enemies):
+            k = i * len(enemies) + j
+            rows = order[bounds[k]:bounds[k + 1]]
+            wins = enemy_dead[rows]
+            ttk = end_time[rows][wins] / 1000.0
+            fraction = starved[rows] / np.maximum(end_time[rows], 1)
+            q = [round(float(v), 3) for v in np.percentile(ttk, [10, 50, 90])] if len(ttk) else [None] * 3
+            results.append({
+                "spell": spell['id'],
+                "enemy": enemy['id'],
+                "fights": int(len(rows)),
+                "winRate": float(wins.mean()),
+                "deathRate": float(player_dead[rows].mean()),
+                "timeoutRate": float((~wins & ~player_dead[rows]).mean()),
+                "ttk": {"p10": q[0], "p50": q[1], "p90": q[2],
+                        "mean": round(float(ttk.mean()), 3) if len(ttk) else None},
+                "casts": {"p50": float(np.median(casts[rows]))},
+                "manaStarvation": {
+                    "anyRate": float((starved[rows] > 0).mean()),
+                    "fractionP50": round(float(np.median(fraction)), 4),
+                    "fractionP90": round(float(np.percentile(fraction, 90)), 4),
+                },
+            })
+    return results
+
+
+def print_table(results):
+    def seconds(value, width):
+        return f"{value:>{width - 1}.2f}s" if value is not None else f"{'-':>{width}}"
+
+    print(f"{'spell':<16} {'enemy':<16} {'win':>6} {'death':>6} {'ttk p10':>8} {'p50':>6} {'p90':>6} "
+          f"{'casts':>6} {'starved':>8} {'starve p50':>10} {'p90':>6}")
+    for r in results:
+        ttk = r['ttk']
+        starve = r['manaStarvation']
+        print(f"{r['spell']:<16} {r['enemy']:<16} {r['winRate']:>6.1%} {r['deathRate']:>6.1%} "
+              f"{seconds(ttk['p10'], 8)} {seconds(ttk['p50'], 6)} {seconds(ttk['p90'], 6)} {r['casts']['p50']:>6.0f} "
+              f"{starve['anyRate']:>8.1%} {starve['fractionP50']:>10.1%} {starve['fractionP90']:>6.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo spell vs enemy duels")
+    parser.add_argument("--trials", type=int, default=20000, help="fights per spell/enemy pair")
+    parser.add_argument("--spells", nargs="*", help="spell ids (default: every damaging spell)")
+    parser.add_argument("--enemies", nargs="*", help="enemy ids (default: all enemies and bosses)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=str, help="also write the summary to this JSON file")
+    args = parser.parse_args()
+
+    spells, enemies = load_matrix(args.spells, args.enemies)
+    if not spells or not enemies:
+        print("No spells or enemies to simulate.")
+        sys.exit(1)
+
+    params = pair_params(spells, enemies)
+    pairs = len(spells) * len(enemies)
+    total = pairs * args.trials
+    print(f"Simulating {total:,} fights ({len(spells)} spells x {len(enemies)} enemies x {args.trials:,})...")
+
+    rng = np.random.default_rng(args.seed)
+    pair_index = np.repeat(np.arange(pairs), args.trials)
+    outputs = [np.empty(total, dtype=np.float32), np.empty(total, dtype=bool),
+               np.empty(total, dtype=bool), np.empty(total, dtype=np.int32), np.empty(total, dtype=np.float32)]
+
+    start_time = time.time()
+    for start in range(0, total, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, total)
+        for out, values in zip(outputs, simulate_chunk(params, pair_index[start:stop], rng)):
+            out[start:stop] = values
+    elapsed = time.time() - start_time
+
+    results = summarize(spells, enemies, pair_index, *outputs)
+    print_table(results)
+    print(f"Simulated {total:,} fights in {elapsed:.1f}s ({total / elapsed:,.0f} fights/s)")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({"trials": args.trials, "stepMs": STEP_MS, "timeLimitMs": TIME_LIMIT_MS,
+                       "pairs": results}, f, indent=2)
+        print(f"Saved summary to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+MusicGen Snapshot Tool
+======================
+
+One-time setup for fast startup of the generation scripts: downloads (or
+reads from the hub cache) a MusicGen checkpoint, applies the config fix and
+saves it as a local snapshot with safetensors weights and a manifest. The
+generation scripts load the snapshot memory-mapped with no network access
+(see model_snapshot.py).
+
+Requirements:
+    pip install torch transformers safetensors
+
+Usage:
+    python snapshot-model.py                       # facebook/musicgen-small, fp32
+    python snapshot-model.py --variant int8        # ~4x smaller on disk
+    python snapshot-model.py --verify              # re-hash and compare against the hub model
+    python snapshot-model.py --list
+
+Snapshots are written to ./cache/snapshots/<model>-<variant>/
+"""
+
+import argparse
+import sys
+import time
+
+# Check dependencies
+try:
+    import torch
+    from model_snapshot import (
+        FULL_PRECISION_PREFIXES, SNAPSHOT_DIR, VARIANTS, create_snapshot, file_sha256,
+        find_snapshot, load_from_hub, load_snapshot, read_manifest,
+    )
+except ImportError:
+    print("Missing dependencies. Install with:")
+    print("  pip install torch transformers safetensors")
+    sys.exit(1)
+
+DEFAULT_MODEL = "facebook/musicgen-small"
+
+
+def list_snapshots():
+    manifests = sorted(SNAPSHOT_DIR.glob("*/manifest.json")) if SNAPSHOT_DIR.exists() else []
+    if not manifests:
+        print(f"No snapshots in {SNAPSHOT_DIR}")
+        return
+    for path in manifests:
+        manifest = read_manifest(path.parent)
+        weights = manifest["weights"]
+        print(f"  {manifest['model']:<28} {manifest['variant']:<5} "
+              f"{weights['bytes'] / 1e6:8.1f} MB  transformers {manifest['transformers']}  {manifest['created']}")
+
+
+def verify_snapshot(model_name: str, variant: str) -> bool:
+    """Check the weight file hash, then compare every tensor with the hub model."""
+    path = find_snapshot(model_name, variant)
+    if path is None:
+        print(f"No {variant} snapshot for {model_name}")
+        return False
+
+    manifest = read_manifest(path)
+    weights = path / manifest["weights"]["file"]
+    if file_sha256(weights) != manifest["weights"]["sha256"]:
+        print(f"  FAIL: {weights.name} does not match the manifest hash")
+        return False
+    print(f"  Hash OK: {weights.name}")
+
+    _, snapshot = load_snapshot(path)
+    _, reference = load_from_hub(model_name)
+    expected = reference.state_dict()
+    worst_name, worst_error = None, 0.0
+    inexact = []
+    for name, tensor in snapshot.state_dict().items():
+        if not tensor.numel():
+            continue
+        reference_tensor = expected[name].float()
+        # The text encoder must match exactly (its outputs are cached across variants)
+        if name.startswith(FULL_PRECISION_PREFIXES):
+            if not torch.equal(tensor.float(), reference_tensor):
+                inexact.append(name)
+            continue
+        # Error relative to the tensor's largest magnitude
+        error = ((tensor.float() - reference_tensor).abs().max() / reference_tensor.abs().max().clamp(min=1e-12)).item()
+        if error > worst_error:
+            worst_name, worst_error = name, error
+    if inexact:
+        print(f"  FAIL: {len(inexact)} text encoder tensors differ from the hub model ({inexact[0]}, ...)")
+        return False
+
+    # Storage precision bounds the round trip error: fp16 rounds to 11 bits,
+    # int8 to half a step of max / 127 per row
+    tolerance = {"fp32": 0.0, "fp16": 1e-3, "int8": 0.5 / 127 + 1e-6}[variant]
+    ok = worst_error <= tolerance
+    print(f"  {'Weights OK' if ok else 'FAIL'}: max relative error {worst_error:.2e}"
+          + (f" ({worst_name})" if worst_name else ""))
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save a local MusicGen snapshot for fast startup")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help=f"hub model id (default {DEFAULT_MODEL})")
+    parser.add_argument("--variant", choices=VARIANTS, default="fp32", help="weight storage (default fp32)")
+    parser.add_argument("--verify", action="store_true", help="check an existing snapshot instead of writing one")
+    parser.add_argument("--list", action="store_true", help="list existing snapshots")
+    args = parser.parse_args()
+
+    if args.list:
+        list_snapshots()
+        return
+
+    if args.verify:
+        print(f"Verifying {args.variant} snapshot of {args.model}...")
+        sys.exit(0 if verify_snapshot(args.model, args.variant) else 1)
+
+    print(f"Snapshotting {args.model} ({args.variant})...")
+    start = time.perf_counter()
+    try:
+        path = create_snapshot(args.model, args.variant)
+    except Exception as e:
+        print(f"Error: {e}")
+        print("\nTry running: huggingface-cli login")
+        sys.exit(1)
+
+    manifest = read_manifest(path)
+    print(f"  {manifest['parameters'] / 1e6:.0f}M parameters, "
+          f"{manifest['weights']['bytes'] / 1e6:.1f} MB weights "
+          f"({len(manifest['quantized'])} int8 tensors, {len(manifest['aliases'])} tied)")
+    print(f"  Done in {time.perf_counter() - start:.1f}s")
+    print(f"Saved snapshot to: {path}")
+
+
+if __name__ == "__main__":
+    main()
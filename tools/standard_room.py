@@ -0,0 +1,67 @@
+"""
+Standard room geometry shared by the bake tools.
+GameScene.renderAllRooms does not draw room templates as authored: every
+dungeon room becomes an 11x9 grid built by createStandardRoom:
+
+- perimeter walls, with a door gap (tile 2) at the centre of each wall that
+  has a connection in the dungeon graph
+- the template interior (its perimeter dropped) copied in at
+  (floor((11 - w) / 2), floor((9 - h) / 2)), cropped to the inner 9x7
+
+Baked data indexed by tile (lightmaps, flow fields) has to use this grid,
+not the template's own size, or it will not line up with what is drawn.
+"""
+
+import numpy as np
+
+# Must match the standard size in GameScene.renderAllRooms
+STANDARD_WIDTH = 11
+STANDARD_HEIGHT = 9
+
+WALL = 1
+DOOR = 2
+
+DOOR_DIRECTIONS = ('north', 'east', 'south', 'west')
+
+
+def door_tile(direction, width=STANDARD_WIDTH, height=STANDARD_HEIGHT):
+    """(x, y) of the door gap createStandardRoom opens for a direction."""
+    center_x, center_y = width // 2, height // 2
+    return {
+        'north': (center_x, 0),
+        'east': (width - 1, center_y),
+        'south': (center_x, height - 1),
+        'west': (0, center_y),
+    }[direction]
+
+
+def template_offset(room, width=STANDARD_WIDTH, height=STANDARD_HEIGHT):
+    """(padX, padY): where template tile (x, y) lands in the standard grid."""
+    return (width - room['width']) // 2, (height - room['height']) // 2
+
+
+def standardize(room, doors=(), width=STANDARD_WIDTH, height=STANDARD_HEIGHT):
+    """
+    The (height, width) tile grid GameScene draws for a room template.
+
+    `doors` lists the directions with a connection; every other door
+    position stays a wall.
+    """
+    tiles = np.zeros((height, width), dtype=np.int64)
+    tiles[0, :] = tiles[-1, :] = WALL
+    tiles[:, 0] = tiles[:, -1] = WALL
+    for direction in doors:
+        x, y = door_tile(direction, width, height)
+        tiles[y, x] = DOOR
+
+    source = np.array(room['tiles'], dtype=np.int64)
+    pad_x, pad_y = template_offset(room, width, height)
+    for y in range(1, room['height'] - 1):
+        new_y = y + pad_y
+        if not 0 < new_y < height - 1:
+            continue
+        for x in range(1, room['width'] - 1):
+            new_x = x + pad_x
+            if 0 < new_x < width - 1:
+                tiles[new_y, new_x] = source[y, x]
+    return tiles
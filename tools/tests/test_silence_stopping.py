@@ -0,0 +1,93 @@
+"""
+Tests for SilenceStoppingCriteria with a stub EnCodec decoder.
+
+The stub decodes every frame to a constant level (code 0 = silence, code 1 =
+a loud tone), so a clip's loudness is scripted frame by frame and fed
+through `__call__` in MusicGen's delayed token layout.
+
+    python -m pytest tools/tests
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from silence_stopping import SilenceStoppingCriteria  # noqa: E402
+
+FRAME_RATE = 50
+SAMPLES_PER_FRAME = 4
+NUM_CODEBOOKS = 4
+
+
+class StubEncoder:
+    """Decodes (1, 1, K, frames) codes to SAMPLES_PER_FRAME samples per frame."""
+
+    def decode(self, codes, scales):
+        level = codes[0, 0, 0].float() * 0.5
+        audio = level.repeat_interleave(SAMPLES_PER_FRAME)
+        return SimpleNamespace(audio_values=audio[None, None])
+
+
+def stub_model():
+    return SimpleNamespace(
+        audio_encoder=StubEncoder(),
+        decoder=SimpleNamespace(num_codebooks=NUM_CODEBOOKS),
+        config=SimpleNamespace(audio_encoder=SimpleNamespace(
+            frame_rate=FRAME_RATE, sampling_rate=FRAME_RATE * SAMPLES_PER_FRAME)),
+    )
+
+
+def delayed_ids(loud):
+    """(K, 1 + frames + K) ids: frame f of codebook k in column f + 1 + k."""
+    frames = len(loud)
+    ids = torch.zeros((NUM_CODEBOOKS, 1 + frames + NUM_CODEBOOKS), dtype=torch.long)
+    for k in range(NUM_CODEBOOKS):
+        ids[k, 1 + k:1 + k + frames] = torch.as_tensor(loud, dtype=torch.long)
+    return ids
+
+
+def run(loud, max_new_tokens, **options):
+    """Step the criteria through a scripted clip; frame count at the stop or None."""
+    stopper = SilenceStoppingCriteria(stub_model(), max_new_tokens, **options)
+    ids = delayed_ids(loud)
+    for length in range(NUM_CODEBOOKS + 1, ids.shape[-1] + 1):
+        if stopper(ids[:, :length], None).all():
+            return length - NUM_CODEBOOKS, stopper
+    return None, stopper
+
+
+def clip(*parts):
+    """Concatenate (seconds, loud) parts into per-frame 0/1 codes."""
+    return np.concatenate([np.full(int(seconds * FRAME_RATE), int(loud)) for seconds, loud in parts])
+
+
+def test_quiet_lead_in_is_not_stopped():
+    loud = clip((0.4, False), (0.5, True), (1.0, False))
+    stopped, stopper = run(loud, len(loud), hold=0.2)
+    assert stopper.heard_sound
+    # Not during the lead-in: only after the sound plus the hold
+    assert stopped is not None
+    assert stopped >= int(0.9 * FRAME_RATE) + int(0.2 * FRAME_RATE)
+    assert stopped <= int(0.9 * FRAME_RATE) + int(0.2 * FRAME_RATE) + stopper.check_every
+
+
+def test_never_loud_clip_stops_at_cap():
+    loud = clip((2.0, False))
+    stopped, stopper = run(loud, len(loud), hold=0.2)
+    assert not stopper.heard_sound
+    assert stopped == stopper.min_frames
+    assert stopper.min_frames >= len(loud) // 2
+
+
+def test_loud_clip_runs_full_budget():
+    loud = clip((1.0, True))
+    stopped, stopper = run(loud, len(loud))
+    assert stopped is None
+    assert stopper.tokens_saved == 0
@@ -0,0 +1,121 @@
+"""
+Text Encoder Cache for MusicGen
+===============================
+
+MusicGen runs its T5 text encoder on the prompt at the start of every
+`model.generate` call. The prompts in the generation scripts rarely change,
+so this module encodes each unique prompt once and keeps the encoder hidden
+states, attention mask and token ids on disk as .npy files. Later runs
+memory-map them back instead of re-running the encoder.
+
+Cache layout:
+    tools/cache/text_encoder/<model>/<sha256(model + prompt)>.{hidden,mask,ids}.npy
+
+Usage:
+    from text_encoder_cache import TextEncoderCache
+
+    text_cache = TextEncoderCache(model, processor, model_name)
+    inputs = text_cache.generate_kwargs(prompt, device, guidance_scale=3.0)
+    audio_values = model.generate(**inputs, max_new_tokens=500, guidance_scale=3.0)
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import torch
+from transformers.modeling_outputs import BaseModelOutput
+
+# Cache directory
+CACHE_DIR = Path(__file__).parent / "cache" / "text_encoder"
+
+
+def prompt_key(model_name: str, prompt: str) -> str:
+    """Stable cache key for a (model, prompt) pair."""
+    return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+class TextEncoderCache:
+    """On-disk, memory-mapped cache of MusicGen text encoder outputs."""
+
+    def __init__(self, model, processor, model_name: str, cache_dir: Path = CACHE_DIR):
+        self.model = model
+        self.processor = processor
+        self.model_name = model_name
+        self.cache_dir = Path(cache_dir) / model_name.replace("/", "--")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, key: str):
+        return tuple(self.cache_dir / f"{key}.{part}.npy" for part in ("hidden", "mask", "ids"))
+
+    def encode(self, prompt: str):
+        """
+        Return (hidden_states, attention_mask, input_ids) for a prompt.
+
+        Arrays are memory-mapped from disk; the encoder only runs the first
+        time a prompt is seen for this model.
+        """
+        key = prompt_key(self.model_name, prompt)
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        hidden_path, mask_path, ids_path = self._paths(key)
+        if not (hidden_path.exists() and mask_path.exists() and ids_path.exists()):
+            self.misses += 1
+            inputs = self.processor(text=[prompt], padding=True, return_tensors="pt")
+            device = next(self.model.parameters()).device
+            with torch.no_grad():
+                hidden = self.model.get_text_encoder()(
+                    input_ids=inputs["input_ids"].to(device),
+                    attention_mask=inputs["attention_mask"].to(device),
+                ).last_hidden_state
+
+            # Write to temp names first so an interrupted run never leaves a
+            # half-written entry behind
+            for path, array in (
+                (hidden_path, hidden.float().cpu().numpy()),
+                (mask_path, inputs["attention_mask"].numpy()),
+                (ids_path, inputs["input_ids"].numpy()),
+            ):
+                tmp_path = path.with_suffix(".tmp.npy")
+                np.save(tmp_path, array)
+                tmp_path.replace(path)
+        else:
+            self.hits += 1
+
+        entry = tuple(np.load(path, mmap_mode="r") for path in (hidden_path, mask_path, ids_path))
+        self._entries[key] = entry
+        return entry
+
+    def generate_kwargs(self, prompt: str, device: str, guidance_scale: float = None) -> dict:
+        """
+        Build `model.generate` keyword arguments that skip the text encoder.
+
+        With classifier-free guidance MusicGen expects the conditional states
+        followed by an all-zero unconditional copy, which is what it would
+        normally build internally after encoding.
+        """
+        hidden, mask, ids = self.encode(prompt)
+        hidden = torch.from_numpy(np.array(hidden)).to(device)
+        attention_mask = torch.from_numpy(np.array(mask)).to(device)
+        input_ids = torch.from_numpy(np.array(ids)).to(device)
+
+        dtype = next(self.model.parameters()).dtype
+        hidden = hidden.to(dtype)
+
+        if guidance_scale is not None and guidance_scale > 1:
+            hidden = torch.cat([hidden, torch.zeros_like(hidden)], dim=0)
+            attention_mask = torch.cat([attention_mask, torch.zeros_like(attention_mask)], dim=0)
+
+        return {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "encoder_outputs": BaseModelOutput(last_hidden_state=hidden),
+        }
+
+    def summary(self) -> str:
+        return f"text encoder cache: {self.hits} hits, {self.misses} misses ({self.cache_dir})"
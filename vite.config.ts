@@ -1,7 +1,20 @@
 import { defineConfig } from 'vite';
+import { createHash } from 'crypto';
+import fs from 'fs';
 import path from 'path';
 
+// Content hash of the asset manifest (tools/build-asset-manifest.py). The
+// manifest is the one file the game fetches by a fixed URL, so the build
+// stamps this into its query string to keep stale copies out of the cache.
+const assetManifestPath = path.resolve(__dirname, './assets/data/asset-manifest.json');
+const assetManifestHash = fs.existsSync(assetManifestPath)
+  ? createHash('sha256').update(fs.readFileSync(assetManifestPath)).digest('hex').slice(0, 10)
+  : Date.now().toString(36);
+
 export default defineConfig({
+  define: {
+    __ASSET_MANIFEST_HASH__: JSON.stringify(assetManifestHash),
+  },
   resolve: {
     alias: {
       '@': path.resolve(__dirname, './src'),